@@ -2,13 +2,20 @@
 Article implementation
 """
 import enum
+import mmap
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Protocol, Sequence
+from typing import Iterator, Optional, Protocol, Sequence
 
 from core_utils.constants import ASSETS_PATH
 
+# a whitespace after the end of a sentence followed by a capital letter,
+# the cheapest checks go first so that most positions are rejected at once
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.?!"])\s(?=[А-Я])(?<!\w\.\w.\s)(?<![А-Я][а-я]\.\s)'
+                               r'(?<![^?!]"\s)(?<!^"\s)')
+LINE_BREAKS = re.compile(r'[\n|\t]+')
+
 
 def date_from_meta(date_txt: str) -> datetime:
     """
@@ -24,15 +31,45 @@ def get_article_id_from_filepath(path: Path) -> int:
     return int(path.stem.split('_')[0])
 
 
+def read_text(path: Path, use_mmap: bool = False) -> str:
+    """
+    Reads a text file, decoding it straight from a memory map if asked
+    """
+    if not use_mmap:
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read()
+    with open(path, 'rb') as file:
+        if not path.stat().st_size:
+            return ''
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            text = str(mapped_file, 'utf-8')
+    return text.replace('\r\n', '\n').replace('\r', '\n') if '\r' in text else text
+
+
 def split_by_sentence(text: str) -> list[str]:
     """
     Splits the given text by sentence separators
     """
-    pattern = r"(?<!\w\.\w.)(?<![А-Я][а-я]\.)((?<=\.|\?|!)|(?<=\?\"|!\"))\s(?=[А-Я])"
-    text = re.sub(r'[\n|\t]+', '. ', text)
-    sentences = [sentence for sentence in re.split(pattern, text) if sentence.replace(' ', '')
-                 and len(sentence) > 10]
-    return sentences
+    text = LINE_BREAKS.sub('. ', text)
+    return [sentence for sentence in SENTENCE_BOUNDARY.split(text)
+            if len(sentence) > 10 and sentence.strip(' ')]
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """
+    Yields sentences of split_by_sentence() one by one, so that a long text
+    can be processed while it is being split
+    """
+    text = LINE_BREAKS.sub('. ', text)
+    start = 0
+    for boundary in SENTENCE_BOUNDARY.finditer(text):
+        sentence = text[start:boundary.start()]
+        if len(sentence) > 10 and sentence.strip(' '):
+            yield sentence
+        start = boundary.end()
+    sentence = text[start:]
+    if len(sentence) > 10 and sentence.strip(' '):
+        yield sentence
 
 
 # pylint: disable=too-few-public-methods
@@ -75,6 +112,7 @@ class Article:
     """
 
     date: Optional[datetime]
+    _text: Optional[str]
     _conllu_sentences: Sequence[SentenceProtocol]
 
     def __init__(self, url: Optional[str], article_id: int) -> None:
@@ -85,10 +123,42 @@ class Article:
         self.date = None
         self.author = []
         self.topics = []
-        self.text = ''
+        self._text = ''
+        self._text_path: Optional[Path] = None
+        self._use_mmap = False
         self.pos_frequencies = {}
         self._conllu_sentences = []
 
+    @property
+    def text(self) -> str:
+        """
+        Raw text, read from the file on first access if the article is lazy
+        """
+        if self._text is None:
+            self._text = read_text(self._text_path, self._use_mmap)  # type: ignore[arg-type]
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        self._text = text
+        self._text_path = None
+
+    def set_text_source(self, path: Path, use_mmap: bool = False) -> None:
+        """
+        Makes the article read its raw text from the file only when it is needed
+        """
+        self._text = None
+        self._text_path = path
+        self._use_mmap = use_mmap
+
+    def release_text(self) -> None:
+        """
+        Frees memory taken by the raw text of a lazy article,
+        it is read again on the next access
+        """
+        if self._text_path is not None:
+            self._text = None
+
     def set_pos_info(self, pos_freq: dict) -> None:
         """
         Sets POS frequencies attribute
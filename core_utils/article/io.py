@@ -2,37 +2,86 @@
 I/O operations for Article
 """
 import json
+import os
+import queue
+import threading
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Optional, Union
 
 from core_utils.article.article import (Article, ArtifactType, date_from_meta,
-                                        get_article_id_from_filepath)
+                                        get_article_id_from_filepath,
+                                        read_text)
+
+
+def _get_temporary_path(path: Path) -> Path:
+    """
+    Returns a hidden path next to the file, so that an unfinished write
+    is never taken for an artifact
+    """
+    return path.with_name(f'.{path.name}.tmp')
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    """
+    Writes the file so that it is either absent or complete, even after a crash:
+    the data is synced to disk before the rename, and the rename before returning
+    """
+    temporary_path = _get_temporary_path(path)
+    with open(temporary_path, 'w', encoding='utf-8') as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+    _sync_directories({path.parent})
+
+
+def _sync_directories(paths: set[Path]) -> None:
+    """
+    Persists renames of files in the given directories where the platform allows it
+    """
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    for path in paths:
+        descriptor = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+def _dump_meta(article: Article) -> str:
+    """
+    Serializes meta information of the article
+    """
+    return json.dumps(article.get_meta(),
+                      indent=4,
+                      ensure_ascii=False,
+                      separators=(',', ': '))
 
 
 def to_raw(article: Article) -> None:
     """
     Saves raw text
     """
-    with open(article.get_raw_text_path(), 'w', encoding='utf-8') as file:
-        file.write(article.text)
+    _write_atomically(article.get_raw_text_path(), article.text)
 
 
 def from_raw(path: Union[Path, str],
-             article: Optional[Article] = None) -> Article:
+             article: Optional[Article] = None,
+             lazy: bool = False,
+             use_mmap: bool = False) -> Article:
     """
-    Loads raw text and creates an Article with it
+    Loads raw text and creates an Article with it,
+    a lazy article reads the text only when it is accessed
     """
 
     article_id = get_article_id_from_filepath(Path(path))
-
-    with open(file=path,
-              mode='r',
-              encoding='utf-8') as article_file:
-        text = article_file.read()
-
     article = article if article else Article(url=None,
                                               article_id=article_id)
-    article.text = text
+    if lazy:
+        article.set_text_source(Path(path), use_mmap)
+    else:
+        article.text = read_text(Path(path), use_mmap)
     return article
 
 
@@ -40,20 +89,14 @@ def to_cleaned(article: Article) -> None:
     """
     Saves cleaned text
     """
-    with open(article.get_file_path(ArtifactType.CLEANED), 'w', encoding='utf-8') as file:
-        file.write(article.get_cleaned_text())
+    _write_atomically(article.get_file_path(ArtifactType.CLEANED), article.get_cleaned_text())
 
 
 def to_meta(article: Article) -> None:
     """
     Saves metafile
     """
-    with open(article.get_meta_file_path(), 'w', encoding='utf-8') as meta_file:
-        json.dump(article.get_meta(),
-                  meta_file,
-                  indent=4,
-                  ensure_ascii=False,
-                  separators=(',', ': '))
+    _write_atomically(article.get_meta_file_path(), _dump_meta(article))
 
 
 def from_meta(path: Union[Path, str],
@@ -63,7 +106,13 @@ def from_meta(path: Union[Path, str],
     """
     with open(path, encoding='utf-8') as meta_file:
         meta = json.load(meta_file)
+    return _fill_meta(meta, article)
+
 
+def _fill_meta(meta: dict, article: Optional[Article] = None) -> Article:
+    """
+    Fills the Article abstraction with loaded meta information
+    """
     article = article if article else \
         Article(url=meta.get('url', None), article_id=meta.get('id', 0))
 
@@ -86,13 +135,168 @@ def to_conllu(article: Article,
     """
     Saves conllu information from the Article into the .conllu file
     """
+    _write_atomically(article.get_file_path(_get_conllu_type(include_morphological_tags,
+                                                             include_pymorphy_tags)),
+                      article.get_conllu_text(include_morphological_tags))
+
+
+def _get_conllu_type(include_morphological_tags: bool, include_pymorphy_tags: bool) -> ArtifactType:
+    """
+    Chooses the kind of conllu artifact by the tags it includes
+    """
     article_type = ArtifactType.POS_CONLLU
     if include_morphological_tags:
         article_type = ArtifactType.MORPHOLOGICAL_CONLLU
     if include_pymorphy_tags:
         article_type = ArtifactType.FULL_CONLLU
+    return article_type
+
+
+class ArticleWriter:
+    """
+    Saves raw texts and meta information of articles in batches:
+    files are written under temporary names, synced to disk together
+    and only then renamed, optionally on a background thread
+    """
+
+    def __init__(self,
+                 batch_size: int = 64,
+                 background: bool = False,
+                 sync: bool = True,
+                 path: Optional[Path] = None) -> None:
+        """
+        Initializes an instance of the ArticleWriter class,
+        files are saved to path if it is given and next to other artifacts otherwise
+        """
+        self._path = path
+        self._batch_size = batch_size
+        self._sync = sync
+        self._pending: list[tuple[IO[str], Path]] = []
+        self._error: Optional[BaseException] = None
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=batch_size * 4)
+            self._thread = threading.Thread(target=self._run, args=(self._queue,), daemon=True)
+            self._thread.start()
+
+    def write(self, article: Article) -> None:
+        """
+        Schedules saving of raw text and meta information of the article
+        """
+        self._put((self._get_path(article.get_raw_text_path()), article.text))
+        self._put((self._get_path(article.get_meta_file_path()), _dump_meta(article)))
+
+    def _get_path(self, path: Path) -> Path:
+        """
+        Moves the file to the folder of the writer if it has one
+        """
+        return path if self._path is None else self._path / path.name
+
+    def flush(self) -> None:
+        """
+        Waits until all scheduled files are saved
+        """
+        if self._queue is None:
+            self._commit()
+        else:
+            self._put(None)
+            self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Saves all scheduled files and stops the background thread,
+        temporary files that could not be saved are removed
+        """
+        try:
+            self.flush()
+        finally:
+            if self._queue is not None and self._thread is not None:
+                self._queue.put(False)
+                self._thread.join()
+                self._queue = None
+            self._discard()
+
+    def __enter__(self) -> 'ArticleWriter':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _put(self, item: Optional[tuple[Path, str]]) -> None:
+        """
+        Passes the file to the background thread or writes it right away
+        """
+        self._raise_error()
+        if self._queue is None:
+            if item is not None:
+                self._add(*item)
+        else:
+            self._queue.put(item)
+
+    def _run(self, files: queue.Queue) -> None:
+        """
+        Writes files received from the queue: None commits the batch,
+        False stops the thread
+        """
+        while (item := files.get()) is not False:
+            try:
+                if self._error is None:
+                    if item is None:
+                        self._commit()
+                    else:
+                        self._add(*item)
+            except Exception as error:  # pylint: disable=broad-except
+                self._error = error
+                self._discard()
+            finally:
+                files.task_done()
+        files.task_done()
+
+    def _raise_error(self) -> None:
+        """
+        Reports a failure of the background thread to the caller
+        """
+        if self._error is not None:
+            raise self._error
+
+    def _add(self, path: Path, content: str) -> None:
+        """
+        Writes the file under a temporary name, committing the batch when it is full
+        """
+        file = open(_get_temporary_path(path), 'w', encoding='utf-8')  # pylint: disable=consider-using-with
+        self._pending.append((file, path))
+        file.write(content)
+        if len(self._pending) >= self._batch_size:
+            self._commit()
+
+    def _commit(self) -> None:
+        """
+        Syncs the batch to disk and moves files to their names,
+        temporary files of a batch that fails are removed
+        """
+        pending, self._pending = self._pending, []
+        try:
+            for file, _ in pending:
+                file.flush()
+                if self._sync:
+                    os.fsync(file.fileno())
+                file.close()
+            for file, path in pending:
+                os.replace(file.name, path)
+        except BaseException:
+            self._pending = pending
+            self._discard()
+            raise
+        if self._sync and pending:
+            _sync_directories({path.parent for _, path in pending})
 
-    with open(file=article.get_file_path(article_type),
-              mode='w',
-              encoding='utf-8') as conllu_file:
-        conllu_file.write(article.get_conllu_text(include_morphological_tags))
+    def _discard(self) -> None:
+        """
+        Closes and removes temporary files of the batch that was not committed
+        """
+        pending, self._pending = self._pending, []
+        for file, _ in pending:
+            file.close()
+            Path(file.name).unlink(missing_ok=True)
@@ -0,0 +1,211 @@
+"""
+Packed corpus: all artifacts of all articles in a single append-only file
+"""
+import json
+import os
+import re
+import struct
+import threading
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Union
+
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.io import (_dump_meta, _fill_meta, _get_conllu_type,
+                                   _write_atomically)
+
+RAW = 'raw'
+META = 'meta'
+KINDS = (RAW, META) + tuple(kind.value for kind in ArtifactType)
+
+ARTIFACT_EXTENSIONS = {
+    RAW: 'txt',
+    META: 'json',
+    ArtifactType.CLEANED.value: 'txt',
+    ArtifactType.MORPHOLOGICAL_CONLLU.value: 'conllu',
+    ArtifactType.POS_CONLLU.value: 'conllu',
+    ArtifactType.FULL_CONLLU.value: 'conllu'
+}
+ARTIFACT_FILE_PATTERN = re.compile(r'(\d+)_(\w+)\.(\w+)')
+
+# article id, kind, offset and length of the artifact in the data file
+INDEX_RECORD = struct.Struct('<QBQQ')
+
+
+class PackedCorpus:
+    """
+    Stores artifacts one after another in a data file and remembers
+    where each of them is in an index file; saving an artifact again
+    appends it and the latest copy wins
+    """
+
+    def __init__(self, path: Union[Path, str]) -> None:
+        """
+        Initializes an instance of the PackedCorpus class, opening or creating
+        the data file and the index file next to it
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(f'{self.path.name}.idx')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._data: BinaryIO = open(self.path, 'a+b')  # pylint: disable=consider-using-with
+        self._index: BinaryIO = open(self.index_path, 'a+b')  # pylint: disable=consider-using-with
+        self._offsets: dict[tuple[int, str], tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """
+        Reads the index, skipping records a crash left unfinished
+        """
+        data_size = os.fstat(self._data.fileno()).st_size
+        self._index.seek(0)
+        content = self._index.read()
+        complete_size = len(content) - len(content) % INDEX_RECORD.size
+        for article_id, kind, offset, length in INDEX_RECORD.iter_unpack(content[:complete_size]):
+            if offset + length <= data_size:
+                self._offsets[(article_id, KINDS[kind])] = (offset, length)
+        if complete_size != len(content):
+            self._index.truncate(complete_size)
+
+    def __contains__(self, key: tuple[int, str]) -> bool:
+        return key in self._offsets
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        return iter(sorted(self._offsets))
+
+    def __enter__(self) -> 'PackedCorpus':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def get_article_ids(self) -> list[int]:
+        """
+        Returns ids of articles with a raw text
+        """
+        return sorted(article_id for article_id, kind in self._offsets if kind == RAW)
+
+    def write(self, article_id: int, kind: str, content: str) -> None:
+        """
+        Appends an artifact of the article
+        """
+        body = content.encode('utf-8')
+        with self._lock:
+            self._data.seek(0, os.SEEK_END)
+            offset = self._data.tell()
+            self._data.write(body)
+            self._data.flush()
+            self._index.write(INDEX_RECORD.pack(article_id, KINDS.index(kind), offset, len(body)))
+            self._offsets[(article_id, kind)] = (offset, len(body))
+
+    def read(self, article_id: int, kind: str) -> str:
+        """
+        Reads an artifact of the article
+        """
+        offset, length = self._offsets[(article_id, kind)]
+        with self._lock:
+            self._data.seek(offset)
+            return self._data.read(length).decode('utf-8')
+
+    def flush(self, sync: bool = True) -> None:
+        """
+        Saves appended artifacts, the index only after the data it points to
+        """
+        with self._lock:
+            self._data.flush()
+            if sync:
+                os.fsync(self._data.fileno())
+            self._index.flush()
+            if sync:
+                os.fsync(self._index.fileno())
+
+    def close(self) -> None:
+        """
+        Saves appended artifacts and closes the files
+        """
+        if self._data.closed:
+            return
+        self.flush()
+        self._data.close()
+        self._index.close()
+
+    def to_raw(self, article: Article) -> None:
+        """
+        Saves raw text
+        """
+        self.write(article.article_id, RAW, article.text)
+
+    def from_raw(self, article_id: int, article: Optional[Article] = None) -> Article:
+        """
+        Loads raw text and creates an Article with it
+        """
+        article = article if article else Article(url=None, article_id=article_id)
+        article.text = self.read(article_id, RAW)
+        return article
+
+    def to_cleaned(self, article: Article) -> None:
+        """
+        Saves cleaned text
+        """
+        self.write(article.article_id, ArtifactType.CLEANED.value, article.get_cleaned_text())
+
+    def to_meta(self, article: Article) -> None:
+        """
+        Saves meta information
+        """
+        self.write(article.article_id, META, _dump_meta(article))
+
+    def from_meta(self, article_id: int, article: Optional[Article] = None) -> Article:
+        """
+        Loads meta information into the Article abstraction
+        """
+        return _fill_meta(json.loads(self.read(article_id, META)), article)
+
+    def to_conllu(self,
+                  article: Article,
+                  include_morphological_tags: bool = False,
+                  include_pymorphy_tags: bool = False) -> None:
+        """
+        Saves conllu information from the Article
+        """
+        kind = _get_conllu_type(include_morphological_tags, include_pymorphy_tags)
+        self.write(article.article_id, kind.value,
+                   article.get_conllu_text(include_morphological_tags))
+
+
+def parse_artifact_name(name: str) -> Optional[tuple[int, str]]:
+    """
+    Returns the article id and the kind of an artifact by the name of its file,
+    None if it is not named as an artifact with the extension of its kind
+    """
+    match = ARTIFACT_FILE_PATTERN.fullmatch(name)
+    if not match or ARTIFACT_EXTENSIONS.get(match[2]) != match[3]:
+        return None
+    return int(match[1]), match[2]
+
+
+def pack_dataset(path_to_dataset: Path, corpus: PackedCorpus) -> None:
+    """
+    Copies artifacts saved as separate files into the packed corpus
+    """
+    for path in sorted(path_to_dataset.iterdir()):
+        artifact = parse_artifact_name(path.name)
+        if artifact is None or not path.is_file():
+            continue
+        corpus.write(*artifact, path.read_text(encoding='utf-8'))
+    corpus.flush()
+
+
+def unpack_dataset(corpus: PackedCorpus, path_to_dataset: Path) -> None:
+    """
+    Saves every artifact of the packed corpus as a separate file
+    """
+    path_to_dataset.mkdir(parents=True, exist_ok=True)
+    for article_id, kind in corpus:
+        article = Article(url=None, article_id=article_id)
+        if kind == RAW:
+            path = path_to_dataset / article.get_raw_text_path().name
+        elif kind == META:
+            path = path_to_dataset / article.get_meta_file_path().name
+        else:
+            path = path_to_dataset / article.get_file_path(ArtifactType(kind)).name
+        _write_atomically(path, corpus.read(article_id, kind))
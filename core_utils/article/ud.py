@@ -4,7 +4,7 @@ Parsers for CONLL-U
 import json
 import re
 from pathlib import Path
-from typing import Protocol, Union
+from typing import Any, Callable, Protocol, Sequence, Union
 
 
 class OpencorporaTagProtocol(Protocol):
@@ -86,12 +86,14 @@ class TagConverter:
     """
     _tag_mapping: dict[str, dict[str, str]]
 
-    def __init__(self, tag_mapping_path: Path):
+    def __init__(self, tag_mapping_path: Path, compiled: bool = True):
         """
-        Initializes Converter
+        Initializes Converter, a compiled one converts each distinct raw tags only once
         """
         with open(tag_mapping_path, 'r', encoding='utf-8') as mapping_file:
             self._tag_mapping = json.load(mapping_file)
+        self._compiled = compiled
+        self._memo: dict[str, tuple[str, str]] = {}
 
         self.pos = 'POS'
         self.case = 'Case'
@@ -112,3 +114,31 @@ class TagConverter:
         Extracts and converts POS from the tags into the UD format
         """
         raise NotImplementedError
+
+    def get_memo_table(self) -> dict[str, tuple[str, str]]:
+        """
+        Returns POS and features converted so far, keyed by raw tags,
+        to be saved and reused by another run
+        """
+        return self._memo
+
+    def update_memo_table(self, memo_table: dict[str, Sequence[str]]) -> None:
+        """
+        Adds conversions made by another run, for example loaded from JSON
+        """
+        self._memo.update({tags: (pos, features) for tags, (pos, features) in memo_table.items()})
+
+    def _convert_memoized(self,
+                          key: str,
+                          tags: Union[str, OpencorporaTagProtocol],
+                          convert: Callable[[Any], tuple[str, str]]) -> tuple[str, str]:
+        """
+        Returns POS and features of the tags, a compiled converter
+        makes a single dictionary lookup for tags it has already seen
+        """
+        if not self._compiled:
+            return convert(tags)
+        conversion = self._memo.get(key)
+        if conversion is None:
+            conversion = self._memo[key] = convert(tags)
+        return conversion
@@ -1,4 +1,5 @@
 # pylint: disable=too-few-public-methods, disable=too-many-arguments
+# pylint: disable=too-many-instance-attributes, disable=too-many-locals
 """
 ConfigDTO class implementation: stores the configuration information
 """
@@ -16,6 +17,21 @@ class ConfigDTO:
     timeout: int
     should_verify_certificate: bool
     headless_mode: bool
+    max_workers: int
+    max_workers_per_host: int
+    parse_workers: int
+    pool_size: int
+    max_retries: int
+    retry_backoff: float
+    cache_mode: str
+    cache_max_age: int
+    cache_max_size: int
+    incremental: bool
+    preserve_paragraphs: bool
+    rate_limit: float
+    rate_burst: int
+    respect_crawl_delay: bool
+    recursive_crawl: bool
 
     def __init__(self,
                  seed_urls: list[str],
@@ -24,7 +40,22 @@ class ConfigDTO:
                  encoding: str,
                  timeout: int,
                  should_verify_certificate: bool,
-                 headless_mode: bool
+                 headless_mode: bool,
+                 max_workers: int = 1,
+                 max_workers_per_host: int = 1,
+                 parse_workers: int = 1,
+                 pool_size: int = 10,
+                 max_retries: int = 3,
+                 retry_backoff: float = 0.5,
+                 cache_mode: str = 'off',
+                 cache_max_age: int = 604800,
+                 cache_max_size: int = 512 * 1024 * 1024,
+                 incremental: bool = False,
+                 preserve_paragraphs: bool = False,
+                 rate_limit: float = 0,
+                 rate_burst: int = 1,
+                 respect_crawl_delay: bool = False,
+                 recursive_crawl: bool = False
                  ):
         """
         Initializes an instance of the ConfigDTO class
@@ -37,3 +68,18 @@ class ConfigDTO:
         self.timeout = timeout
         self.should_verify_certificate = should_verify_certificate
         self.headless_mode = headless_mode
+        self.max_workers = max_workers
+        self.max_workers_per_host = max_workers_per_host
+        self.parse_workers = parse_workers
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.cache_mode = cache_mode
+        self.cache_max_age = cache_max_age
+        self.cache_max_size = cache_max_size
+        self.incremental = incremental
+        self.preserve_paragraphs = preserve_paragraphs
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.respect_crawl_delay = respect_crawl_delay
+        self.recursive_crawl = recursive_crawl
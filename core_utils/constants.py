@@ -7,7 +7,24 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 ASSETS_PATH = PROJECT_ROOT / 'tmp' / 'articles'
 CRAWLER_CONFIG_PATH = PROJECT_ROOT / 'lab_5_scrapper' / 'scrapper_config.json'
+HTTP_CACHE_PATH = PROJECT_ROOT / 'tmp' / 'http_cache'
+ANALYSIS_CACHE_PATH = PROJECT_ROOT / 'tmp' / 'analysis_cache.json'
+CRAWL_INDEX_FILE_NAME = '.crawl_index.json'
+CRAWL_CHECKPOINT_FILE_NAME = '.crawl_checkpoint.json'
+DATASET_MANIFEST_FILE_NAME = '.manifest.json'
+PIPELINE_STATE_FILE_NAME = '.pipeline_state.json'
 
 NUM_ARTICLES_UPPER_LIMIT = 150
 TIMEOUT_LOWER_LIMIT = 0
 TIMEOUT_UPPER_LIMIT = 60
+WORKERS_UPPER_LIMIT = 32
+PARSE_QUEUE_SIZE = 16
+ASYNC_CONNECTIONS_LIMIT = 256
+RETRIES_UPPER_LIMIT = 10
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+CACHE_MODES = ('off', 'revalidate', 'offline')
+CRAWL_DEPTH_LIMIT = 3
+CRAWL_PAGES_PER_DEPTH_LIMIT = 50
+CRAWL_REQUEST_BUDGET = 500
+CRAWL_CHECKPOINT_INTERVAL = 10
+ANALYSIS_CACHE_SIZE = 100_000
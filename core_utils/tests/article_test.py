@@ -14,11 +14,12 @@ from config.test_params import (CORE_UTILS_TEST_FILES_FOLDER, PROJECT_ROOT,
 from core_utils.article import article
 from core_utils.article.article import (Article, ArtifactType, date_from_meta,
                                         get_article_id_from_filepath,
-                                        split_by_sentence)
-from core_utils.article.io import (from_meta, from_raw, to_cleaned, to_conllu,
-                                   to_meta, to_raw)
+                                        read_text, split_by_sentence)
+from core_utils.article.io import (ArticleWriter, from_meta, from_raw,
+                                   to_cleaned, to_conllu, to_meta, to_raw)
 from core_utils.article.ud import (TagConverter,
                                    extract_sentences_from_raw_conllu)
+from core_utils.constants import ASSETS_PATH
 from core_utils.tests.utils import universal_setup
 
 
@@ -387,3 +388,142 @@ class UDTest(unittest.TestCase):
         pos_tag = "S"
         with self.assertRaises(NotImplementedError):
             self.converter.convert_pos(pos_tag)
+
+
+# pylint: disable=protected-access
+class LazyArticleTest(unittest.TestCase):
+    """
+    Class for testing articles reading raw texts on demand
+    """
+
+    def setUp(self) -> None:
+        article.ASSETS_PATH = TEST_PATH
+        universal_setup()
+        self.path = TEST_PATH / '1_raw.txt'
+
+    @pytest.mark.core_utils
+    def test_lazy_article_reads_text_on_access(self):
+        """
+        Ensure a lazy article gets the same text as an eager one only when asked
+        """
+        expected = from_raw(self.path).text
+        for use_mmap in (False, True):
+            lazy_article = from_raw(self.path, lazy=True, use_mmap=use_mmap)
+            self.assertIsNone(lazy_article._text)
+            self.assertEqual(lazy_article.text, expected)
+            self.assertEqual(from_raw(self.path, use_mmap=use_mmap).text, expected)
+
+    @pytest.mark.core_utils
+    def test_released_text_is_read_again(self):
+        """
+        Ensure releasing frees the text of a lazy article only
+        """
+        lazy_article = from_raw(self.path, lazy=True)
+        expected = lazy_article.text
+        lazy_article.release_text()
+        self.assertIsNone(lazy_article._text)
+        self.assertEqual(lazy_article.get_raw_text(), expected)
+
+        lazy_article.text = 'Новый текст'
+        lazy_article.release_text()
+        self.assertEqual(lazy_article.text, 'Новый текст')
+
+    @pytest.mark.core_utils
+    def test_mmap_matches_text_mode(self):
+        """
+        Ensure memory-mapped reading handles empty files and Windows line endings
+        """
+        self.path.write_bytes('Первая строка\r\nВторая строка\r\n'.encode('utf-8'))
+        self.assertEqual(read_text(self.path, use_mmap=True), read_text(self.path))
+        self.path.write_bytes(b'')
+        self.assertEqual(read_text(self.path, use_mmap=True), '')
+
+    def tearDown(self) -> None:
+        article.ASSETS_PATH = ASSETS_PATH
+        shutil.rmtree(TEST_PATH)
+
+
+class ArticleWriterTest(unittest.TestCase):
+    """
+    Class for testing batched saving of articles
+    """
+
+    def setUp(self) -> None:
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+        self.articles = []
+        for idx in range(1, 8):
+            item = Article(url=f'https://test.ru/news/{idx}', article_id=idx)
+            item.title = f'Новость {idx}'
+            item.text = f'Текст новости номер {idx}.' * idx
+            item.date = datetime.datetime(2023, 3, idx, 12, 0)
+            self.articles.append(item)
+
+    def _read_dataset(self) -> dict[str, bytes]:
+        return {path.name: path.read_bytes() for path in TEST_PATH.iterdir()}
+
+    @pytest.mark.core_utils
+    def test_writer_matches_io_functions(self):
+        """
+        Ensure ArticleWriter saves the same files as to_raw() and to_meta()
+        """
+        for item in self.articles:
+            to_raw(item)
+            to_meta(item)
+        expected = self._read_dataset()
+        self.assertEqual(len(expected), 2 * len(self.articles))
+
+        for background in (False, True):
+            shutil.rmtree(TEST_PATH)
+            TEST_PATH.mkdir()
+            with ArticleWriter(batch_size=3, background=background) as writer:
+                for item in self.articles:
+                    writer.write(item)
+            self.assertEqual(self._read_dataset(), expected)
+
+    @pytest.mark.core_utils
+    def test_writer_saves_files_by_batches(self):
+        """
+        Ensure files appear under their names only when their batch is committed
+        """
+        writer = ArticleWriter(batch_size=4)
+        writer.write(self.articles[0])
+        self.assertFalse(self.articles[0].get_raw_text_path().exists())
+        writer.write(self.articles[1])
+        self.assertTrue(self.articles[1].get_meta_file_path().exists())
+        writer.write(self.articles[2])
+        writer.flush()
+        self.assertTrue(self.articles[2].get_raw_text_path().exists())
+        writer.close()
+        self.assertEqual(len(list(TEST_PATH.iterdir())), 6)
+
+    @pytest.mark.core_utils
+    def test_background_writer_reports_errors(self):
+        """
+        Ensure a failure of the background thread is raised to the caller
+        """
+        article.ASSETS_PATH = TEST_PATH / 'missing'
+        writer = ArticleWriter(batch_size=2, background=True)
+        writer.write(self.articles[0])
+        with self.assertRaises(FileNotFoundError):
+            writer.close()
+
+    @pytest.mark.core_utils
+    def test_failed_batch_leaves_no_temporary_files(self):
+        """
+        Ensure temporary files of a batch that cannot be committed are removed
+        """
+        for background in (False, True):
+            self.articles[0].get_raw_text_path().mkdir()
+            with self.assertRaises(OSError):
+                with ArticleWriter(batch_size=4, background=background) as writer:
+                    writer.write(self.articles[0])
+                    writer.write(self.articles[1])
+                    writer.write(self.articles[2])
+            self.assertFalse([path for path in TEST_PATH.iterdir() if path.suffix == '.tmp'])
+            shutil.rmtree(TEST_PATH)
+            TEST_PATH.mkdir()
+
+    def tearDown(self) -> None:
+        article.ASSETS_PATH = ASSETS_PATH
+        shutil.rmtree(TEST_PATH)
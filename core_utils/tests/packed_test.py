@@ -0,0 +1,102 @@
+"""
+Tests for the packed corpus
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import CORE_UTILS_TEST_FILES_FOLDER, TEST_PATH
+from core_utils.article.io import from_meta, from_raw
+from core_utils.article.packed import (INDEX_RECORD, META, RAW, PackedCorpus,
+                                       pack_dataset, unpack_dataset)
+
+
+class PackedCorpusTest(unittest.TestCase):
+    """
+    Class for testing reading and writing of the packed corpus
+    """
+
+    def setUp(self) -> None:
+        TEST_PATH.mkdir(exist_ok=True)
+        self.path = TEST_PATH / 'corpus.pack'
+        self.article = from_meta(CORE_UTILS_TEST_FILES_FOLDER / '1_meta.json',
+                                 from_raw(CORE_UTILS_TEST_FILES_FOLDER / '1_raw.txt'))
+
+    @pytest.mark.core_utils
+    def test_articles_survive_reopening(self):
+        """
+        Ensure raw texts and meta information are read back after reopening
+        """
+        with PackedCorpus(self.path) as corpus:
+            for article_id in (1, 2):
+                self.article.article_id = article_id
+                corpus.to_raw(self.article)
+                corpus.to_meta(self.article)
+
+        with PackedCorpus(self.path) as corpus:
+            self.assertEqual(corpus.get_article_ids(), [1, 2])
+            loaded = corpus.from_meta(2, corpus.from_raw(2))
+        self.assertEqual(loaded.get_raw_text(), self.article.get_raw_text())
+        self.assertEqual(loaded.get_meta(), self.article.get_meta())
+
+    @pytest.mark.core_utils
+    def test_latest_copy_wins(self):
+        """
+        Ensure saving an artifact again replaces it for readers
+        """
+        with PackedCorpus(self.path) as corpus:
+            corpus.write(1, RAW, 'Первая версия')
+            corpus.write(1, RAW, 'Вторая версия')
+            self.assertEqual(corpus.read(1, RAW), 'Вторая версия')
+        with PackedCorpus(self.path) as corpus:
+            self.assertEqual(corpus.read(1, RAW), 'Вторая версия')
+            self.assertNotIn((1, META), corpus)
+
+    @pytest.mark.core_utils
+    def test_unfinished_records_are_skipped(self):
+        """
+        Ensure records left by a crash do not break the corpus
+        """
+        with PackedCorpus(self.path) as corpus:
+            corpus.write(1, RAW, 'Целая статья')
+        with open(self.path.with_name('corpus.pack.idx'), 'ab') as index_file:
+            index_file.write(INDEX_RECORD.pack(2, 0, 1000, 10))
+            index_file.write(b'\x01\x02')
+        with PackedCorpus(self.path) as corpus:
+            self.assertEqual(corpus.get_article_ids(), [1])
+            corpus.write(3, RAW, 'Новая статья')
+        with PackedCorpus(self.path) as corpus:
+            self.assertEqual(corpus.get_article_ids(), [1, 3])
+            self.assertEqual(corpus.read(3, RAW), 'Новая статья')
+
+    @pytest.mark.core_utils
+    def test_dataset_is_packed_and_unpacked(self):
+        """
+        Ensure a dataset of separate files is restored byte by byte
+        """
+        with PackedCorpus(self.path) as corpus:
+            pack_dataset(CORE_UTILS_TEST_FILES_FOLDER, corpus)
+            self.assertEqual(corpus.get_article_ids(), [1])
+            unpack_dataset(corpus, TEST_PATH / 'unpacked')
+        for name in ('1_raw.txt', '1_meta.json'):
+            self.assertEqual((TEST_PATH / 'unpacked' / name).read_bytes(),
+                             (CORE_UTILS_TEST_FILES_FOLDER / name).read_bytes())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(TEST_PATH)
+
+    @pytest.mark.core_utils
+    def test_only_artifacts_are_packed(self):
+        """
+        Ensure files whose extension does not match their kind are not packed
+        """
+        dataset_path = TEST_PATH / 'dataset'
+        dataset_path.mkdir()
+        (dataset_path / '1_raw.txt').write_text('Статья', encoding='utf-8')
+        (dataset_path / '3_raw.json').write_text('{}', encoding='utf-8')
+        (dataset_path / '2_meta.txt').write_text('{}', encoding='utf-8')
+        (dataset_path / '.4_raw.txt.tmp').write_text('Недописанная', encoding='utf-8')
+        with PackedCorpus(self.path) as corpus:
+            pack_dataset(dataset_path, corpus)
+            self.assertEqual(list(corpus), [(1, RAW)])
@@ -0,0 +1,65 @@
+"""
+Tests for splitting texts by sentences
+"""
+import random
+import re
+import unittest
+
+import pytest
+
+from config.test_params import CORE_UTILS_TEST_FILES_FOLDER
+from core_utils.article.article import iter_sentences, split_by_sentence
+
+# a mix of characters the boundary pattern looks at, with other letters, digits and spaces
+ALPHABET = ['А', 'Я', 'а', 'б', 'Ё', 'x', '1', '.', '!', '?', '"', ',', '-', '|',
+            ' ', ' ', '\n', '\t', '\xa0', '\r', '_']
+
+
+def split_by_sentence_reference(text: str) -> list[str]:
+    """
+    Previous implementation of split_by_sentence()
+    """
+    pattern = r"(?<!\w\.\w.)(?<![А-Я][а-я]\.)((?<=\.|\?|!)|(?<=\?\"|!\"))\s(?=[А-Я])"
+    text = re.sub(r'[\n|\t]+', '. ', text)
+    sentences = [sentence for sentence in re.split(pattern, text) if sentence.replace(' ', '')
+                 and len(sentence) > 10]
+    return sentences
+
+
+class SentenceSplitterTest(unittest.TestCase):
+    """
+    Class for testing equivalence of the sentence splitter with its previous implementation
+    """
+
+    @pytest.mark.core_utils
+    def test_split_by_sentence_matches_reference_on_random_texts(self):
+        """
+        Ensure sentences are the same on random texts full of boundary candidates
+        """
+        generator = random.Random(2023)
+        for _ in range(20_000):
+            text = ''.join(generator.choices(ALPHABET, k=generator.randint(0, 60)))
+            self.assertEqual(split_by_sentence(text), split_by_sentence_reference(text), repr(text))
+
+    @pytest.mark.core_utils
+    def test_split_by_sentence_matches_reference_on_articles(self):
+        """
+        Ensure sentences are the same on raw texts of articles
+        """
+        for path in sorted(CORE_UTILS_TEST_FILES_FOLDER.glob('*_raw.txt')):
+            text = path.read_text(encoding='utf-8')
+            self.assertEqual(split_by_sentence(text), split_by_sentence_reference(text))
+
+    @pytest.mark.core_utils
+    def test_iter_sentences_matches_split_by_sentence(self):
+        """
+        Ensure the generator yields sentences of split_by_sentence() lazily
+        """
+        generator = random.Random(2024)
+        for _ in range(5_000):
+            text = ''.join(generator.choices(ALPHABET, k=generator.randint(0, 60)))
+            self.assertEqual(list(iter_sentences(text)), split_by_sentence(text), repr(text))
+
+        sentences = iter_sentences('Первое предложение. Второе предложение! Третье предложение')
+        self.assertEqual(next(sentences), 'Первое предложение.')
+        self.assertEqual(list(sentences), ['Второе предложение!', 'Третье предложение'])
@@ -0,0 +1,198 @@
+"""
+Benchmarks of the scrapper on synthetic pages, no network is used
+"""
+# pylint: disable=protected-access, too-few-public-methods, pointless-string-statement
+import time
+from typing import Callable, Union
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scrapper import scrapper
+from lab_5_scrapper.scrapper import Config, Crawler, HTMLParser
+
+
+class FakeResponse:
+    """
+    Minimal stand-in for requests.models.Response
+    """
+
+    def __init__(self, text: Union[str, bytes]) -> None:
+        self.content = text if isinstance(text, bytes) else text.encode('utf-8')
+        self.text = self.content.decode('utf-8')
+
+
+def generate_seed_page(seed: int, num_articles: int, num_other_links: int) -> str:
+    """
+    Generates a seed page where article links are lost among navigation links
+    """
+    navigation = ''.join(f'<li><a href="/section/{idx}">Раздел {idx}</a></li>'
+                         for idx in range(num_other_links))
+    articles = ''.join(f'<div class="item"><a href="news/{seed}-{idx}">'
+                       f'<img src="/img/{idx}.jpg"></a><a href="news/{seed}-{idx}">'
+                       f'Новость {idx}</a><p>Анонс новости</p></div>'
+                       for idx in range(num_articles))
+    return f'<html><body><ul>{navigation}</ul>{articles}<ul>{navigation}</ul></body></html>'
+
+
+def find_articles_eagerly(crawler: Crawler) -> None:
+    """
+    Previous implementation: requests every seed and builds the whole tree
+    """
+    for seed_url in crawler.seed_urls:
+        response = scrapper.make_request(seed_url, crawler.config)
+        main_bs = BeautifulSoup(response.text, 'lxml')
+        for url in main_bs.find_all('a'):
+            link = crawler._extract_url(url)
+            if len(crawler.urls) < crawler.config.get_num_articles() and link.startswith('news/'):
+                crawler.urls.append('https://orenday.ru/' + link)
+
+
+def measure(find: Callable[[Crawler], None], config: Config, pages: dict) -> tuple[int, float]:
+    """
+    Returns number of requests and seconds spent finding articles
+    """
+    calls = []
+
+    def fake_request(url: str, _: Config) -> FakeResponse:
+        calls.append(url)
+        return FakeResponse(pages[url])
+
+    crawler = Crawler(config)
+    with mock.patch.object(scrapper, 'make_request', fake_request):
+        start = time.perf_counter()
+        find(crawler)
+        spent = time.perf_counter() - start
+    return len(calls), spent
+
+
+def generate_article_page(num_paragraphs: int) -> bytes:
+    """
+    Generates an article page surrounded by heavy navigation and comments
+    """
+    navigation = ''.join(f'<li><a href="/section/{idx}">Раздел {idx}</a></li>'
+                         for idx in range(500))
+    comments = ''.join(f'<div class="comment"><span>Читатель {idx}</span>'
+                       f'<div class="body">Комментарий к новости</div></div>'
+                       for idx in range(500))
+    text = ''.join(f'<p>Абзац {idx} новости о событиях в городе.</p>'
+                   for idx in range(num_paragraphs))
+    return (f'<html><body><ul>{navigation}</ul><h1 class="title-news">Заголовок</h1>'
+            f'<div class="fright"><a rel="author">Автор</a></div><div>{text}</div>'
+            f'{comments}</body></html>').encode('utf-8')
+
+
+def parse_whole_page(parser: HTMLParser, page: bytes) -> None:
+    """
+    Previous implementation: builds the tree of the whole page
+    """
+    articles = BeautifulSoup(page, 'lxml')
+    parser._fill_article_with_text(articles)
+    parser._fill_article_with_meta_information(articles)
+
+
+def benchmark_parsing(config: Config) -> None:
+    """
+    Compares parsing the whole page with parsing article elements only
+    """
+    page = generate_article_page(num_paragraphs=30)
+    repeats = 20
+    for name, parse in (('whole page', parse_whole_page),
+                        ('strained', HTMLParser._parse_page)):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            parse(HTMLParser('https://orenday.ru/news/1', 1, config), page)
+        print(f'Parsing, {name}: {(time.perf_counter() - start) / repeats * 1000:.1f} ms per page')
+
+
+def assemble_by_concatenation(parser: HTMLParser, article_soup: BeautifulSoup) -> None:
+    """
+    Previous implementation: grows the text once per paragraph
+    """
+    for paragraph in article_soup.find_all('p'):
+        parser.article.text += paragraph.text
+
+
+def benchmark_text_assembly(config: Config) -> None:
+    """
+    Compares growing article text per paragraph with joining paragraphs once
+    """
+    for num_paragraphs in (1000, 5000, 20000):
+        text = ''.join(f'<p>Абзац {idx} очень длинной новости о событиях в городе.</p>'
+                       for idx in range(num_paragraphs))
+        article_soup = BeautifulSoup(f'<html><body>{text}</body></html>', 'lxml')
+        for name, assemble in (('concatenation', assemble_by_concatenation),
+                               ('join', HTMLParser._fill_article_with_text)):
+            parser = HTMLParser('https://orenday.ru/news/1', 1, config)
+            start = time.perf_counter()
+            assemble(parser, article_soup)
+            print(f'{num_paragraphs:>5} paragraphs, {name}: '
+                  f'{(time.perf_counter() - start) * 1000:.1f} ms')
+
+
+def benchmark_parse_stage(config: Config) -> None:
+    """
+    Compares parsing downloaded pages in one process and in a pool of processes
+    """
+    page = generate_article_page(num_paragraphs=30)
+    urls = [f'https://orenday.ru/news/{idx}' for idx in range(200)]
+    for parse_workers in (1, 2, 4):
+        config._parse_workers = parse_workers
+        with mock.patch.object(scrapper, 'make_request', lambda *_: FakeResponse(page)):
+            start = time.perf_counter()
+            for _ in scrapper.collect_articles(urls, config):
+                pass
+            spent = time.perf_counter() - start
+        print(f'Parse stage, {parse_workers} processes: {len(urls) / spent:.1f} pages per second')
+
+
+def benchmark_find_articles(config: Config) -> None:
+    """
+    Compares requesting all seed pages with stopping once the quota is met
+    """
+    config._seed_urls = [f'https://orenday.ru/news?page={seed}' for seed in range(50)]
+    pages = {url: generate_seed_page(seed, num_articles=20, num_other_links=300)
+             for seed, url in enumerate(config.get_seed_urls())}
+
+    for quota in (5, 50, 150):
+        config._num_articles = quota
+        eager_requests, eager_time = measure(find_articles_eagerly, config, pages)
+        lazy_requests, lazy_time = measure(Crawler.find_articles, config, pages)
+        print(f'Quota {quota:>3}: '
+              f'eager {eager_requests} requests, {eager_time:.3f} s; '
+              f'lazy {lazy_requests} requests, {lazy_time:.3f} s')
+
+
+def main() -> None:
+    """
+    Entrypoint for module
+    """
+    config = Config(CRAWLER_CONFIG_PATH)
+    benchmark_find_articles(config)
+    benchmark_parsing(config)
+    benchmark_text_assembly(config)
+    benchmark_parse_stage(config)
+
+    # Output on developer's machine
+    """
+    Quota   5: eager 50 requests, 1.523 s; lazy 1 requests, 0.017 s
+    Quota  50: eager 50 requests, 1.657 s; lazy 3 requests, 0.052 s
+    Quota 150: eager 50 requests, 1.512 s; lazy 8 requests, 0.128 s
+    Parsing, whole page: 67.4 ms per page
+    Parsing, strained: 28.9 ms per page
+     1000 paragraphs, concatenation: 3.9 ms
+     1000 paragraphs, join: 3.3 ms
+     5000 paragraphs, concatenation: 60.1 ms
+     5000 paragraphs, join: 32.3 ms
+    20000 paragraphs, concatenation: 1967.7 ms
+    20000 paragraphs, join: 76.2 ms
+    Parse stage, 1 processes: 43.4 pages per second
+    Parse stage, 2 processes: 41.7 pages per second
+    Parse stage, 4 processes: 34.9 pages per second
+    (parse stage measured on a single core, where extra processes only add overhead)
+    """
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+"""
+On-disk cache of HTTP responses for the scrapper
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Mapping, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CacheMissError(Exception):
+    """
+    Requested page is absent from the cache in offline mode
+    """
+
+
+class CachedResponse:
+    """
+    Stores a response body together with its validators
+    """
+
+    def __init__(self, url: str, body: bytes, entry: dict) -> None:
+        """
+        Initializes an instance of the CachedResponse class
+        """
+        self.url = url
+        self.body = body
+        self.etag = entry.get('etag')
+        self.last_modified = entry.get('last_modified')
+        self.headers = entry.get('headers', {})
+
+    def get_conditional_headers(self) -> dict[str, str]:
+        """
+        Retrieve headers asking the server to answer 304 if the page is unchanged
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.models.Response:
+        """
+        Builds a response as if it was received from the server
+        """
+        response = requests.models.Response()
+        response.status_code = 200
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body  # pylint: disable=protected-access
+        return response
+
+
+class ResponseCache:
+    """
+    Content-addressed cache: entries are keyed by URL hash
+    and point to bodies named after the hash of their content;
+    the order of use and sizes of bodies are kept in memory
+    and the order of use is written to entries only by save() and evict()
+    """
+
+    def __init__(self, path: Path, max_age: int, max_size: int) -> None:
+        """
+        Initializes an instance of the ResponseCache class, reading entries once;
+        entries older than max_age are kept for revalidation and evicted first
+        """
+        self._entries_path = path / 'entries'
+        self._bodies_path = path / 'bodies'
+        self._entries_path.mkdir(parents=True, exist_ok=True)
+        self._bodies_path.mkdir(parents=True, exist_ok=True)
+        self._max_age = max_age
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # entry file names from the least to the most recently used, with their bodies
+        self._bodies_by_entry: OrderedDict[str, str] = OrderedDict()
+        self._stored_at: dict[str, float] = {}
+        # times of use not written to entries yet
+        self._accessed_at: dict[str, float] = {}
+        self._body_sizes: dict[str, int] = {}
+        self._references: dict[str, int] = {}
+        self._total_size = 0
+        self._load()
+        self.evict()
+
+    @staticmethod
+    def _hash(data: bytes) -> str:
+        """
+        Computes the name of a cache file
+        """
+        return hashlib.sha256(data).hexdigest()
+
+    def _get_entry_path(self, url: str) -> Path:
+        """
+        Retrieve path to the entry describing the url
+        """
+        return self._entries_path / f'{self._hash(url.encode("utf-8"))}.json'
+
+    def _read_entry(self, path: Path) -> Optional[dict]:
+        """
+        Loads an entry, ignoring a missing or corrupted one
+        """
+        try:
+            with path.open(encoding='utf-8') as entry_file:
+                entry: dict = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    @staticmethod
+    def _write_entry(path: Path, entry: dict) -> None:
+        """
+        Saves an entry so that readers never see a partially written file
+        """
+        tmp_path = path.with_suffix('.tmp')
+        with tmp_path.open('w', encoding='utf-8') as entry_file:
+            json.dump(entry, entry_file, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    def _load(self) -> None:
+        """
+        Reads all entries, removing corrupted ones together with bodies nothing refers to;
+        expired entries keep their validators, so that they can be revalidated
+        """
+        entries = []
+        for path in self._entries_path.glob('*.json'):
+            entry = self._read_entry(path)
+            if entry is None:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((entry['accessed_at'], path.name, entry['body'],
+                                entry['stored_at']))
+        for _, name, body, stored_at in sorted(entries):
+            self._bodies_by_entry[name] = body
+            self._stored_at[name] = stored_at
+            self._references[body] = self._references.get(body, 0) + 1
+        for body_path in self._bodies_path.iterdir():
+            if body_path.name in self._references:
+                self._body_sizes[body_path.name] = body_path.stat().st_size
+            else:
+                body_path.unlink(missing_ok=True)
+        self._total_size = sum(self._body_sizes.values())
+
+    def _add_reference(self, name: str, body: str, size: int) -> None:
+        """
+        Records that the entry points to the body, as the most recently used one
+        """
+        if body not in self._references:
+            self._references[body] = 0
+            self._body_sizes[body] = size
+            self._total_size += size
+        self._references[body] += 1
+        # the body the entry pointed to before is released after the new one is referenced
+        self._remove_reference(name)
+        self._bodies_by_entry[name] = body
+
+    def _remove_reference(self, name: str) -> None:
+        """
+        Forgets the entry, removing its body once no entry points to it
+        """
+        body = self._bodies_by_entry.pop(name, None)
+        self._stored_at.pop(name, None)
+        self._accessed_at.pop(name, None)
+        if body is None:
+            return
+        self._references[body] -= 1
+        if not self._references[body]:
+            del self._references[body]
+            self._total_size -= self._body_sizes.pop(body, 0)
+            (self._bodies_path / body).unlink(missing_ok=True)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Retrieve the cached response for the url if it is still stored
+        """
+        entry_path = self._get_entry_path(url)
+        with self._lock:
+            if entry_path.name not in self._bodies_by_entry:
+                return None
+            entry = self._read_entry(entry_path)
+            if entry is None:
+                return None
+            body_path = self._bodies_path / entry['body']
+            if not body_path.exists():
+                return None
+            self._accessed_at[entry_path.name] = time.time()
+            self._bodies_by_entry.move_to_end(entry_path.name)
+            return CachedResponse(url, body_path.read_bytes(), entry)
+
+    def store(self, url: str, response: requests.models.Response) -> None:
+        """
+        Saves the body and validators of a successful response
+        """
+        self.store_content(url, response.content, response.headers)
+
+    def store_content(self, url: str, body: bytes, headers: Mapping[str, str]) -> None:
+        """
+        Saves the body and validators of a successful response given by its parts,
+        headers must be looked up case-insensitively
+        """
+        body_name = self._hash(body)
+        now = time.time()
+        entry = {
+            'url': url,
+            'body': body_name,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'headers': {'Content-Type': headers.get('Content-Type', '')},
+            'stored_at': now,
+            'accessed_at': now
+        }
+        with self._lock:
+            body_path = self._bodies_path / body_name
+            if not body_path.exists():
+                tmp_path = body_path.with_suffix('.tmp')
+                tmp_path.write_bytes(body)
+                tmp_path.replace(body_path)
+            entry_path = self._get_entry_path(url)
+            self._write_entry(entry_path, entry)
+            self._add_reference(entry_path.name, body_name, len(body))
+            self._stored_at[entry_path.name] = now
+        if self._total_size > self._max_size:
+            self.evict()
+
+    def refresh(self, url: str) -> None:
+        """
+        Marks the entry as revalidated by the server
+        """
+        entry_path = self._get_entry_path(url)
+        with self._lock:
+            entry = self._read_entry(entry_path)
+            if entry is not None:
+                entry['stored_at'] = time.time()
+                entry['accessed_at'] = self._accessed_at.pop(entry_path.name,
+                                                             entry['accessed_at'])
+                self._write_entry(entry_path, entry)
+                if entry_path.name in self._bodies_by_entry:
+                    self._stored_at[entry_path.name] = entry['stored_at']
+
+    def save(self) -> None:
+        """
+        Writes times of use of entries, so that the next run evicts them in the same order
+        """
+        with self._lock:
+            self._save_access_times()
+
+    def _save_access_times(self) -> None:
+        """
+        Writes times of use kept in memory to entries
+        """
+        accessed_at, self._accessed_at = self._accessed_at, {}
+        for name, accessed in accessed_at.items():
+            entry = self._read_entry(self._entries_path / name)
+            if entry is not None:
+                entry['accessed_at'] = accessed
+                self._write_entry(self._entries_path / name, entry)
+
+    def _get_victim(self) -> str:
+        """
+        Chooses the least recently used expired entry, or the least recently used one
+        """
+        expired_before = time.time() - self._max_age
+        return next((name for name in self._bodies_by_entry
+                     if self._stored_at.get(name, 0) < expired_before),
+                    next(iter(self._bodies_by_entry)))
+
+    def evict(self) -> None:
+        """
+        Removes expired and then least recently used entries until bodies fit into max_size
+        """
+        with self._lock:
+            if self._total_size <= self._max_size:
+                return
+            while self._total_size > self._max_size and self._bodies_by_entry:
+                name = self._get_victim()
+                (self._entries_path / name).unlink(missing_ok=True)
+                self._remove_reference(name)
+            self._save_access_times()
@@ -0,0 +1,139 @@
+"""
+Per-host throttling of requests for the scrapper
+"""
+import threading
+import time
+from typing import Callable, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+
+# pylint: disable=too-few-public-methods
+class TokenBucket:
+    """
+    Lets requests through at a steady rate, allowing short bursts
+    """
+
+    def __init__(self, rate: float, capacity: int, now: float) -> None:
+        """
+        Initializes an instance of the TokenBucket class
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Takes a token and returns seconds to wait until it may be used,
+        so that concurrent callers line up one after another
+        """
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+def parse_crawl_delay(robots_txt: str, user_agent: str) -> Optional[float]:
+    """
+    Extracts the Crawl-delay directive for the user agent from robots.txt
+    """
+    parser = RobotFileParser()
+    parser.parse(robots_txt.splitlines())
+    delay = parser.crawl_delay(user_agent)
+    return float(delay) if delay is not None else None
+
+
+class HostRateLimiter:
+    """
+    Keeps a token bucket for every host; the clock and sleep
+    can be replaced to test throttling without waiting
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 rate: float,
+                 burst: int,
+                 fetch_robots: Optional[Callable[[str], str]] = None,
+                 user_agent: str = '*',
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        Initializes an instance of the HostRateLimiter class,
+        rate of 0 lets requests through unless robots.txt asks for a crawl delay
+        """
+        self._rate = rate
+        self._burst = burst
+        self._fetch_robots = fetch_robots
+        self._user_agent = user_agent
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def _get_host_rate(self, url: str) -> float:
+        """
+        Retrieve the allowed rate for the host, lowered by its crawl delay
+        """
+        rate = self._rate
+        if self._fetch_robots is None:
+            return rate
+        parts = urlparse(url)
+        delay = parse_crawl_delay(self._fetch_robots(f'{parts.scheme}://{parts.netloc}/robots.txt'),
+                                  self._user_agent)
+        if delay:
+            rate = min(rate, 1 / delay) if rate else 1 / delay
+        return rate
+
+    def _get_bucket(self, url: str) -> Optional[TokenBucket]:
+        """
+        Retrieve the bucket of the url host, reading robots.txt on the first request
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            if host in self._buckets:
+                return self._buckets[host]
+        rate = self._get_host_rate(url)
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = (TokenBucket(rate, self._burst, self._clock())
+                                       if rate else None)
+            return self._buckets[host]
+
+    def get_interval(self, url: str) -> float:
+        """
+        Retrieve seconds between requests to the url host, 0 if it is not limited
+        """
+        bucket = self._get_bucket(url)
+        return 1 / bucket.rate if bucket else 0.0
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserves a request to the url host, returning seconds to wait before it
+        """
+        bucket = self._get_bucket(url)
+        if bucket is None:
+            return 0.0
+        with self._lock:
+            return bucket.reserve(self._clock())
+
+    def wait(self, url: str) -> None:
+        """
+        Blocks until a request to the url host is allowed
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            self._sleep(delay)
+
+    def interleave(self, urls: list[str]) -> list[str]:
+        """
+        Orders urls by the time each of them is allowed to be requested,
+        so that requests to a throttled host do not hold up other hosts
+        """
+        slots = {}
+        schedule = []
+        for idx, url in enumerate(urls):
+            host = urlparse(url).netloc
+            slot = slots.get(host, 0)
+            slots[host] = slot + 1
+            schedule.append((max(0, slot - self._burst + 1) * self.get_interval(url), idx, url))
+        return [url for _, _, url in sorted(schedule)]
@@ -1,22 +1,58 @@
+# pylint: disable=too-many-lines
 """
 Crawler implementation
 """
 import datetime
+import hashlib
+import heapq
 import json
+import queue
 import re
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Pattern, Union
+from typing import Iterator, Optional, Pattern, Union
+from urllib.parse import urldefrag, urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from core_utils.article.article import Article
-from core_utils.article.io import to_meta, to_raw
+from core_utils.article.io import ArticleWriter
 from core_utils.config_dto import ConfigDTO
-from core_utils.constants import (ASSETS_PATH, CRAWLER_CONFIG_PATH,
-                                  NUM_ARTICLES_UPPER_LIMIT,
-                                  TIMEOUT_LOWER_LIMIT, TIMEOUT_UPPER_LIMIT)
+from core_utils.constants import (ASSETS_PATH, CACHE_MODES,
+                                  CRAWL_CHECKPOINT_FILE_NAME,
+                                  CRAWL_CHECKPOINT_INTERVAL, CRAWL_DEPTH_LIMIT,
+                                  CRAWL_INDEX_FILE_NAME,
+                                  CRAWL_PAGES_PER_DEPTH_LIMIT,
+                                  CRAWL_REQUEST_BUDGET, CRAWLER_CONFIG_PATH,
+                                  HTTP_CACHE_PATH, NUM_ARTICLES_UPPER_LIMIT,
+                                  PARSE_QUEUE_SIZE, RETRIES_UPPER_LIMIT,
+                                  RETRY_STATUS_CODES, TIMEOUT_LOWER_LIMIT,
+                                  TIMEOUT_UPPER_LIMIT, WORKERS_UPPER_LIMIT)
+from lab_5_scrapper.http_cache import CacheMissError, ResponseCache
+from lab_5_scrapper.rate_limiter import HostRateLimiter
+
+ARTICLE_URL_PATTERN = re.compile(r'^news/')
+ARTICLE_LINK_STRAINER = SoupStrainer('a', href=ARTICLE_URL_PATTERN)
+
+
+def is_article_content(name: str, attrs: dict[str, str]) -> bool:
+    """
+    Checks whether a tag holds text, title or authors of an article
+    """
+    classes = attrs.get('class', '').split()
+    return (name == 'p'
+            or (name == 'h1' and 'title-news' in classes)
+            or (name == 'div' and 'fright' in classes))
+
+
+ARTICLE_CONTENT_STRAINER = SoupStrainer(is_article_content)  # type: ignore
 
 
 class IncorrectSeedURLError(Exception):
@@ -61,6 +97,82 @@ class IncorrectVerifyError(Exception):
     """
 
 
+class IncorrectIncrementalError(Exception):
+    """
+    Validates the incremental attribute
+    """
+
+
+class IncorrectPreserveParagraphsError(Exception):
+    """
+    Validates the preserve paragraphs attribute
+    """
+
+
+class IncorrectMaxWorkersError(Exception):
+    """
+    Validates the number of concurrent workers
+    """
+
+
+class IncorrectSessionParamsError(Exception):
+    """
+    Validates connection pool and retry settings
+    """
+
+
+class IncorrectCacheParamsError(Exception):
+    """
+    Validates response cache settings
+    """
+
+
+class IncorrectRateLimitError(Exception):
+    """
+    Validates throttling settings
+    """
+
+
+class IncorrectRecursiveCrawlError(Exception):
+    """
+    Validates the recursive crawl attribute
+    """
+
+
+# pylint: disable=too-few-public-methods
+class HostConcurrencyLimiter:
+    """
+    Caps the number of simultaneous requests sent to a single host
+    """
+
+    def __init__(self, max_per_host: int) -> None:
+        """
+        Initializes an instance of the HostConcurrencyLimiter class
+        """
+        self._max_per_host = max_per_host
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _get_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        """
+        Retrieves the semaphore guarding the host of the url
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self._max_per_host)
+            return self._semaphores[host]
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """
+        Blocks until the host of the url has a free slot
+        """
+        with self._get_semaphore(url):
+            yield
+
+
+# pylint: disable=too-many-instance-attributes
 class Config:
     """
     Unpacks and validates configurations
@@ -72,6 +184,21 @@ class Config:
     timeout: int
     verify_certificate: bool
     headless_mode: bool
+    max_workers: int
+    max_workers_per_host: int
+    parse_workers: int
+    pool_size: int
+    max_retries: int
+    retry_backoff: float
+    cache_mode: str
+    cache_max_age: int
+    cache_max_size: int
+    incremental: bool
+    preserve_paragraphs: bool
+    rate_limit: float
+    rate_burst: int
+    respect_crawl_delay: bool
+    recursive_crawl: bool
 
     def __init__(self, path_to_config: Path) -> None:
         """
@@ -87,6 +214,45 @@ class Config:
         self._timeout = config_dto.timeout
         self._should_verify_certificate = config_dto.should_verify_certificate
         self._headless_mode = config_dto.headless_mode
+        self._max_workers = config_dto.max_workers
+        self._max_workers_per_host = config_dto.max_workers_per_host
+        self._host_limiter: Optional[HostConcurrencyLimiter] = \
+            HostConcurrencyLimiter(self._max_workers_per_host)
+        self._parse_workers = config_dto.parse_workers
+        self._pool_size = config_dto.pool_size
+        self._max_retries = config_dto.max_retries
+        self._retry_backoff = config_dto.retry_backoff
+        self._session: Optional[requests.Session] = self._create_session()
+        self._cache_mode = config_dto.cache_mode
+        self._response_cache = None
+        if self._cache_mode != 'off':
+            self._response_cache = ResponseCache(HTTP_CACHE_PATH,
+                                                 config_dto.cache_max_age,
+                                                 config_dto.cache_max_size)
+        self._incremental = config_dto.incremental
+        self._preserve_paragraphs = config_dto.preserve_paragraphs
+        self._rate_limit = config_dto.rate_limit
+        self._rate_burst = config_dto.rate_burst
+        self._respect_crawl_delay = config_dto.respect_crawl_delay
+        self._rate_limiter: Optional[HostRateLimiter] = self._create_rate_limiter()
+        self._recursive_crawl = config_dto.recursive_crawl
+
+    def __getstate__(self) -> dict:
+        """
+        Leaves out connections and locks, so that the config
+        can be sent to parse workers in other processes
+        """
+        state = self.__dict__.copy()
+        for name in ('_session', '_host_limiter', '_response_cache', '_rate_limiter'):
+            state[name] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the config in a parse worker, which never makes requests,
+        so connections and limiters are created only if they are asked for
+        """
+        self.__dict__.update(state)
 
     def _extract_config_content(self) -> ConfigDTO:
         """
@@ -115,7 +281,11 @@ class Config:
                 or config_dto.total_articles < 1):
             raise IncorrectNumberOfArticlesError
 
-        if config_dto.total_articles > NUM_ARTICLES_UPPER_LIMIT:
+        if not isinstance(config_dto.recursive_crawl, bool):
+            raise IncorrectRecursiveCrawlError
+
+        # a recursive crawl is not limited by the articles of the seed pages
+        if config_dto.total_articles > NUM_ARTICLES_UPPER_LIMIT and not config_dto.recursive_crawl:
             raise NumberOfArticlesOutOfRangeError
 
         if not isinstance(config_dto.headers, dict):
@@ -132,6 +302,106 @@ class Config:
         if not isinstance(config_dto.should_verify_certificate, bool) or not isinstance(config_dto.headless_mode, bool):
             raise IncorrectVerifyError
 
+        if not isinstance(config_dto.incremental, bool):
+            raise IncorrectIncrementalError
+
+        if not isinstance(config_dto.preserve_paragraphs, bool):
+            raise IncorrectPreserveParagraphsError
+
+        self._validate_connection_params(config_dto)
+
+    def _validate_connection_params(self, config_dto: ConfigDTO) -> None:
+        """
+        Ensure concurrency and session parameters
+        are not corrupt
+        """
+        for workers in (config_dto.max_workers, config_dto.max_workers_per_host,
+                        config_dto.parse_workers):
+            if (not isinstance(workers, int) or isinstance(workers, bool)
+                    or workers < 1 or workers > WORKERS_UPPER_LIMIT):
+                raise IncorrectMaxWorkersError
+
+        # every worker must get a pooled connection instead of waiting for one
+        if (not isinstance(config_dto.pool_size, int) or isinstance(config_dto.pool_size, bool)
+                or config_dto.pool_size < max(1, config_dto.max_workers)):
+            raise IncorrectSessionParamsError
+
+        if (not isinstance(config_dto.max_retries, int)
+                or isinstance(config_dto.max_retries, bool)
+                or not 0 <= config_dto.max_retries <= RETRIES_UPPER_LIMIT):
+            raise IncorrectSessionParamsError
+
+        if (not isinstance(config_dto.retry_backoff, (int, float))
+                or isinstance(config_dto.retry_backoff, bool)
+                or config_dto.retry_backoff < 0):
+            raise IncorrectSessionParamsError
+
+        if config_dto.cache_mode not in CACHE_MODES:
+            raise IncorrectCacheParamsError
+
+        for limit in (config_dto.cache_max_age, config_dto.cache_max_size):
+            if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+                raise IncorrectCacheParamsError
+
+        if (not isinstance(config_dto.rate_limit, (int, float))
+                or isinstance(config_dto.rate_limit, bool)
+                or config_dto.rate_limit < 0):
+            raise IncorrectRateLimitError
+
+        if (not isinstance(config_dto.rate_burst, int) or isinstance(config_dto.rate_burst, bool)
+                or config_dto.rate_burst < 1):
+            raise IncorrectRateLimitError
+
+        if not isinstance(config_dto.respect_crawl_delay, bool):
+            raise IncorrectRateLimitError
+
+    def _create_session(self) -> requests.Session:
+        """
+        Creates a session keeping connections alive between requests
+        and retrying requests rejected by an overloaded server
+        """
+        retries = Retry(total=self._max_retries,
+                        backoff_factor=self._retry_backoff,
+                        status_forcelist=RETRY_STATUS_CODES,
+                        allowed_methods=frozenset({'GET'}),
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=self._pool_size,
+                              pool_maxsize=self._pool_size,
+                              max_retries=retries)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _create_rate_limiter(self) -> HostRateLimiter:
+        """
+        Creates a limiter throttling requests to every host
+        """
+        user_agent = next((value for key, value in self._headers.items()
+                           if key.lower() == 'user-agent'), '*')
+        return HostRateLimiter(self._rate_limit, self._rate_burst,
+                               self._fetch_robots if self._respect_crawl_delay else None,
+                               user_agent)
+
+    def _fetch_robots(self, url: str) -> str:
+        """
+        Downloads robots.txt of a host, treating an unavailable one as empty;
+        it is kept in the response cache, so that offline mode replays it without network
+        """
+        cached = self._response_cache.get(url) if self._response_cache else None
+        if self._cache_mode == 'offline':
+            return cached.body.decode('utf-8', errors='replace') if cached else ''
+        try:
+            response = self.get_session().get(url, headers=self._headers,
+                                              timeout=self._timeout,
+                                              verify=self._should_verify_certificate)
+        except requests.RequestException:
+            return ''
+        if self._response_cache and response.status_code == 200:
+            self._response_cache.store(url, response)
+        response.encoding = 'utf-8'
+        return response.text if response.status_code == 200 else ''
+
     def get_seed_urls(self) -> list[str]:
         """
         Retrieve seed urls
@@ -174,6 +444,90 @@ class Config:
         """
         return self._headless_mode
 
+    def get_max_workers(self) -> int:
+        """
+        Retrieve number of articles to fetch simultaneously
+        """
+        return self._max_workers
+
+    def get_max_workers_per_host(self) -> int:
+        """
+        Retrieve number of simultaneous requests allowed to a single host
+        """
+        return self._max_workers_per_host
+
+    def get_parse_workers(self) -> int:
+        """
+        Retrieve number of processes parsing downloaded pages
+        """
+        return self._parse_workers
+
+    def get_host_limiter(self) -> HostConcurrencyLimiter:
+        """
+        Retrieve the limiter shared by all requests made with this config
+        """
+        if self._host_limiter is None:
+            self._host_limiter = HostConcurrencyLimiter(self._max_workers_per_host)
+        return self._host_limiter
+
+    def get_rate_limiter(self) -> HostRateLimiter:
+        """
+        Retrieve limiter throttling requests to every host
+        """
+        if self._rate_limiter is None:
+            self._rate_limiter = self._create_rate_limiter()
+        return self._rate_limiter
+
+    def get_max_retries(self) -> int:
+        """
+        Retrieve number of retries of a request rejected by an overloaded server
+        """
+        return self._max_retries
+
+    def get_retry_backoff(self) -> float:
+        """
+        Retrieve backoff factor in seconds between retries
+        """
+        return self._retry_backoff
+
+    def get_session(self) -> requests.Session:
+        """
+        Retrieve the session shared by all requests made with this config
+        """
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def get_cache_mode(self) -> str:
+        """
+        Retrieve whether responses are cached, revalidated or replayed offline
+        """
+        return self._cache_mode
+
+    def get_response_cache(self) -> Optional[ResponseCache]:
+        """
+        Retrieve the on-disk cache of responses if caching is enabled
+        """
+        return self._response_cache
+
+    def get_incremental(self) -> bool:
+        """
+        Retrieve whether to keep previously collected articles
+        """
+        return self._incremental
+
+    def get_preserve_paragraphs(self) -> bool:
+        """
+        Retrieve whether to separate paragraphs of article text with new lines
+        """
+        return self._preserve_paragraphs
+
+    def get_recursive_crawl(self) -> bool:
+        """
+        Retrieve whether to follow links beyond the seed pages
+        """
+        return self._recursive_crawl
+
 
 def make_request(url: str, config: Config) -> requests.models.Response:
     """
@@ -183,7 +537,27 @@ def make_request(url: str, config: Config) -> requests.models.Response:
     headers = config.get_headers()
     timeout = config.get_timeout()
     verify = config.get_verify_certificate()
-    response = requests.get(url, headers=headers, timeout=timeout, verify=verify)
+    cache = config.get_response_cache()
+    cached = cache.get(url) if cache else None
+
+    if config.get_cache_mode() == 'offline':
+        if not cached:
+            raise CacheMissError(url)
+        response = cached.to_response()
+        response.encoding = 'utf-8'
+        return response
+
+    if cached:
+        headers = {**headers, **cached.get_conditional_headers()}
+    config.get_rate_limiter().wait(url)
+    with config.get_host_limiter().limit(url):
+        response = config.get_session().get(url, headers=headers, timeout=timeout, verify=verify)
+
+    if cache and cached and response.status_code == 304:
+        cache.refresh(url)
+        response = cached.to_response()
+    elif cache and response.status_code == 200:
+        cache.store(url, response)
     response.encoding = 'utf-8'
     return response
 
@@ -193,7 +567,7 @@ class Crawler:
     Crawler implementation
     """
 
-    url_pattern: Union[Pattern, str]
+    url_pattern: Union[Pattern, str] = ARTICLE_URL_PATTERN
 
     def __init__(self, config: Config) -> None:
         """
@@ -215,15 +589,47 @@ class Crawler:
 
     def find_articles(self) -> None:
         """
-        Finds articles
+        Finds articles, requesting seed pages only until the quota is met
+        """
+        self._add_urls(self._iter_article_urls())
+
+    def _iter_article_urls(self) -> Iterator[str]:
+        """
+        Lazily requests seed pages and yields article URLs found on them
+        """
+        for seed_url in self.seed_urls:
+            response = make_request(seed_url, self.config)
+            yield from self._extract_article_urls(seed_url, response.text)
+
+    def _extract_article_urls(self, seed_url: str, seed_page: str) -> Iterator[str]:
+        """
+        Yields article URLs of a seed page, parsing article links only
         """
-        for link in self.seed_urls:
-            response = make_request(link, self.config)
-            main_bs = BeautifulSoup(response.text, 'lxml')
-            for url in main_bs.find_all('a'):
-                link = self._extract_url(url)
-                if len(self.urls) < self.config.get_num_articles() and link.startswith('news/'):
-                    self.urls.append('https://orenday.ru/' + link)
+        main_bs = BeautifulSoup(seed_page, 'lxml', parse_only=ARTICLE_LINK_STRAINER)
+        parsed_seed = urlparse(seed_url)
+        for url in main_bs.find_all('a'):
+            yield f'{parsed_seed.scheme}://{parsed_seed.netloc}/{self._extract_url(url)}'
+
+    def _add_urls(self, candidates: Iterator[str]) -> None:
+        """
+        Stores new article URLs until the quota is met
+        """
+        if len(self.urls) >= self.config.get_num_articles():
+            return
+        seen = set(self.urls)
+        for url in candidates:
+            if url in seen:
+                continue
+            seen.add(url)
+            self.urls.append(url)
+            if len(self.urls) >= self.config.get_num_articles():
+                return
+
+    def _collect_urls(self, seed_url: str, seed_page: str) -> None:
+        """
+        Stores article URLs found on a seed page
+        """
+        self._add_urls(self._extract_article_urls(seed_url, seed_page))
 
     def get_search_urls(self) -> list:
         """
@@ -232,6 +638,191 @@ class Crawler:
         return self.seed_urls
 
 
+class VisitedURLs:
+    """
+    Set of visited URLs storing an 8-byte digest instead of each URL
+    """
+
+    def __init__(self, digests: Optional[list[str]] = None) -> None:
+        """
+        Initializes an instance of the VisitedURLs class
+        """
+        self._digests = {bytes.fromhex(digest) for digest in digests or []}
+
+    @staticmethod
+    def _digest(url: str) -> bytes:
+        """
+        Computes the digest identifying the url
+        """
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest()
+
+    def add(self, url: str) -> bool:
+        """
+        Marks the url as visited, returns False if it already was
+        """
+        digest = self._digest(url)
+        if digest in self._digests:
+            return False
+        self._digests.add(digest)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        """
+        Checks whether the url was visited
+        """
+        return self._digest(url) in self._digests
+
+    def __len__(self) -> int:
+        """
+        Retrieve the number of visited URLs
+        """
+        return len(self._digests)
+
+    def to_list(self) -> list[str]:
+        """
+        Retrieve digests in a JSON serializable form
+        """
+        return sorted(digest.hex() for digest in self._digests)
+
+
+class CrawlerRecursive(Crawler):
+    """
+    Crawler following links from seed pages to find more articles
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self,
+                 config: Config,
+                 max_depth: int = CRAWL_DEPTH_LIMIT,
+                 max_pages_per_depth: int = CRAWL_PAGES_PER_DEPTH_LIMIT,
+                 request_budget: int = CRAWL_REQUEST_BUDGET,
+                 checkpoint_path: Optional[Path] = None) -> None:
+        """
+        Initializes an instance of the CrawlerRecursive class
+        """
+        super().__init__(config)
+        self.max_depth = max_depth
+        self.max_pages_per_depth = max_pages_per_depth
+        self.request_budget = request_budget
+        self.checkpoint_path = checkpoint_path
+        self.requests_made = 0
+        self._pages_per_depth: dict[int, int] = {}
+        self._frontier: list[tuple[int, int, int, str]] = []
+        self._pushed = 0
+        self._visited = VisitedURLs()
+        self._listing_sections = {self._get_section(seed_url) for seed_url in self.seed_urls}
+        if checkpoint_path and checkpoint_path.exists():
+            self._load_checkpoint(checkpoint_path)
+        else:
+            for seed_url in self.seed_urls:
+                self._push(seed_url, 0)
+
+    @staticmethod
+    def _get_section(url: str) -> str:
+        """
+        Retrieve the first segment of the url path
+        """
+        return urlparse(url).path.strip('/').split('/')[0]
+
+    def _get_priority(self, url: str, depth: int) -> int:
+        """
+        Orders pages by depth, preferring pages from the sections of seed pages
+        """
+        return depth * 2 + (0 if self._get_section(url) in self._listing_sections else 1)
+
+    def _push(self, url: str, depth: int) -> None:
+        """
+        Adds a page to the frontier unless it was already seen
+        """
+        if self._visited.add(url):
+            priority = self._get_priority(url, depth)
+            heapq.heappush(self._frontier, (priority, self._pushed, depth, url))
+            self._pushed += 1
+
+    def _has_quota(self) -> bool:
+        """
+        Checks whether more articles and requests are allowed
+        """
+        return (len(self.urls) < self.config.get_num_articles()
+                and self.requests_made < self.request_budget)
+
+    def find_articles(self) -> None:
+        """
+        Finds articles
+        """
+        while self._frontier and self._has_quota():
+            _, _, depth, page_url = heapq.heappop(self._frontier)
+            if self._pages_per_depth.get(depth, 0) >= self.max_pages_per_depth:
+                continue
+            self._pages_per_depth[depth] = self._pages_per_depth.get(depth, 0) + 1
+            self.requests_made += 1
+            response = make_request(page_url, self.config)
+            self._collect_links(page_url, response.text, depth)
+            if self.checkpoint_path and self.requests_made % CRAWL_CHECKPOINT_INTERVAL == 0:
+                self.save_checkpoint(self.checkpoint_path)
+        if self.checkpoint_path:
+            self.save_checkpoint(self.checkpoint_path)
+
+    @staticmethod
+    def _normalize_link(page_url: str, link: str) -> str:
+        """
+        Makes the link absolute, article links of the site are relative to its root
+        """
+        if ARTICLE_URL_PATTERN.match(link):
+            link = f'/{link}'
+        return urldefrag(urljoin(page_url, link)).url
+
+    def _collect_links(self, page_url: str, page: str, depth: int) -> None:
+        """
+        Stores article URLs and puts other pages of the site to the frontier
+        """
+        page_bs = BeautifulSoup(page, 'lxml')
+        netloc = urlparse(page_url).netloc
+        for link_bs in page_bs.find_all('a'):
+            url = self._normalize_link(page_url, self._extract_url(link_bs))
+            parsed_url = urlparse(url)
+            if parsed_url.netloc != netloc:
+                continue
+            if ARTICLE_URL_PATTERN.match(parsed_url.path.lstrip('/')):
+                if len(self.urls) < self.config.get_num_articles() and self._visited.add(url):
+                    self.urls.append(url)
+            elif depth < self.max_depth:
+                self._push(url, depth + 1)
+
+    def save_checkpoint(self, path: Path) -> None:
+        """
+        Saves the state of the crawl to resume it later
+        """
+        state = {
+            'urls': self.urls,
+            'frontier': self._frontier,
+            'pushed': self._pushed,
+            'visited': self._visited.to_list(),
+            'requests_made': self.requests_made,
+            'pages_per_depth': self._pages_per_depth
+        }
+        tmp_path = path.with_suffix('.tmp')
+        with tmp_path.open('w', encoding='utf-8') as checkpoint_file:
+            json.dump(state, checkpoint_file)
+        tmp_path.replace(path)
+
+    def _load_checkpoint(self, path: Path) -> None:
+        """
+        Restores the state of an interrupted crawl
+        """
+        with path.open(encoding='utf-8') as checkpoint_file:
+            state = json.load(checkpoint_file)
+        self.urls = state['urls']
+        self._frontier = [(int(priority), int(order), int(depth), str(url))
+                          for priority, order, depth, url in state['frontier']]
+        heapq.heapify(self._frontier)
+        self._pushed = state['pushed']
+        self._visited = VisitedURLs(state['visited'])
+        self.requests_made = state['requests_made']
+        self._pages_per_depth = {int(depth): pages
+                                 for depth, pages in state['pages_per_depth'].items()}
+
+
 class HTMLParser:
     """
     ArticleParser implementation
@@ -250,9 +841,9 @@ class HTMLParser:
         """
         Finds text of article
         """
-        text_bs = article_soup.find_all('p')
-        for t in text_bs:
-            self.article.text += t.text
+        separator = '\n' if self.config.get_preserve_paragraphs() else ''
+        self.article.text += separator.join(paragraph.text
+                                            for paragraph in article_soup.find_all('p'))
 
     def _fill_article_with_meta_information(self, article_soup: BeautifulSoup) -> None:
         """
@@ -282,19 +873,218 @@ class HTMLParser:
         Parses each article
         """
         page = make_request(self.full_url, self.config)
-        articles = BeautifulSoup(page.content, "lxml")
+        return self._parse_page(page.content)
+
+    def _parse_page(self, content: Union[bytes, str]) -> Union[Article, bool, list]:
+        """
+        Fills the article with the data of a downloaded page,
+        building the tree only for elements the article is filled from
+        """
+        articles = BeautifulSoup(content, "lxml", parse_only=ARTICLE_CONTENT_STRAINER)
         self._fill_article_with_text(articles)
         self._fill_article_with_meta_information(articles)
         return self.article
 
 
-def prepare_environment(base_path: Union[Path, str]) -> None:
+class CrawlIndex:
+    """
+    Persisted mapping of collected article URLs to their ids
+    """
+
+    def __init__(self, base_path: Path) -> None:
+        """
+        Initializes an instance of the CrawlIndex class
+        """
+        self._base_path = base_path
+        self._path = base_path / CRAWL_INDEX_FILE_NAME
+        self._ids = self._load()
+
+    def _load(self) -> dict[str, int]:
+        """
+        Loads the index, rebuilding it from meta files if it is absent,
+        and keeps only ids forming a sequence 1..N of non-empty articles
+        """
+        if self._path.exists():
+            with self._path.open(encoding='utf-8') as index_file:
+                ids: dict[str, int] = json.load(index_file)
+        else:
+            ids = {}
+            for meta_path in self._base_path.glob('*_meta.json'):
+                with meta_path.open(encoding='utf-8') as meta_file:
+                    meta = json.load(meta_file)
+                if meta.get('url'):
+                    ids[meta['url']] = meta['id']
+
+        by_id = {article_id: url for url, article_id in ids.items()}
+        valid = {}
+        for article_id in range(1, len(by_id) + 1):
+            raw_path = self._base_path / f'{article_id}_raw.txt'
+            if article_id not in by_id or not raw_path.exists() or not raw_path.stat().st_size:
+                break
+            valid[by_id[article_id]] = article_id
+        return valid
+
+    def __contains__(self, url: str) -> bool:
+        """
+        Checks whether the url has already been collected
+        """
+        return url in self._ids
+
+    def get_next_id(self) -> int:
+        """
+        Retrieve the id for the next collected article
+        """
+        return len(self._ids) + 1
+
+    def add(self, url: str, article_id: int) -> None:
+        """
+        Registers a collected article
+        """
+        self._ids[url] = article_id
+
+    def save(self) -> None:
+        """
+        Saves the index so that an interrupted write does not corrupt it
+        """
+        tmp_path = self._path.with_suffix('.tmp')
+        with tmp_path.open('w', encoding='utf-8') as index_file:
+            json.dump(self._ids, index_file, indent=4, ensure_ascii=False)
+        tmp_path.replace(self._path)
+
+
+def prepare_environment(base_path: Union[Path, str], incremental: bool = False) -> None:
     """
     Creates ASSETS_PATH folder if no created and removes existing folder
+    unless previously collected articles should be kept
     """
-    if base_path.exists():
+    base_path = Path(base_path)
+    if base_path.exists() and not incremental:
         shutil.rmtree(base_path)
-    base_path.mkdir(parents=True)
+    base_path.mkdir(parents=True, exist_ok=True)
+
+
+def parse_article_page(url: str,
+                       article_id: int,
+                       content: bytes,
+                       config: Config) -> Union[Article, bool, list]:
+    """
+    Parse stage: fills an article from a downloaded page,
+    defined at module level to be run in worker processes
+    """
+    parser = HTMLParser(full_url=url, article_id=article_id, config=config)
+    return parser._parse_page(content)  # pylint: disable=protected-access
+
+
+def fetch_pages(urls: list[str],
+                config: Config,
+                article_ids: list[int],
+                pages: queue.Queue,
+                stop: threading.Event) -> None:
+    """
+    Fetch stage: downloads pages with a pool of threads and puts them to the queue
+    in the order of urls, waiting while the queue is full
+    """
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        with ThreadPoolExecutor(max_workers=config.get_max_workers()) as executor:
+            pending = zip(article_ids, urls)
+            downloads: deque = deque()
+            while True:
+                while (len(downloads) < config.get_max_workers()
+                       and (next_url := next(pending, None)) is not None):
+                    article_id, url = next_url
+                    downloads.append((url, article_id, executor.submit(make_request, url, config)))
+                if not downloads:
+                    break
+                url, article_id, download = downloads.popleft()
+                if not put((url, article_id, download.result().content)):
+                    return
+    except Exception as error:  # pylint: disable=broad-except
+        put(error)
+        return
+    put(None)
+
+
+def collect_articles(urls: list[str],
+                     config: Config,
+                     first_id: int = 1,
+                     article_ids: Optional[list[int]] = None
+                     ) -> Iterator[Union[Article, bool, list]]:
+    """
+    Downloads articles with a pool of threads and parses them with a pool of processes,
+    yielding them in the order of urls so that article ids do not depend
+    on which request finishes first; ids are numbered from first_id
+    unless every url is given its id
+    """
+    if article_ids is None:
+        article_ids = list(range(first_id, first_id + len(urls)))
+    pages: queue.Queue = queue.Queue(maxsize=PARSE_QUEUE_SIZE)
+    stop = threading.Event()
+    fetcher = threading.Thread(target=fetch_pages,
+                               args=(urls, config, article_ids, pages, stop),
+                               daemon=True)
+    fetcher.start()
+    try:
+        if config.get_parse_workers() == 1:
+            while (page := pages.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                url, article_id, content = page
+                yield parse_article_page(url, article_id, content, config)
+            return
+
+        with ProcessPoolExecutor(max_workers=config.get_parse_workers()) as executor:
+            parsed: deque = deque()
+            while (page := pages.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                url, article_id, content = page
+                parsed.append(executor.submit(parse_article_page, url, article_id, content, config))
+                if len(parsed) >= 2 * config.get_parse_workers():
+                    yield parsed.popleft().result()
+            while parsed:
+                yield parsed.popleft().result()
+    finally:
+        stop.set()
+        fetcher.join()
+
+
+def scrape(config: Config, base_path: Path) -> None:
+    """
+    Collects articles into base_path, skipping already collected ones
+    in incremental mode
+    """
+    prepare_environment(base_path, config.get_incremental())
+    index = CrawlIndex(base_path)
+    checkpoint_path = base_path / CRAWL_CHECKPOINT_FILE_NAME
+    crawler = CrawlerRecursive(config=config, checkpoint_path=checkpoint_path) \
+        if config.get_recursive_crawl() else Crawler(config=config)
+    crawler.find_articles()
+    # ids follow the order of the crawl, only the order of requests depends on hosts
+    new_ids = {url: article_id for article_id, url in enumerate(
+        (url for url in crawler.urls if url not in index), start=index.get_next_id())}
+    schedule = config.get_rate_limiter().interleave(list(new_ids))
+    articles = collect_articles(schedule, config,
+                                article_ids=[new_ids[url] for url in schedule])
+    with ArticleWriter(background=True, path=base_path) as writer:
+        for url, text in zip(schedule, articles):
+            if isinstance(text, Article):
+                writer.write(text)
+                index.add(url, text.article_id)
+    index.save()
+    cache = config.get_response_cache()
+    if cache:
+        cache.save()
+    # the crawl is over, the next one starts from the seed pages again
+    checkpoint_path.unlink(missing_ok=True)
 
 
 def main() -> None:
@@ -302,15 +1092,8 @@ def main() -> None:
     Entrypoint for scrapper module
     """
     config = Config(path_to_config=CRAWLER_CONFIG_PATH)
-    prepare_environment(ASSETS_PATH)
-    crawler = Crawler(config=config)
-    crawler.find_articles()
-    for idx, url in enumerate(crawler.urls):
-        parser = HTMLParser(full_url=url, article_id=idx + 1, config=config)
-        text = parser.parse()
-        if isinstance(text, Article):
-            to_raw(text)
-            to_meta(text)
+    scrape(config, ASSETS_PATH)
+    config.get_session().close()
 
 
 if __name__ == "__main__":
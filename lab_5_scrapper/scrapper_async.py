@@ -0,0 +1,148 @@
+"""
+Asynchronous crawler implementation: requests go through the response cache,
+the per-host rate limiter and the retry policy of the config, as in the scrapper
+"""
+import asyncio
+from pathlib import Path
+from typing import Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    print('No libraries installed. Failed to import.')
+
+from core_utils.article.article import Article
+from core_utils.article.io import ArticleWriter
+from core_utils.constants import (ASSETS_PATH, ASYNC_CONNECTIONS_LIMIT,
+                                  CRAWLER_CONFIG_PATH, RETRY_STATUS_CODES)
+from lab_5_scrapper.http_cache import CacheMissError
+from lab_5_scrapper.scrapper import (Config, Crawler, CrawlIndex, HTMLParser,
+                                     prepare_environment)
+
+
+def make_session(config: Config) -> aiohttp.ClientSession:
+    """
+    Creates a session sharing connections between all requests of the crawl
+    """
+    connector = aiohttp.TCPConnector(limit=ASYNC_CONNECTIONS_LIMIT,
+                                     limit_per_host=config.get_max_workers_per_host(),
+                                     ssl=None if config.get_verify_certificate() else False)
+    return aiohttp.ClientSession(connector=connector,
+                                 headers=config.get_headers(),
+                                 timeout=aiohttp.ClientTimeout(total=config.get_timeout()))
+
+
+async def make_request_async(url: str, session: aiohttp.ClientSession, config: Config) -> bytes:
+    """
+    Delivers the body of a response without blocking the event loop,
+    retrying requests rejected by an overloaded server
+    and raising aiohttp.ClientResponseError for other failed ones
+    """
+    cache = config.get_response_cache()
+    cached = cache.get(url) if cache else None
+    if config.get_cache_mode() == 'offline':
+        if not cached:
+            raise CacheMissError(url)
+        return cached.body
+
+    headers = cached.get_conditional_headers() if cached else {}
+    attempt = 0
+    while True:
+        # the limiter may read robots.txt on the first request to a host
+        delay = await asyncio.to_thread(config.get_rate_limiter().reserve, url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with session.get(url, headers=headers) as response:
+            if (response.status not in RETRY_STATUS_CODES
+                    or attempt >= config.get_max_retries()):
+                if cache and cached and response.status == 304:
+                    cache.refresh(url)
+                    return cached.body
+                response.raise_for_status()
+                body = await response.read()
+                if cache and response.status == 200:
+                    cache.store_content(url, body, response.headers)
+                return body
+        await asyncio.sleep(config.get_retry_backoff() * 2 ** attempt)
+        attempt += 1
+
+
+class AsyncCrawler(Crawler):
+    """
+    Crawler requesting all seed pages at once
+    """
+
+    async def find_articles_async(self, session: aiohttp.ClientSession) -> None:
+        """
+        Finds articles
+        """
+        pages = await asyncio.gather(*(make_request_async(seed_url, session, self.config)
+                                       for seed_url in self.seed_urls))
+        for seed_url, page in zip(self.seed_urls, pages):
+            self._collect_urls(seed_url, page.decode('utf-8', errors='replace'))
+
+
+class AsyncHTMLParser(HTMLParser):
+    """
+    ArticleParser downloading the page on the event loop
+    """
+
+    async def parse_async(self, session: aiohttp.ClientSession) -> Union[Article, bool, list]:
+        """
+        Parses each article, a page that cannot be downloaded is not an article
+        """
+        try:
+            content = await make_request_async(self.full_url, session, self.config)
+        except aiohttp.ClientResponseError:
+            return False
+        return self._parse_page(content)
+
+
+async def collect_articles_async(
+        urls: list[str],
+        config: Config,
+        session: aiohttp.ClientSession,
+        first_id: int = 1
+) -> list[Union[Article, bool, list]]:
+    """
+    Parses all articles concurrently, keeping them in the order of urls
+    """
+    parsers = [AsyncHTMLParser(full_url=url, article_id=idx, config=config)
+               for idx, url in enumerate(urls, start=first_id)]
+    return list(await asyncio.gather(*(parser.parse_async(session) for parser in parsers)))
+
+
+async def crawl(config: Config, base_path: Path) -> None:
+    """
+    Collects articles into base_path, skipping already collected ones
+    in incremental mode
+    """
+    prepare_environment(base_path, config.get_incremental())
+    index = CrawlIndex(base_path)
+    async with make_session(config) as session:
+        crawler = AsyncCrawler(config=config)
+        await crawler.find_articles_async(session)
+        new_urls = [url for url in crawler.urls if url not in index]
+        articles = await collect_articles_async(new_urls, config, session,
+                                                first_id=index.get_next_id())
+    with ArticleWriter(path=base_path) as writer:
+        for url, article in zip(new_urls, articles):
+            if isinstance(article, Article):
+                writer.write(article)
+                index.add(url, article.article_id)
+    index.save()
+    cache = config.get_response_cache()
+    if cache:
+        cache.save()
+
+
+def main() -> None:
+    """
+    Entrypoint for asynchronous scrapper module
+    """
+    config = Config(path_to_config=CRAWLER_CONFIG_PATH)
+    asyncio.run(crawl(config, ASSETS_PATH))
+
+
+if __name__ == "__main__":
+    main()
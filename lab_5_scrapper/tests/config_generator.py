@@ -5,6 +5,7 @@ Generates config with flexible params for testing purposes
 import json
 import shutil
 from pathlib import Path
+from typing import Optional
 
 from config.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
 
@@ -16,7 +17,8 @@ def generate_config(seed_urls: list,
                     timeout: int,
                     should_verify_certificate: bool,
                     headless_mode: bool,
-                    path: Path = TEST_CRAWLER_CONFIG_PATH):
+                    path: Path = TEST_CRAWLER_CONFIG_PATH,
+                    additional_params: Optional[dict] = None):
     """
     Generates scrapper_config.py for testing
     """
@@ -27,6 +29,8 @@ def generate_config(seed_urls: list,
               'timeout': timeout,
               'should_verify_certificate': should_verify_certificate,
               'headless_mode': headless_mode}
+    if additional_params:
+        config.update(additional_params)
 
     if path.exists():
         shutil.rmtree(TEST_PATH)
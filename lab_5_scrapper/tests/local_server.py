@@ -0,0 +1,169 @@
+"""
+Local stand-in for the scrapped website to test crawlers offline
+"""
+import hashlib
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from config.test_params import TEST_CRAWLER_CONFIG_PATH
+from lab_5_scrapper.scrapper import Config
+from lab_5_scrapper.tests.config_generator import generate_config
+
+
+def generate_article_page(idx: int, paragraphs: int = 3) -> bytes:
+    """
+    Generates a page resembling a news article of the scrapped website
+    """
+    text = ''.join(f'<p>Абзац номер {number} новости {idx}. Текст новости.</p>'
+                   for number in range(1, paragraphs + 1))
+    return (f'<html><head><title>Новость {idx}</title></head><body>'
+            f'<div class="header"><p>Подписка на рассылку</p></div>'
+            f'<h1 class="title-news">Заголовок новости {idx}</h1>'
+            f'<div class="fright"><a rel="author" href="/authors/{idx}">Автор {idx}</a></div>'
+            f'<div class="text">{text}</div>'
+            f'</body></html>').encode('utf-8')
+
+
+def generate_seed_page(article_ids: list[int], next_page: Optional[str] = None) -> bytes:
+    """
+    Generates a page with links to news articles
+    """
+    links = ''.join(f'<li><a href="news/{idx}">Новость {idx}</a></li>' for idx in article_ids)
+    pagination = f'<a href="{next_page}#top">Дальше</a>' if next_page else ''
+    return (f'<html><body><a href="/about">О нас</a><ul>{links}</ul>{pagination}'
+            f'</body></html>').encode('utf-8')
+
+
+def generate_website(num_seeds: int,
+                     articles_per_seed: int,
+                     paginated: bool = False) -> dict[str, bytes]:
+    """
+    Generates seed pages under /seed/N/ and articles under /news/N,
+    paginated seed pages link to the next one
+    """
+    pages = {}
+    for seed in range(num_seeds):
+        article_ids = list(range(seed * articles_per_seed + 1,
+                                 (seed + 1) * articles_per_seed + 1))
+        next_page = f'/seed/{seed + 1}/' if paginated and seed + 1 < num_seeds else None
+        pages[f'/seed/{seed}/'] = generate_seed_page(article_ids, next_page)
+        for idx in article_ids:
+            pages[f'/news/{idx}'] = generate_article_page(idx)
+    return pages
+
+
+class LocalServer:
+    """
+    Serves a fixed set of pages over HTTP on a free local port
+    """
+
+    def __init__(self, pages: dict[str, bytes], failures: Optional[dict[str, int]] = None) -> None:
+        self.pages = pages
+        self.failures = Counter(failures or {})
+        self.hits: Counter = Counter()
+        self.not_modified: Counter = Counter()
+        self.connections: set[tuple] = set()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Responds with the stored page or 404
+            """
+            protocol_version = 'HTTP/1.1'
+
+            # pylint: disable=invalid-name
+            def do_GET(self) -> None:
+                """
+                Handles GET requests
+                """
+                server.hits[self.path] += 1
+                server.connections.add(self.client_address)
+                if server.failures[self.path] > 0:
+                    server.failures[self.path] -= 1
+                    self.send_response(503)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = server.pages.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                if self.headers.get('If-None-Match') == etag:
+                    server.not_modified[self.path] += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:  # pylint: disable=arguments-differ
+                """
+                Keeps test output clean
+                """
+
+        return Handler
+
+    @property
+    def base_url(self) -> str:
+        """
+        Root URL of the running server
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> None:
+        """
+        Starts serving pages in a background thread
+        """
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the server and releases the port
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> 'LocalServer':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+def generate_local_config(server: LocalServer,
+                          num_seeds: int,
+                          num_articles: int,
+                          **additional_params) -> Config:
+    """
+    Generates a config crawling the seed pages of the local server
+    """
+    generate_config(seed_urls=[f'{server.base_url}/seed/{seed}/' for seed in range(num_seeds)],
+                    num_articles=num_articles,
+                    headers={},
+                    encoding='utf-8',
+                    timeout=5,
+                    should_verify_certificate=True,
+                    headless_mode=True,
+                    additional_params=additional_params)
+    return Config(TEST_CRAWLER_CONFIG_PATH)
@@ -0,0 +1,142 @@
+"""
+Checks the recursive crawler on a paginated website
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.constants import (CRAWL_CHECKPOINT_FILE_NAME,
+                                  NUM_ARTICLES_UPPER_LIMIT)
+from lab_5_scrapper.scrapper import (CrawlerRecursive,
+                                     IncorrectRecursiveCrawlError,
+                                     NumberOfArticlesOutOfRangeError,
+                                     VisitedURLs, scrape)
+from lab_5_scrapper.tests.local_server import (LocalServer,
+                                               generate_local_config,
+                                               generate_website)
+
+
+class CrawlerRecursiveTest(unittest.TestCase):
+    """
+    Class for testing crawling from a single seed page
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalServer(generate_website(num_seeds=6, articles_per_seed=3,
+                                                   paginated=True))
+        self.server.start()
+        self.config = generate_local_config(self.server, num_seeds=1, num_articles=10)
+
+    @pytest.mark.stage_2_10_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_recursive_crawler_follows_pages(self):
+        """
+        Ensure articles are found beyond the seed page without refetching pages
+        """
+        crawler = CrawlerRecursive(self.config, max_depth=10)
+        crawler.find_articles()
+        self.assertEqual(crawler.urls,
+                         [f'{self.server.base_url}/news/{idx}' for idx in range(1, 11)])
+        self.assertEqual(max(self.server.hits.values()), 1)
+        self.assertEqual(crawler.requests_made, sum(self.server.hits.values()))
+
+    @pytest.mark.stage_2_10_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_recursive_crawler_respects_limits(self):
+        """
+        Ensure depth and request budget stop the crawl
+        """
+        crawler = CrawlerRecursive(self.config, max_depth=1)
+        crawler.find_articles()
+        self.assertNotIn('/seed/2/', self.server.hits)
+
+        crawler = CrawlerRecursive(self.config, max_depth=10, request_budget=2)
+        crawler.find_articles()
+        self.assertEqual(crawler.requests_made, 2)
+
+    @pytest.mark.stage_2_10_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_recursive_crawler_resumes_from_checkpoint(self):
+        """
+        Ensure an interrupted crawl continues where it stopped
+        """
+        checkpoint_path = TEST_PATH / 'checkpoint.json'
+        crawler = CrawlerRecursive(self.config, max_depth=10, request_budget=2,
+                                   checkpoint_path=checkpoint_path)
+        crawler.find_articles()
+        self.assertEqual(len(crawler.urls), 6)
+
+        resumed = CrawlerRecursive(self.config, max_depth=10, checkpoint_path=checkpoint_path)
+        resumed.find_articles()
+        self.assertEqual(len(resumed.urls), 10)
+        self.assertEqual(max(self.server.hits.values()), 1)
+
+    @pytest.mark.stage_2_10_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_absolute_article_links_are_collected(self):
+        """
+        Ensure an absolute link to an article is taken for an article at the depth limit
+        """
+        self.server.pages['/seed/0/'] = (f'<html><body><a href="news/1">1</a>'
+                                         f'<a href="{self.server.base_url}/news/2#comments">2</a>'
+                                         f'<a href="/news/3">3</a></body></html>').encode('utf-8')
+        crawler = CrawlerRecursive(self.config, max_depth=0)
+        crawler.find_articles()
+        self.assertEqual(crawler.urls,
+                         [f'{self.server.base_url}/news/{idx}' for idx in range(1, 4)])
+
+    @pytest.mark.stage_2_10_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_scrape_crawls_recursively_if_asked(self):
+        """
+        Ensure scrape() follows links beyond the seed page when the config asks for it
+        """
+        articles_path = TEST_PATH / 'articles'
+        scrape(self.config, articles_path)
+        self.assertEqual(len(list(articles_path.glob('*_raw.txt'))), 3)
+
+        config = generate_local_config(self.server, num_seeds=1, num_articles=10,
+                                       recursive_crawl=True)
+        scrape(config, articles_path)
+        self.assertEqual(len(list(articles_path.glob('*_raw.txt'))), 10)
+        self.assertFalse((articles_path / CRAWL_CHECKPOINT_FILE_NAME).exists())
+
+    @pytest.mark.stage_2_10_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_recursive_crawl_config_param(self):
+        """
+        Ensure the flag must be boolean and lifts the limit of articles
+        """
+        with self.assertRaises(IncorrectRecursiveCrawlError):
+            generate_local_config(self.server, num_seeds=1, num_articles=10,
+                                  recursive_crawl='yes')
+        with self.assertRaises(NumberOfArticlesOutOfRangeError):
+            generate_local_config(self.server, num_seeds=1,
+                                  num_articles=NUM_ARTICLES_UPPER_LIMIT + 1)
+
+        config = generate_local_config(self.server, num_seeds=1,
+                                       num_articles=NUM_ARTICLES_UPPER_LIMIT + 1,
+                                       recursive_crawl=True)
+        self.assertTrue(config.get_recursive_crawl())
+        self.assertEqual(config.get_num_articles(), NUM_ARTICLES_UPPER_LIMIT + 1)
+
+    @pytest.mark.stage_2_10_recursive_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_visited_urls_survive_serialization(self):
+        """
+        Ensure visited URLs are restored from their digests
+        """
+        visited = VisitedURLs()
+        self.assertTrue(visited.add('https://orenday.ru/news/1'))
+        self.assertFalse(visited.add('https://orenday.ru/news/1'))
+        restored = VisitedURLs(visited.to_list())
+        self.assertIn('https://orenday.ru/news/1', restored)
+        self.assertNotIn('https://orenday.ru/news/2', restored)
+        self.assertEqual(len(restored), 1)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,92 @@
+# pylint: disable=protected-access
+"""
+Checks that parsing only article elements gives the same article
+"""
+import shutil
+import unittest
+
+import pytest
+from bs4 import BeautifulSoup
+
+from config.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scrapper.scrapper import (Config, HTMLParser,
+                                     IncorrectPreserveParagraphsError)
+from lab_5_scrapper.tests.config_generator import generate_config
+from lab_5_scrapper.tests.local_server import generate_article_page
+
+PAGES = [
+    generate_article_page(1),
+    generate_article_page(2, paragraphs=50),
+    '<html><body><div class="fright"><span>Без автора</span></div>'
+    '<p>Текст <b>с разметкой</b> и <a href="/x">ссылкой</a></p></body></html>'.encode('utf-8'),
+    '<html><body><h1 class="big title-news">Заголовок</h1><section><div>'
+    '<p>Вложенный абзац</p></div></section><div class="meta fright">'
+    '<a rel="author">Иван <i>Петров</i></a><p>Подпись</p></div><p>Последний</p>'
+    '</body></html>'.encode('utf-8'),
+]
+
+
+class HTMLParserStrainerTest(unittest.TestCase):
+    """
+    Class for comparing strained parsing with parsing of the whole page
+    """
+
+    def setUp(self) -> None:
+        self.config = Config(CRAWLER_CONFIG_PATH)
+
+    @pytest.mark.stage_2_11_html_parser_strainer_check
+    @pytest.mark.lab_5_scrapper
+    def test_strained_parsing_matches_full_tree(self):
+        """
+        Ensure text and meta information do not depend on the parsing mode
+        """
+        for page in PAGES:
+            expected = HTMLParser('https://orenday.ru/news/1', 1, self.config)
+            full_tree = BeautifulSoup(page, 'lxml')
+            expected._fill_article_with_text(full_tree)
+            expected._fill_article_with_meta_information(full_tree)
+
+            parser = HTMLParser('https://orenday.ru/news/1', 1, self.config)
+            article = parser._parse_page(page)
+            self.assertEqual(article.get_raw_text(), expected.article.get_raw_text())
+            self.assertEqual(article.get_meta(), expected.article.get_meta())
+
+    @pytest.mark.stage_2_11_html_parser_strainer_check
+    @pytest.mark.lab_5_scrapper
+    def test_paragraphs_are_preserved(self):
+        """
+        Ensure paragraphs are separated by new lines only when configured
+        """
+        page = generate_article_page(3, paragraphs=1000)
+        paragraphs = ['Подписка на рассылку'] + [f'Абзац номер {number} новости 3. Текст новости.'
+                                                 for number in range(1, 1001)]
+
+        article = HTMLParser('https://orenday.ru/news/3', 3, self.config)._parse_page(page)
+        self.assertEqual(article.get_raw_text(), ''.join(paragraphs))
+
+        self.config._preserve_paragraphs = True
+        article = HTMLParser('https://orenday.ru/news/3', 3, self.config)._parse_page(page)
+        self.assertEqual(article.get_raw_text(), '\n'.join(paragraphs))
+
+    @pytest.mark.stage_2_11_html_parser_strainer_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_preserve_paragraphs_config_param(self):
+        """
+        Ensure a non-boolean preserve_paragraphs flag is rejected with its own error
+        """
+        for incorrect_flag in ('false', 0, [True]):
+            generate_config(seed_urls=self.config.get_seed_urls(),
+                            num_articles=self.config.get_num_articles(),
+                            headers=self.config.get_headers(),
+                            encoding=self.config.get_encoding(),
+                            timeout=self.config.get_timeout(),
+                            should_verify_certificate=self.config.get_verify_certificate(),
+                            headless_mode=self.config.get_headless_mode(),
+                            additional_params={'preserve_paragraphs': incorrect_flag})
+            with self.assertRaises(IncorrectPreserveParagraphsError):
+                Config(TEST_CRAWLER_CONFIG_PATH)
+
+    def tearDown(self) -> None:
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,85 @@
+# pylint: disable=protected-access
+"""
+Checks the pipeline of fetching pages in threads and parsing them in processes
+"""
+import pickle
+import unittest
+
+import pytest
+
+from lab_5_scrapper.scrapper import HTMLParser, collect_articles
+from lab_5_scrapper.tests.local_server import (LocalServer,
+                                               generate_local_config,
+                                               generate_website)
+
+
+class ParseStageTest(unittest.TestCase):
+    """
+    Class for testing the fetch and parse stages of collect_articles
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalServer(generate_website(num_seeds=1, articles_per_seed=60))
+        self.server.start()
+        self.config = generate_local_config(self.server, num_seeds=1, num_articles=60,
+                                            max_workers=4, max_workers_per_host=4,
+                                            parse_workers=2)
+        self.urls = [f'{self.server.base_url}/news/{idx}' for idx in range(1, 61)]
+
+    @pytest.mark.stage_2_12_parse_stage_check
+    @pytest.mark.lab_5_scrapper
+    def test_config_is_sent_to_workers(self):
+        """
+        Ensure the config survives pickling without its connections
+        """
+        config = pickle.loads(pickle.dumps(self.config))
+        self.assertEqual(config.get_seed_urls(), self.config.get_seed_urls())
+        self.assertEqual(config.get_parse_workers(), 2)
+        self.assertIsNone(config.get_response_cache())
+        self.assertIsNot(config.get_session(), self.config.get_session())
+
+    @pytest.mark.stage_2_12_parse_stage_check
+    @pytest.mark.lab_5_scrapper
+    def test_workers_do_not_create_connections(self):
+        """
+        Ensure an unpickled config creates its session and limiters only when asked for
+        """
+        config = pickle.loads(pickle.dumps(self.config))
+        self.assertIsNone(config._session)
+        self.assertIsNone(config._host_limiter)
+        self.assertIsNone(config._rate_limiter)
+        self.assertIs(config.get_session(), config.get_session())
+        self.assertIs(config.get_rate_limiter(), config.get_rate_limiter())
+
+    @pytest.mark.stage_2_12_parse_stage_check
+    @pytest.mark.lab_5_scrapper
+    def test_parse_workers_match_parser(self):
+        """
+        Ensure articles parsed in other processes keep the order of urls
+        and match those parsed by HTMLParser
+        """
+        urls = self.urls[:20]
+        expected_articles = [HTMLParser(url, idx, self.config).parse()
+                             for idx, url in enumerate(urls, start=5)]
+        for parse_workers in (1, 2):
+            self.config._parse_workers = parse_workers
+            articles = list(collect_articles(urls, self.config, first_id=5))
+            self.assertEqual([item.article_id for item in articles], list(range(5, 25)))
+            for article, url, expected in zip(articles, urls, expected_articles):
+                self.assertEqual(article.url, url)
+                self.assertEqual(article.get_raw_text(), expected.get_raw_text())
+                self.assertEqual(article.get_meta(), expected.get_meta())
+
+    @pytest.mark.stage_2_12_parse_stage_check
+    @pytest.mark.lab_5_scrapper
+    def test_fetching_waits_for_parsing(self):
+        """
+        Ensure pages are not downloaded far ahead of the consumer
+        """
+        articles = collect_articles(self.urls, self.config)
+        next(articles)
+        articles.close()
+        self.assertLess(sum(self.server.hits.values()), len(self.urls))
+
+    def tearDown(self) -> None:
+        self.server.stop()
@@ -0,0 +1,185 @@
+# pylint: disable=protected-access
+"""
+Checks throttling of requests with a fake clock
+"""
+import json
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
+from lab_5_scrapper.rate_limiter import HostRateLimiter, parse_crawl_delay
+from lab_5_scrapper.scrapper import (Config, Crawler, IncorrectRateLimitError,
+                                     make_request, scrape)
+from lab_5_scrapper.tests.config_generator import generate_config
+from lab_5_scrapper.tests.local_server import (LocalServer,
+                                               generate_local_config,
+                                               generate_website)
+
+ARTICLES_PATH = TEST_PATH / 'articles'
+ROBOTS_TXT = 'User-agent: *\nCrawl-delay: 2\nDisallow: /private\n'
+
+
+class FakeClock:
+    """
+    Clock that moves only when somebody sleeps
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        """
+        Current time
+        """
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Moves the clock forward
+        """
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTest(unittest.TestCase):
+    """
+    Class for testing token buckets, crawl delays and interleaving of hosts
+    """
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.robots_requests: list[str] = []
+
+    def _fetch_robots(self, url: str) -> str:
+        self.robots_requests.append(url)
+        return ROBOTS_TXT if url.startswith('https://slow.ru') else ''
+
+    def _make_limiter(self, rate: float, burst: int = 1) -> HostRateLimiter:
+        return HostRateLimiter(rate, burst, self._fetch_robots,
+                               clock=self.clock.time, sleep=self.clock.sleep)
+
+    @pytest.mark.stage_2_13_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_bucket_allows_burst_then_spaces_requests(self):
+        """
+        Ensure requests after the burst are spaced by the rate
+        """
+        limiter = self._make_limiter(rate=4, burst=2)
+        moments = []
+        for _ in range(6):
+            limiter.wait('https://fast.ru/news/1')
+            moments.append(self.clock.now)
+        self.assertEqual(moments, [0, 0, 0.25, 0.5, 0.75, 1.0])
+
+    @pytest.mark.stage_2_13_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_hosts_are_limited_separately(self):
+        """
+        Ensure waiting for one host does not slow down another
+        """
+        limiter = self._make_limiter(rate=1)
+        limiter.wait('https://fast.ru/news/1')
+        limiter.wait('https://other.ru/news/1')
+        self.assertEqual(self.clock.sleeps, [])
+        limiter.wait('https://fast.ru/news/2')
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    @pytest.mark.stage_2_13_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawl_delay_lowers_rate(self):
+        """
+        Ensure the crawl delay of robots.txt is respected and robots.txt is read once
+        """
+        self.assertEqual(parse_crawl_delay(ROBOTS_TXT, 'Mozilla/5.0'), 2.0)
+        self.assertIsNone(parse_crawl_delay('', '*'))
+
+        limiter = self._make_limiter(rate=10)
+        for idx in range(3):
+            limiter.wait(f'https://slow.ru/news/{idx}')
+        self.assertEqual(self.clock.sleeps, [2.0, 2.0])
+        self.assertEqual(limiter.get_interval('https://fast.ru/news/1'), 0.1)
+        self.assertEqual(self.robots_requests,
+                         ['https://slow.ru/robots.txt', 'https://fast.ru/robots.txt'])
+
+        unlimited = self._make_limiter(rate=0)
+        self.assertEqual(unlimited.get_interval('https://fast.ru/news/1'), 0)
+        self.assertEqual(unlimited.get_interval('https://slow.ru/news/1'), 2.0)
+
+    @pytest.mark.stage_2_13_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_interleave_follows_host_rates(self):
+        """
+        Ensure urls of a slow host are spread between urls of a fast one
+        """
+        limiter = self._make_limiter(rate=1)
+        urls = [f'https://slow.ru/news/{idx}' for idx in range(3)]
+        urls += [f'https://fast.ru/news/{idx}' for idx in range(5)]
+        self.assertEqual(limiter.interleave(urls), [
+            'https://slow.ru/news/0', 'https://fast.ru/news/0', 'https://fast.ru/news/1',
+            'https://slow.ru/news/1', 'https://fast.ru/news/2', 'https://fast.ru/news/3',
+            'https://slow.ru/news/2', 'https://fast.ru/news/4',
+        ])
+        self.assertEqual(self.clock.sleeps, [])
+
+    @pytest.mark.stage_2_13_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_article_ids_follow_crawl_order(self):
+        """
+        Ensure requests are interleaved by hosts while ids keep the order of the crawl
+        """
+        with LocalServer(generate_website(num_seeds=2, articles_per_seed=3)) as server:
+            port = server.base_url.rsplit(':', 1)[1]
+            generate_config(seed_urls=[f'http://127.0.0.1:{port}/seed/0/',
+                                       f'http://localhost:{port}/seed/1/'],
+                            num_articles=6, headers={}, encoding='utf-8', timeout=5,
+                            should_verify_certificate=True, headless_mode=True,
+                            additional_params={'rate_limit': 50})
+            config = Config(TEST_CRAWLER_CONFIG_PATH)
+            crawler = Crawler(config)
+            crawler.find_articles()
+            self.assertNotEqual(config.get_rate_limiter().interleave(crawler.urls),
+                                crawler.urls)
+            scrape(config, ARTICLES_PATH)
+
+        for article_id, url in enumerate(crawler.urls, start=1):
+            with (ARTICLES_PATH / f'{article_id}_meta.json').open(encoding='utf-8') as meta_file:
+                self.assertEqual(json.load(meta_file)['url'], url)
+
+    @pytest.mark.stage_2_13_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_rate_limit(self):
+        """
+        Ensure incorrect throttling settings are rejected
+        """
+        for params in ({'rate_limit': -1}, {'rate_limit': '1'}, {'rate_burst': 0},
+                       {'respect_crawl_delay': 'yes'}):
+            generate_config(seed_urls=['https://orenday.ru/news/'], num_articles=5,
+                            headers={}, encoding='utf-8', timeout=5,
+                            should_verify_certificate=True, headless_mode=True,
+                            additional_params=params)
+            with self.assertRaises(IncorrectRateLimitError):
+                Config(TEST_CRAWLER_CONFIG_PATH)
+
+    @pytest.mark.stage_2_13_rate_limiter_check
+    @pytest.mark.lab_5_scrapper
+    def test_make_request_reads_robots(self):
+        """
+        Ensure make_request throttles a host by the crawl delay of its robots.txt
+        """
+        pages = generate_website(num_seeds=1, articles_per_seed=2)
+        pages['/robots.txt'] = b'User-agent: *\nCrawl-delay: 1\n'
+        with LocalServer(pages) as server:
+            config = generate_local_config(server, num_seeds=1, num_articles=2,
+                                           respect_crawl_delay=True)
+            make_request(f'{server.base_url}/news/1', config)
+            interval = config.get_rate_limiter().get_interval(f'{server.base_url}/news/2')
+            hits = server.hits['/robots.txt']
+        self.assertEqual(interval, 1.0)
+        self.assertEqual(hits, 1)
+
+    def tearDown(self) -> None:
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -10,10 +10,11 @@ import pytest
 
 from config.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
 from core_utils.constants import (CRAWLER_CONFIG_PATH, TIMEOUT_LOWER_LIMIT,
-                                  TIMEOUT_UPPER_LIMIT)
+                                  TIMEOUT_UPPER_LIMIT, WORKERS_UPPER_LIMIT)
 from lab_5_scrapper import scrapper
 from lab_5_scrapper.scrapper import (IncorrectEncodingError,
                                      IncorrectHeadersError,
+                                     IncorrectMaxWorkersError,
                                      IncorrectNumberOfArticlesError,
                                      IncorrectSeedURLError,
                                      IncorrectTimeoutError,
@@ -81,6 +82,7 @@ class CrawlerConfigCheck(ExtendedTestCase):
         self.encoding_incorrect = [5, False, [1, 2, 3]]
         self.verify_incorrect = ['verify', {1: 2}, (1, 2)]
         self.headless_incorrect = ['false', {1: 4}, (1, 2, 3)]
+        self.max_workers_incorrect = [0, True, '4', WORKERS_UPPER_LIMIT + 1]
 
     @pytest.mark.mark4
     @pytest.mark.mark6
@@ -297,6 +299,47 @@ Headers must be a dictionary with string keys and string values"""
                                      scrapper.Config,
                                      TEST_CRAWLER_CONFIG_PATH)
 
+    @pytest.mark.stage_2_1_crawler_config_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_max_workers_config_param(self):
+        """
+        Checks that Config class returns error message and exit code 1 with incorrect config params
+        """
+        for param in ('max_workers', 'max_workers_per_host'):
+            for incorrect_workers in self.max_workers_incorrect:
+                generate_config(seed_urls=self.seed_urls_correct,
+                                num_articles=self.num_articles_correct,
+                                timeout=self.timeout_correct,
+                                headers=self.headers_correct,
+                                encoding=self.encoding_correct,
+                                should_verify_certificate=self.should_verify_certificate,
+                                headless_mode=self.headless_mode,
+                                additional_params={param: incorrect_workers})
+
+                error_message = """Checking that scrapper can handle incorrect number of workers.
+    Number of workers must be a positive integer within the limit"""
+                self.assertRaisesWithMessage(error_message,
+                                             IncorrectMaxWorkersError,
+                                             scrapper.Config,
+                                             TEST_CRAWLER_CONFIG_PATH)
+
+    @pytest.mark.stage_2_1_crawler_config_check
+    @pytest.mark.lab_5_scrapper
+    def test_max_workers_default_to_sequential(self):
+        """
+        Checks that configs without worker params keep fetching sequentially
+        """
+        generate_config(seed_urls=self.seed_urls_correct,
+                        num_articles=self.num_articles_correct,
+                        timeout=self.timeout_correct,
+                        headers=self.headers_correct,
+                        encoding=self.encoding_correct,
+                        should_verify_certificate=self.should_verify_certificate,
+                        headless_mode=self.headless_mode)
+        config = scrapper.Config(TEST_CRAWLER_CONFIG_PATH)
+        self.assertEqual(config.get_max_workers(), 1)
+        self.assertEqual(config.get_max_workers_per_host(), 1)
+
     @pytest.mark.mark4
     @pytest.mark.mark6
     @pytest.mark.mark8
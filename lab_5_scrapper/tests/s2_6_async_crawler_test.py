@@ -0,0 +1,157 @@
+# pylint: disable=protected-access
+"""
+Concurrent and asynchronous crawling validation against a local website
+"""
+import asyncio
+import json
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.constants import ASSETS_PATH
+from lab_5_scrapper.http_cache import ResponseCache
+from lab_5_scrapper.scrapper import Crawler, HTMLParser, collect_articles
+from lab_5_scrapper.scrapper_async import (AsyncCrawler,
+                                           collect_articles_async, crawl,
+                                           make_session)
+from lab_5_scrapper.tests.local_server import (LocalServer,
+                                               generate_local_config,
+                                               generate_website)
+
+
+class AsyncCrawlerTest(unittest.TestCase):
+    """
+    Class for testing crawlers on a local stand-in of the website
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalServer(generate_website(num_seeds=4, articles_per_seed=3))
+        self.server.start()
+        self.config = generate_local_config(self.server, num_seeds=4, num_articles=10,
+                                            max_workers=4, max_workers_per_host=4)
+
+    async def _crawl(self) -> tuple[list[str], list]:
+        async with make_session(self.config) as session:
+            crawler = AsyncCrawler(self.config)
+            await crawler.find_articles_async(session)
+            articles = await collect_articles_async(crawler.urls, self.config, session)
+        return crawler.urls, articles
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_async_crawler_finds_same_urls(self):
+        """
+        Ensure AsyncCrawler collects the same urls as Crawler
+        """
+        crawler = Crawler(self.config)
+        crawler.find_articles()
+        urls, _ = asyncio.run(self._crawl())
+        self.assertEqual(len(urls), self.config.get_num_articles())
+        self.assertEqual(urls, crawler.urls)
+        self.assertEqual(urls[0], f'{self.server.base_url}/news/1')
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawler_stops_requesting_seeds(self):
+        """
+        Ensure seed pages are not requested once the quota is met
+        """
+        self.config._num_articles = 3
+        crawler = Crawler(self.config)
+        crawler.find_articles()
+        self.assertEqual(len(crawler.urls), 3)
+        self.assertEqual(sum(self.server.hits.values()), 1)
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawler_skips_duplicate_links(self):
+        """
+        Ensure an article linked several times is collected once
+        """
+        self.server.pages['/seed/0/'] = self.server.pages['/seed/0/'] * 2
+        crawler = Crawler(self.config)
+        crawler.find_articles()
+        self.assertEqual(len(set(crawler.urls)), len(crawler.urls))
+        self.assertEqual(len(crawler.urls), self.config.get_num_articles())
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_async_parser_matches_parser(self):
+        """
+        Ensure asynchronous parsing fills articles as HTMLParser does
+        """
+        urls, articles = asyncio.run(self._crawl())
+        for idx, (url, async_article) in enumerate(zip(urls, articles), start=1):
+            expected = HTMLParser(url, idx, self.config).parse()
+            self.assertEqual(async_article.article_id, idx)
+            self.assertEqual(async_article.get_meta(), expected.get_meta())
+            self.assertEqual(async_article.get_raw_text(), expected.get_raw_text())
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_concurrent_articles_keep_order(self):
+        """
+        Ensure concurrently collected articles get ids in the order of urls
+        """
+        crawler = Crawler(self.config)
+        crawler.find_articles()
+        articles = list(collect_articles(crawler.urls, self.config))
+        self.assertEqual([item.article_id for item in articles],
+                         list(range(1, len(crawler.urls) + 1)))
+        self.assertEqual([item.url for item in articles], crawler.urls)
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawl_saves_dataset(self):
+        """
+        Ensure crawl() saves raw and meta files for every article
+        """
+        asyncio.run(crawl(self.config, TEST_PATH))
+        for idx in range(1, self.config.get_num_articles() + 1):
+            self.assertTrue((TEST_PATH / f'{idx}_raw.txt').stat().st_size)
+            with (TEST_PATH / f'{idx}_meta.json').open(encoding='utf-8') as file:
+                self.assertEqual(json.load(file)['id'], idx)
+        self.assertEqual(sum(self.server.hits.values()), 4 + self.config.get_num_articles())
+
+    @pytest.mark.stage_2_6_async_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_async_requests_follow_config(self):
+        """
+        Ensure asynchronous requests are retried, revalidated with the response cache
+        and a failed page is not taken for an article
+        """
+        self.server.failures['/news/1'] = 1
+        del self.server.pages['/news/2']
+        self.config._cache_mode = 'revalidate'
+        self.config._response_cache = ResponseCache(TEST_PATH / 'http_cache', max_age=60,
+                                                    max_size=10 ** 6)
+        self.config._retry_backoff = 0
+        urls, articles = asyncio.run(self._crawl())
+        self.assertEqual(self.server.hits['/news/1'], 2)
+        self.assertEqual(articles[0].url, urls[0])
+        self.assertIs(articles[1], False)
+        self.assertFalse(self.server.not_modified)
+
+        asyncio.run(self._crawl())
+        self.assertEqual(sum(self.server.not_modified.values()),
+                         4 + self.config.get_num_articles() - 1)
+
+        async def replay() -> list:
+            async with make_session(self.config) as session:
+                return await collect_articles_async(urls[2:], self.config, session, first_id=3)
+
+        requests_made = sum(self.server.hits.values())
+        self.config._cache_mode = 'offline'
+        replayed = asyncio.run(replay())
+        self.assertEqual(sum(self.server.hits.values()), requests_made)
+        self.assertEqual([item.get_raw_text() for item in replayed],
+                         [item.get_raw_text() for item in articles[2:]])
+
+    def tearDown(self) -> None:
+        article.ASSETS_PATH = ASSETS_PATH
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,83 @@
+"""
+Checks that requests share a pooled session
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.scrapper import (Config, Crawler,
+                                     IncorrectSessionParamsError,
+                                     collect_articles, make_request)
+from lab_5_scrapper.tests.local_server import (LocalServer,
+                                               generate_local_config,
+                                               generate_website)
+
+
+class RequestSessionTest(unittest.TestCase):
+    """
+    Class for testing connection reuse and retries of make_request
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalServer(generate_website(num_seeds=2, articles_per_seed=5),
+                                  failures={'/news/1': 2})
+        self.server.start()
+
+    def _generate_config(self, **additional_params) -> Config:
+        return generate_local_config(self.server, num_seeds=2, num_articles=10,
+                                     **additional_params)
+
+    @pytest.mark.stage_2_7_request_session_check
+    @pytest.mark.lab_5_scrapper
+    def test_connections_are_reused(self):
+        """
+        Ensure crawling and parsing reuse pooled connections
+        """
+        config = self._generate_config(max_workers=2, max_workers_per_host=2,
+                                       pool_size=2, retry_backoff=0)
+        crawler = Crawler(config)
+        crawler.find_articles()
+        articles = list(collect_articles(crawler.urls, config))
+        self.assertEqual(len(articles), 10)
+        self.assertLessEqual(len(self.server.connections), 2)
+
+    @pytest.mark.stage_2_7_request_session_check
+    @pytest.mark.lab_5_scrapper
+    def test_unavailable_server_is_retried(self):
+        """
+        Ensure responses with 5xx status are retried
+        """
+        config = self._generate_config(max_retries=2, retry_backoff=0)
+        response = make_request(f'{self.server.base_url}/news/1', config)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.hits['/news/1'], 3)
+
+    @pytest.mark.stage_2_7_request_session_check
+    @pytest.mark.lab_5_scrapper
+    def test_retries_are_limited(self):
+        """
+        Ensure the last response is returned once retries are exhausted
+        """
+        config = self._generate_config(max_retries=1, retry_backoff=0)
+        response = make_request(f'{self.server.base_url}/news/1', config)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.hits['/news/1'], 2)
+
+    @pytest.mark.stage_2_7_request_session_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_session_params(self):
+        """
+        Ensure Config rejects incorrect pool and retry settings
+        """
+        for params in ({'pool_size': 0}, {'max_retries': -1},
+                       {'max_retries': True}, {'retry_backoff': 'fast'},
+                       {'max_workers': 4, 'pool_size': 3}):
+            with self.assertRaises(IncorrectSessionParamsError):
+                self._generate_config(**params)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
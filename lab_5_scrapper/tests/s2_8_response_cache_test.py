@@ -0,0 +1,168 @@
+# pylint: disable=protected-access
+"""
+Checks the on-disk cache of responses
+"""
+import shutil
+import time
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_5_scrapper.http_cache import CacheMissError, ResponseCache
+from lab_5_scrapper.scrapper import (Config, Crawler, collect_articles,
+                                     make_request)
+from lab_5_scrapper.tests.local_server import (LocalServer,
+                                               generate_local_config,
+                                               generate_website)
+
+CACHE_PATH = TEST_PATH / 'http_cache'
+
+
+class ResponseCacheTest(unittest.TestCase):
+    """
+    Class for testing revalidation and replay of cached responses
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalServer(generate_website(num_seeds=2, articles_per_seed=3))
+        self.server.start()
+        self.config = generate_local_config(self.server, num_seeds=2, num_articles=6)
+
+    def _enable_cache(self, config: Config, mode: str, max_size: int = 10 ** 6) -> None:
+        config._cache_mode = mode
+        config._response_cache = ResponseCache(CACHE_PATH, max_age=60, max_size=max_size)
+
+    def _crawl(self, config: Config) -> list:
+        crawler = Crawler(config)
+        crawler.find_articles()
+        return [article.get_raw_text() for article in collect_articles(crawler.urls, config)]
+
+    @pytest.mark.stage_2_8_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_rerun_revalidates_pages(self):
+        """
+        Ensure a second crawl receives 304 for unchanged pages and the same texts
+        """
+        self._enable_cache(self.config, 'revalidate')
+        first_run = self._crawl(self.config)
+        self.assertFalse(self.server.not_modified)
+
+        second_run = self._crawl(self.config)
+        self.assertEqual(first_run, second_run)
+        self.assertEqual(sum(self.server.not_modified.values()), 2 + 6)
+
+    @pytest.mark.stage_2_8_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_offline_mode_replays_cache(self):
+        """
+        Ensure offline mode works from the cache alone
+        """
+        self._enable_cache(self.config, 'revalidate')
+        first_run = self._crawl(self.config)
+        requests_made = sum(self.server.hits.values())
+
+        self._enable_cache(self.config, 'offline')
+        self.assertEqual(self._crawl(self.config), first_run)
+        self.assertEqual(sum(self.server.hits.values()), requests_made)
+
+        with self.assertRaises(CacheMissError):
+            make_request(f'{self.server.base_url}/news/100', self.config)
+
+    @pytest.mark.stage_2_8_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_offline_mode_replays_robots(self):
+        """
+        Ensure offline mode reads crawl delays from the cache instead of the network
+        """
+        self.server.pages['/robots.txt'] = b'User-agent: *\nCrawl-delay: 2\n'
+        self.config._respect_crawl_delay = True
+        url = f'{self.server.base_url}/news/1'
+        for mode in ('revalidate', 'offline'):
+            self._enable_cache(self.config, mode)
+            self.config._rate_limiter = self.config._create_rate_limiter()
+            self.assertEqual(self.config.get_rate_limiter().get_interval(url), 2.0)
+        self.assertEqual(self.server.hits['/robots.txt'], 1)
+
+    @pytest.mark.stage_2_8_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_cache_evicts_by_size_and_age(self):
+        """
+        Ensure least recently used responses are evicted, expired ones first,
+        while expired responses are kept for revalidation while they fit
+        """
+        self._enable_cache(self.config, 'revalidate')
+        urls = [f'{self.server.base_url}/news/{idx}' for idx in range(1, 4)]
+        for url in urls:
+            make_request(url, self.config)
+        body_size = len(self.server.pages['/news/1'])
+
+        cache = ResponseCache(CACHE_PATH, max_age=60, max_size=2 * body_size + 1)
+        self.assertIsNone(cache.get(urls[0]))
+        self.assertIsNotNone(cache.get(urls[2]))
+
+        time.sleep(0.01)
+        cache = ResponseCache(CACHE_PATH, max_age=0, max_size=10 ** 6)
+        self.config._response_cache = cache
+        make_request(urls[2], self.config)
+        self.assertEqual(self.server.not_modified['/news/3'], 1)
+
+        # the most recently used entry is evicted first once it expires
+        cache.get(urls[1])
+        cache._stored_at[cache._get_entry_path(urls[1]).name] = 0
+        cache._max_age = 60
+        cache._max_size = body_size + 1
+        cache.evict()
+        self.assertIsNone(cache.get(urls[1]))
+        self.assertIsNotNone(cache.get(urls[2]))
+
+    @pytest.mark.stage_2_8_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_lookups_do_not_write_entries(self):
+        """
+        Ensure the order of use is kept in memory and written only when the cache is saved
+        """
+        self._enable_cache(self.config, 'revalidate')
+        urls = [f'{self.server.base_url}/news/{idx}' for idx in range(1, 4)]
+        for url in urls:
+            make_request(url, self.config)
+
+        self._enable_cache(self.config, 'offline')
+        cache = self.config._response_cache
+        with mock.patch.object(cache, '_write_entry') as write_entry:
+            make_request(urls[0], self.config)
+            make_request(urls[0], self.config)
+        write_entry.assert_not_called()
+
+        cache.save()
+        body_size = len(self.server.pages['/news/1'])
+        cache = ResponseCache(CACHE_PATH, max_age=60, max_size=2 * body_size + 1)
+        self.assertIsNone(cache.get(urls[1]))
+        self.assertIsNotNone(cache.get(urls[0]))
+
+    @pytest.mark.stage_2_8_response_cache_check
+    @pytest.mark.lab_5_scrapper
+    def test_store_does_not_read_stored_entries(self):
+        """
+        Ensure storing a response neither lists nor reads other entries
+        and evicts only the least recently used one when the cache is full
+        """
+        urls = [f'{self.server.base_url}/news/{idx}' for idx in range(1, 4)]
+        body_size = len(self.server.pages['/news/1'])
+        self._enable_cache(self.config, 'revalidate', max_size=2 * body_size + 1)
+        cache = self.config._response_cache
+        with mock.patch.object(cache, '_read_entry', wraps=cache._read_entry) as read_entry, \
+                mock.patch('pathlib.Path.glob') as glob:
+            for url in urls:
+                make_request(url, self.config)
+        self.assertEqual(read_entry.call_count, 0)
+        self.assertEqual(glob.call_count, 0)
+        self.assertIsNone(cache.get(urls[0]))
+        self.assertIsNotNone(cache.get(urls[1]))
+        self.assertEqual(len(list((CACHE_PATH / 'entries').glob('*.json'))), 2)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
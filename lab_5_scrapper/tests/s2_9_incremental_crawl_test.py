@@ -0,0 +1,112 @@
+"""
+Checks that incremental crawling keeps previously collected articles
+"""
+import asyncio
+import json
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.constants import CRAWL_INDEX_FILE_NAME
+from lab_5_scrapper.scrapper import (IncorrectIncrementalError,
+                                     prepare_environment, scrape)
+from lab_5_scrapper.scrapper_async import crawl
+from lab_5_scrapper.tests.local_server import (LocalServer,
+                                               generate_article_page,
+                                               generate_local_config,
+                                               generate_seed_page,
+                                               generate_website)
+from lab_6_pipeline.pipeline import CorpusManager
+
+ARTICLES_PATH = TEST_PATH / 'articles'
+
+
+class IncrementalCrawlTest(unittest.TestCase):
+    """
+    Class for testing repeated crawls of a growing website
+    """
+
+    def setUp(self) -> None:
+        self.server = LocalServer(generate_website(num_seeds=1, articles_per_seed=3))
+        self.server.start()
+        self.config = generate_local_config(self.server, num_seeds=1, num_articles=3,
+                                            incremental=True)
+
+    def _publish_article(self, idx: int) -> None:
+        self.server.pages[f'/news/{idx}'] = generate_article_page(idx)
+        self.server.pages['/seed/0/'] = generate_seed_page([idx, 1, 2])
+
+    @pytest.mark.stage_2_9_incremental_crawl_check
+    @pytest.mark.lab_5_scrapper
+    def test_incremental_crawl_fetches_only_new_articles(self):
+        """
+        Ensure a repeated crawl fetches new articles only and continues ids
+        """
+        scrape(self.config, ARTICLES_PATH)
+        self._publish_article(4)
+        scrape(self.config, ARTICLES_PATH)
+
+        self.assertEqual(self.server.hits['/news/1'], 1)
+        self.assertEqual(self.server.hits['/news/4'], 1)
+        with (ARTICLES_PATH / '4_meta.json').open(encoding='utf-8') as meta_file:
+            self.assertEqual(json.load(meta_file)['url'], f'{self.server.base_url}/news/4')
+        self.assertEqual(len(CorpusManager(ARTICLES_PATH).get_articles()), 4)
+
+    @pytest.mark.stage_2_9_incremental_crawl_check
+    @pytest.mark.lab_5_scrapper
+    def test_index_is_rebuilt_from_meta_files(self):
+        """
+        Ensure collected articles are recognized without the index file
+        """
+        scrape(self.config, ARTICLES_PATH)
+        (ARTICLES_PATH / CRAWL_INDEX_FILE_NAME).unlink()
+        self._publish_article(4)
+        scrape(self.config, ARTICLES_PATH)
+
+        self.assertEqual(self.server.hits['/news/2'], 1)
+        self.assertEqual(len(CorpusManager(ARTICLES_PATH).get_articles()), 4)
+
+    @pytest.mark.stage_2_9_incremental_crawl_check
+    @pytest.mark.lab_5_scrapper
+    def test_prepare_environment_keeps_articles(self):
+        """
+        Ensure prepare_environment wipes the folder only in non-incremental mode
+        """
+        scrape(self.config, ARTICLES_PATH)
+        prepare_environment(ARTICLES_PATH, incremental=True)
+        self.assertTrue((ARTICLES_PATH / '1_raw.txt').exists())
+        prepare_environment(ARTICLES_PATH)
+        self.assertFalse(any(ARTICLES_PATH.iterdir()))
+
+    @pytest.mark.stage_2_9_incremental_crawl_check
+    @pytest.mark.lab_5_scrapper
+    def test_async_crawl_is_incremental(self):
+        """
+        Ensure the asynchronous engine keeps collected articles and continues ids
+        """
+        asyncio.run(crawl(self.config, ARTICLES_PATH))
+        self._publish_article(4)
+        asyncio.run(crawl(self.config, ARTICLES_PATH))
+
+        self.assertEqual(self.server.hits['/news/1'], 1)
+        with (ARTICLES_PATH / '4_meta.json').open(encoding='utf-8') as meta_file:
+            self.assertEqual(json.load(meta_file)['url'], f'{self.server.base_url}/news/4')
+        self.assertEqual(len(CorpusManager(ARTICLES_PATH).get_articles()), 4)
+
+    @pytest.mark.stage_2_9_incremental_crawl_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_incremental_config_param(self):
+        """
+        Ensure a non-boolean incremental flag is rejected with its own error
+        """
+        for incorrect_incremental in ('true', 1, None):
+            with self.assertRaises(IncorrectIncrementalError):
+                generate_local_config(self.server, num_seeds=1, num_articles=3,
+                                      incremental=incorrect_incremental)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
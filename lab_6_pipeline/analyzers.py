@@ -0,0 +1,164 @@
+"""
+Long-lived morphological analyzers shared by pipelines and their worker processes
+"""
+import os
+import threading
+from typing import Any, Callable, Optional
+
+
+def start_mystem() -> Any:
+    """
+    Starts Mystem, its subprocess is launched on the first analysis
+    """
+    from pymystem3 import Mystem  # pylint: disable=import-outside-toplevel
+    return Mystem()
+
+
+def start_pymorphy() -> Any:
+    """
+    Loads pymorphy2 dictionaries
+    """
+    import pymorphy2  # pylint: disable=import-outside-toplevel
+    return pymorphy2.MorphAnalyzer()
+
+
+def check_mystem(mystem: Any) -> object:
+    """
+    Analyzes a word, failing if the subprocess is gone
+    """
+    return mystem.analyze('проверка')
+
+
+def check_pymorphy(morph: Any) -> object:
+    """
+    Parses a word with the loaded dictionaries
+    """
+    return morph.parse('проверка')
+
+
+# pylint: disable=too-few-public-methods
+class AnalyzerSpec:
+    """
+    Describes how to start an analyzer and to check that it still works
+    """
+
+    def __init__(self,
+                 start: Callable[[], Any],
+                 check: Callable[[Any], object],
+                 fork_safe: bool) -> None:
+        """
+        Initializes an instance of the AnalyzerSpec class,
+        an analyzer that is not fork safe is started again in a forked process
+        """
+        self.start = start
+        self.check = check
+        self.fork_safe = fork_safe
+
+
+DEFAULT_ANALYZERS = {
+    # a subprocess talking through pipes, a forked process must not share them
+    'mystem': AnalyzerSpec(start_mystem, check_mystem, fork_safe=False),
+    # read-only dictionaries, forked processes share their memory
+    'pymorphy2': AnalyzerSpec(start_pymorphy, check_pymorphy, fork_safe=True)
+}
+
+
+class AnalyzerPool:
+    """
+    Starts every analyzer on its first use and reuses it afterwards;
+    an analyzer failing its check is started again, and so is an analyzer
+    inherited by a forked process unless it is fork safe
+    """
+
+    def __init__(self, specs: Optional[dict[str, AnalyzerSpec]] = None) -> None:
+        """
+        Initializes an instance of the AnalyzerPool class
+        """
+        self._specs = dict(DEFAULT_ANALYZERS if specs is None else specs)
+        self._analyzers: dict[str, Any] = {}
+        self._pid = os.getpid()
+        self._inherited: list[Any] = []
+        self._lock = threading.Lock()
+        self.starts = 0
+
+    def __getstate__(self) -> dict:
+        """
+        Leaves out analyzers and the lock, a pool sent to another process starts its own
+        """
+        return {'_specs': self._specs}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores an empty pool in another process
+        """
+        self._specs = state['_specs']
+        self._analyzers = {}
+        self._pid = os.getpid()
+        self._inherited = []
+        self._lock = threading.Lock()
+        self.starts = 0
+
+    def _forget_parent_analyzers(self) -> None:
+        """
+        Drops analyzers a forked process cannot use, keeping references to them
+        so that their finalizers do not stop the ones of the parent process
+        """
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        for name in list(self._analyzers):
+            if not self._specs[name].fork_safe:
+                self._inherited.append(self._analyzers.pop(name))
+
+    def get(self, name: str) -> Any:
+        """
+        Returns the analyzer, starting it if needed
+        """
+        self._forget_parent_analyzers()
+        with self._lock:
+            if name not in self._analyzers:
+                self._analyzers[name] = self._specs[name].start()
+                self.starts += 1
+            return self._analyzers[name]
+
+    def restart(self, name: str) -> Any:
+        """
+        Replaces the analyzer with a newly started one
+        """
+        self._forget_parent_analyzers()
+        with self._lock:
+            self._analyzers.pop(name, None)
+        return self.get(name)
+
+    def check(self, name: str) -> Any:
+        """
+        Returns the analyzer after making sure it answers, restarting it otherwise
+        """
+        analyzer = self.get(name)
+        try:
+            self._specs[name].check(analyzer)
+        except (OSError, RuntimeError, ValueError):
+            return self.restart(name)
+        return analyzer
+
+    def run(self, name: str, task: Callable[[Any], Any]) -> Any:
+        """
+        Runs the task with the analyzer, restarting it and trying again once if it breaks
+        """
+        try:
+            return task(self.get(name))
+        except (OSError, RuntimeError):
+            return task(self.restart(name))
+
+    def warm_up(self, names: tuple[str, ...]) -> None:
+        """
+        Starts and checks analyzers in advance, so that forked processes
+        inherit fork safe ones instead of starting them again
+        """
+        for name in names:
+            self.check(name)
+
+
+# shared by all pipelines of a process and inherited by forked worker processes
+ANALYZER_POOL = AnalyzerPool()
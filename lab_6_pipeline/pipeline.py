@@ -1,14 +1,29 @@
 """
 Pipeline for CONLL-U formatting
 """
-from pathlib import Path
-from typing import List
+# pylint: disable=too-many-lines
+import hashlib
+import json
+import os
 import re
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Protocol
 
-from core_utils.article.article import SentenceProtocol, split_by_sentence
-from core_utils.article.io import from_raw, to_cleaned
+from core_utils.article.article import (LINE_BREAKS, SENTENCE_BOUNDARY,
+                                        Article, ArtifactType,
+                                        SentenceProtocol, read_text,
+                                        split_by_sentence)
+from core_utils.article.io import from_raw, to_cleaned, to_conllu
+from core_utils.article.packed import RAW, parse_artifact_name
 from core_utils.article.ud import OpencorporaTagProtocol, TagConverter
-from core_utils.constants import ASSETS_PATH
+from core_utils.constants import (ANALYSIS_CACHE_PATH, ANALYSIS_CACHE_SIZE,
+                                  ASSETS_PATH, DATASET_MANIFEST_FILE_NAME,
+                                  PIPELINE_STATE_FILE_NAME)
+from lab_6_pipeline.analyzers import ANALYZER_POOL
 
 
 class InconsistentDatasetError(Exception):
@@ -25,16 +40,171 @@ class EmptyDirectoryError(Exception):
 # pylint: disable=too-few-public-methods
 
 
+TAGS_MAPPINGS_PATH = Path(__file__).parent / 'data'
+
+# sentence boundaries of split_by_sentence() as the first group and tokens of str.split()
+TOKEN_PATTERN = re.compile(f'({SENTENCE_BOUNDARY.pattern})|\\S+')
+NON_WORD_PATTERN = re.compile(r'[^\w\s]+')
+
+
+class DatasetFile:
+    """
+    Path, size, modification time and, for raw texts, hash of the content
+    of a file of the dataset
+    """
+
+    def __init__(self, path: Path, size: int, mtime: float, content_hash: Optional[str] = None):
+        """
+        Initializes DatasetFile
+        """
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.content_hash = content_hash
+
+
+class ArticleFiles:
+    """
+    Files of an article found in the dataset, keyed by kind:
+    raw, meta or a value of ArtifactType
+    """
+
+    def __init__(self, article_id: int) -> None:
+        """
+        Initializes ArticleFiles
+        """
+        self.article_id = article_id
+        self.files: dict[str, DatasetFile] = {}
+
+
+def _hash_file(path: Path) -> str:
+    """
+    Computes the hash of the file content
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _add_file(manifest: dict[int, ArticleFiles], name: str, file: DatasetFile) -> None:
+    """
+    Registers the file in the manifest if its name is a name of an artifact
+    """
+    artifact = parse_artifact_name(name)
+    if artifact is not None:
+        article_id, kind = artifact
+        manifest.setdefault(article_id, ArticleFiles(article_id)).files[kind] = file
+
+
+def scan_dataset(path: Path,
+                 known: Optional[dict[int, ArticleFiles]] = None) -> dict[int, ArticleFiles]:
+    """
+    Lists the dataset once, collecting files of every article;
+    hashes of raw texts are taken from known files of the same size and modification time
+    """
+    known_files = {file.path.name: file for files in (known or {}).values()
+                   for file in files.files.values()}
+    manifest: dict[int, ArticleFiles] = {}
+    is_empty = True
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name == DATASET_MANIFEST_FILE_NAME:
+                continue
+            is_empty = False
+            artifact = parse_artifact_name(entry.name)
+            if artifact is None or not entry.is_file():
+                continue
+            stat = entry.stat()
+            file = DatasetFile(Path(entry.path), stat.st_size, stat.st_mtime)
+            previous = known_files.get(entry.name)
+            if previous and (previous.size, previous.mtime) == (file.size, file.mtime):
+                file.content_hash = previous.content_hash
+            elif artifact[1] == RAW:
+                file.content_hash = _hash_file(file.path)
+            _add_file(manifest, entry.name, file)
+    if is_empty:
+        raise EmptyDirectoryError
+    return manifest
+
+
+def load_dataset_manifest(path: Path) -> Optional[dict[int, ArticleFiles]]:
+    """
+    Loads the manifest saved next to the articles, None if it is absent or corrupted
+    """
+    try:
+        with open(path / DATASET_MANIFEST_FILE_NAME, encoding='utf-8') as manifest_file:
+            files = json.load(manifest_file)
+        manifest: dict[int, ArticleFiles] = {}
+        for name, file in files.items():
+            _add_file(manifest, name, DatasetFile(path / name, file['size'], file['mtime'],
+                                                  file['hash']))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return manifest
+
+
+def save_dataset_manifest(path: Path, manifest: dict[int, ArticleFiles]) -> None:
+    """
+    Saves the manifest next to the articles and gives it the modification time
+    of the directory, so that any later change of the directory is noticed
+    """
+    files = {file.path.name: {'size': file.size, 'mtime': file.mtime, 'hash': file.content_hash}
+             for article_id in sorted(manifest)
+             for file in manifest[article_id].files.values()}
+    manifest_path = path / DATASET_MANIFEST_FILE_NAME
+    tmp_path = manifest_path.with_suffix('.tmp')
+    try:
+        with tmp_path.open('w', encoding='utf-8') as manifest_file:
+            json.dump(files, manifest_file, indent=4, ensure_ascii=False)
+        tmp_path.replace(manifest_path)
+        directory_stat = os.stat(path)
+        os.utime(manifest_path, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns))
+    except OSError:
+        # a dataset in a read-only directory is simply scanned every time
+        tmp_path.unlink(missing_ok=True)
+
+
+def is_file_unchanged(file: DatasetFile) -> bool:
+    """
+    Checks that the file still has the size and modification time recorded for it
+    """
+    try:
+        stat = os.stat(file.path)
+    except OSError:
+        return False
+    return (stat.st_size, stat.st_mtime) == (file.size, file.mtime)
+
+
+def get_dataset_manifest(path: Path) -> dict[int, ArticleFiles]:
+    """
+    Trusts the saved manifest while no file has been added to, removed from or renamed
+    in the directory since it was saved and raw texts have not been rewritten in place,
+    otherwise lists the dataset again
+    """
+    known = load_dataset_manifest(path)
+    directory_mtime = os.stat(path).st_mtime_ns
+    # whole seconds mean a file system too coarse to notice changes made right after saving
+    if known is not None and directory_mtime % 1_000_000_000 and \
+            os.stat(path / DATASET_MANIFEST_FILE_NAME).st_mtime_ns == directory_mtime and \
+            all(is_file_unchanged(files.files[RAW]) for files in known.values()
+                if RAW in files.files):
+        return known
+    manifest = scan_dataset(path, known)
+    save_dataset_manifest(path, manifest)
+    return manifest
+
+
 class CorpusManager:
     """
     Works with articles and stores them
     """
 
-    def __init__(self, path_to_raw_txt_data: Path):
+    def __init__(self, path_to_raw_txt_data: Path, lazy: bool = False, use_mmap: bool = False):
         """
-        Initializes CorpusManager
+        Initializes CorpusManager,
+        a lazy one reads texts of articles only when they are accessed
         """
         self.path_to_raw_txt_data = path_to_raw_txt_data
+        self._lazy = lazy
+        self._use_mmap = use_mmap
         self._validate_dataset()
         self._storage = {}
         self._scan_dataset()
@@ -43,35 +213,28 @@ class CorpusManager:
         """
         Validates folder with assets
         """
-        if not self.path_to_raw_txt_data.exists():
-            raise FileNotFoundError
-
-        if not self.path_to_raw_txt_data.is_dir():
-            raise NotADirectoryError
-
-        if not [x for x in self.path_to_raw_txt_data.iterdir()]:
-            raise EmptyDirectoryError
-
-        meta_files = [file for file in self.path_to_raw_txt_data.iterdir() if file.suffix == ".json" and file.stem.endswith("_meta")]
-        raw_files = [file for file in self.path_to_raw_txt_data.iterdir() if file.suffix == ".txt" and file.stem.endswith("_raw")]
+        self._manifest = get_dataset_manifest(self.path_to_raw_txt_data)
+        raw_files = {article_id: files.files[RAW] for article_id, files in self._manifest.items()
+                     if RAW in files.files}
 
         # if len(meta_files) != len(raw_files):
         # raise InconsistentDatasetError
 
-        if sorted([int(re.match(r'\d+', file.name)[0]) for file in raw_files]) != list(range(1, len(raw_files) + 1)):
+        if sorted(raw_files) != list(range(1, len(raw_files) + 1)):
             raise InconsistentDatasetError
 
-        for file in raw_files:
-            if file.stat().st_size == 0:
+        for file in raw_files.values():
+            if file.size == 0:
                 raise InconsistentDatasetError
 
     def _scan_dataset(self) -> None:
         """
         Register each dataset entry
         """
-        for f in self.path_to_raw_txt_data.glob('*_raw.txt'):
-            article = from_raw(f)
-            self._storage.update({article.article_id: article})
+        for article_id, files in sorted(self._manifest.items()):
+            if RAW in files.files:
+                article = from_raw(files.files[RAW].path, lazy=self._lazy, use_mmap=self._use_mmap)
+                self._storage.update({article_id: article})
 
     def get_articles(self) -> dict:
         """
@@ -79,6 +242,23 @@ class CorpusManager:
         """
         return self._storage
 
+    def get_manifest(self) -> dict[int, 'ArticleFiles']:
+        """
+        Returns files of every article found in the dataset
+        """
+        return self._manifest
+
+    def release_article(self, article_id: int) -> None:
+        """
+        Frees memory taken by the text and sentences of a lazy article
+        once its outputs are written
+        """
+        if not self._lazy:
+            return
+        article = self._storage[article_id]
+        article.release_text()
+        article.set_conllu_sentences([])
+
 
 class MorphologicalTokenDTO:
     """
@@ -89,6 +269,9 @@ class MorphologicalTokenDTO:
         """
         Initializes MorphologicalTokenDTO
         """
+        self.lemma = lemma
+        self.pos = pos
+        self.tags = tags
 
 
 class ConlluToken:
@@ -101,16 +284,19 @@ class ConlluToken:
         Initializes ConlluToken
         """
         self._text = text
+        self._morphological_parameters = MorphologicalTokenDTO()
 
     def set_morphological_parameters(self, parameters: MorphologicalTokenDTO) -> None:
         """
         Stores the morphological parameters
         """
+        self._morphological_parameters = parameters
 
     def get_morphological_parameters(self) -> MorphologicalTokenDTO:
         """
         Returns morphological parameters from ConlluToken
         """
+        return self._morphological_parameters
 
     def get_conllu_text(self, include_morphological_tags: bool) -> str:
         """
@@ -121,7 +307,157 @@ class ConlluToken:
         """
         Returns lowercase original form of a token
         """
-        return re.sub(r'[^\w\s]+', '', self._text).lower()
+        return NON_WORD_PATTERN.sub('', self._text).lower()
+
+
+class StringTable:
+    """
+    Interns strings of tokens, so that every distinct form, lemma, part of speech
+    and set of tags is stored once and tokens refer to it by id
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes StringTable
+        """
+        self._ids: dict[str, int] = {}
+        self._strings: list[str] = []
+
+    def __getstate__(self) -> dict:
+        """
+        Leaves out ids, they are restored from the strings
+        """
+        return {'strings': self._strings}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores ids of the strings
+        """
+        self._strings = state['strings']
+        self._ids = {string: idx for idx, string in enumerate(self._strings)}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, string: str) -> int:
+        """
+        Returns id of the string, adding it to the table if needed
+        """
+        idx = self._ids.get(string)
+        if idx is None:
+            idx = self._ids[string] = len(self._strings)
+            self._strings.append(string)
+        return idx
+
+    def get(self, idx: int) -> str:
+        """
+        Returns the string by its id
+        """
+        return self._strings[idx]
+
+
+class TokenColumns:
+    """
+    Tokens of a sentence as parallel arrays of ids of their forms, lemmas,
+    parts of speech and tags in a string table shared by sentences of an article
+    """
+
+    def __init__(self, table: StringTable) -> None:
+        """
+        Initializes TokenColumns
+        """
+        self.table = table
+        self.forms = array('I')
+        self.lemmas = array('I')
+        self.pos = array('I')
+        self.tags = array('I')
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    def __iter__(self) -> Iterator[tuple[str, str, str, str]]:
+        """
+        Yields form, lemma, part of speech and tags of every token
+        """
+        get = self.table.get
+        for form, lemma, pos, tags in zip(self.forms, self.lemmas, self.pos, self.tags):
+            yield get(form), get(lemma), get(pos), get(tags)
+
+    def append(self, form: str, parameters: MorphologicalTokenDTO) -> None:
+        """
+        Adds a token with its morphological parameters
+        """
+        self.forms.append(self.table.intern(form))
+        self.lemmas.append(self.table.intern(parameters.lemma))
+        self.pos.append(self.table.intern(parameters.pos))
+        self.tags.append(self.table.intern(parameters.tags))
+
+    def set_tags(self, idx: int, tags: str) -> None:
+        """
+        Replaces morphological tags of the token
+        """
+        self.tags[idx] = self.table.intern(tags)
+
+    def get_parameters(self, idx: int) -> MorphologicalTokenDTO:
+        """
+        Returns morphological parameters of the token
+        """
+        get = self.table.get
+        return MorphologicalTokenDTO(get(self.lemmas[idx]), get(self.pos[idx]),
+                                     get(self.tags[idx]))
+
+    def set_parameters(self, idx: int, parameters: MorphologicalTokenDTO) -> None:
+        """
+        Replaces morphological parameters of the token
+        """
+        self.lemmas[idx] = self.table.intern(parameters.lemma)
+        self.pos[idx] = self.table.intern(parameters.pos)
+        self.tags[idx] = self.table.intern(parameters.tags)
+
+    def get_tokens(self) -> list[ConlluToken]:
+        """
+        Creates views of the tokens, the columns keep being the only storage
+        """
+        return [ColumnarConlluToken(self, idx) for idx in range(len(self))]
+
+
+class ColumnarConlluToken(ConlluToken):
+    """
+    Transient view of a token kept in columns,
+    morphological parameters are read from and written to the columns
+    """
+
+    def __init__(self, columns: TokenColumns, idx: int):
+        """
+        Initializes ColumnarConlluToken
+        """
+        super().__init__(columns.table.get(columns.forms[idx]))
+        self._columns = columns
+        self._idx = idx
+
+    def set_morphological_parameters(self, parameters: MorphologicalTokenDTO) -> None:
+        """
+        Stores the morphological parameters in the columns
+        """
+        self._columns.set_parameters(self._idx, parameters)
+
+    def get_morphological_parameters(self) -> MorphologicalTokenDTO:
+        """
+        Returns morphological parameters from the columns,
+        changes of the returned instance are not stored
+        """
+        return self._columns.get_parameters(self._idx)
+
+
+def format_conllu_token(position: int,
+                        row: tuple[str, str, str, str],
+                        include_morphological_tags: bool) -> str:
+    """
+    Formats form, lemma, part of speech and tags of a token as a line of a CONLL-U file
+    """
+    form, lemma, pos, tags = row
+    tags = tags if include_morphological_tags and tags else '_'
+    return f'{position}\t{form}\t{lemma or "_"}\t{pos or "_"}\t_\t{tags}\t0\troot\t_\t_'
 
 
 class ConlluSentence(SentenceProtocol):
@@ -136,16 +472,81 @@ class ConlluSentence(SentenceProtocol):
         self._position = position
         self._text = text
         self._tokens = tokens
+        self._token_source: Optional[tuple[str, list[tuple[int, int]]]] = None
+        self._columns: Optional[TokenColumns] = None
+
+    @classmethod
+    def from_spans(cls,
+                   position: int,
+                   text: str,
+                   source: str,
+                   token_spans: list[tuple[int, int]]) -> 'ConlluSentence':
+        """
+        Creates a sentence whose tokens are cut from the source text on first use
+        """
+        sentence = cls(position, text, [])
+        sentence._token_source = (source, token_spans)
+        return sentence
+
+    @classmethod
+    def from_columns(cls, position: int, text: str, columns: TokenColumns) -> 'ConlluSentence':
+        """
+        Creates a sentence that keeps its tokens in columns,
+        get_tokens() returns new views of them on every call
+        """
+        sentence = cls(position, text, [])
+        sentence._columns = columns
+        return sentence
+
+    def get_columns(self) -> Optional[TokenColumns]:
+        """
+        Returns columns of the tokens, None if the sentence keeps ConlluToken instances
+        """
+        return self._columns
+
+    def _get_rows(self) -> Iterator[tuple[str, str, str, str]]:
+        """
+        Yields form, lemma, part of speech and tags of every token
+        """
+        if self._columns is not None:
+            yield from self._columns
+            return
+        for token in self.get_tokens():
+            parameters = token.get_morphological_parameters()
+            yield (token._text,  # pylint: disable=protected-access
+                   parameters.lemma, parameters.pos, parameters.tags)
 
     def get_conllu_text(self, include_morphological_tags: bool) -> str:
         """
         Creates string representation of the sentence
         """
+        lines = [f'# sent_id = {self._position}', f'# text = {self._text}']
+        lines.extend(format_conllu_token(position, row, include_morphological_tags)
+                     for position, row in enumerate(self._get_rows(), 1))
+        return '\n'.join(lines) + '\n'
+
+    def get_pos_frequencies(self) -> dict[str, int]:
+        """
+        Counts parts of speech of the tokens of the sentence
+        """
+        if self._columns is not None:
+            get = self._columns.table.get
+            return {get(pos): count for pos, count in Counter(self._columns.pos).items()}
+        return dict(Counter(token.get_morphological_parameters().pos
+                            for token in self.get_tokens()))
 
     def get_cleaned_sentence(self) -> str:
         """
         Returns the lowercase representation of the sentence
         """
+        if self._token_source is not None:
+            # cleaning tokens separated by whitespace one by one gives the same
+            return ' '.join(NON_WORD_PATTERN.sub('', self._text).lower().split())
+        if self._columns is not None:
+            get = self._columns.table.get
+            cleaned_forms = (NON_WORD_PATTERN.sub('', get(form)).lower()
+                             for form in self._columns.forms)
+            return ' '.join(form for form in cleaned_forms if form)
         sentence_list = []
         for token in self._tokens:
             cleaned_token = token.get_cleaned()
@@ -157,23 +558,77 @@ class ConlluSentence(SentenceProtocol):
         """
         Returns sentences from ConlluSentence
         """
+        if self._token_source is not None:
+            source, token_spans = self._token_source
+            self._tokens = [ConlluToken(source[start:end]) for start, end in token_spans]
+            self._token_source = None
+        if self._columns is not None:
+            return self._columns.get_tokens()
         return self._tokens
 
 
+def tokenize(text: str) -> tuple[str, list[tuple[int, int, list[tuple[int, int]]]]]:
+    """
+    Finds sentences of split_by_sentence() and their tokens of str.split() in one pass,
+    returning the text with line breaks replaced as split_by_sentence() does
+    and spans of sentences together with spans of their tokens in it
+    """
+    text = LINE_BREAKS.sub('. ', text)
+    sentences = []
+    start = 0
+    tokens: list[tuple[int, int]] = []
+    for match in TOKEN_PATTERN.finditer(text):
+        if match.lastindex is None:
+            tokens.append(match.span())
+            continue
+        end = match.start()
+        if end - start > 10 and (tokens or text[start:end].strip(' ')):
+            sentences.append((start, end, tokens))
+        start = end + 1
+        tokens = []
+    if len(text) - start > 10 and (tokens or text[start:].strip(' ')):
+        sentences.append((start, len(text), tokens))
+    return text, sentences
+
+
 class MystemTagConverter(TagConverter):
     """
     Mystem Tag Converter
     """
 
+    def __init__(self, tag_mapping_path: Path, compiled: bool = True):
+        """
+        Initializes MystemTagConverter, precomputing UD features of every Mystem grammeme
+        """
+        super().__init__(tag_mapping_path, compiled)
+        self._features = {grammeme: f'{category}={value}'
+                          for category in (self.animacy, self.case, self.gender,
+                                           self.number, self.tense)
+                          for grammeme, value in self._tag_mapping[category].items()}
+
+    def _convert(self, tags: str) -> tuple[str, str]:
+        """
+        Converts POS and features of Mystem tags like S,жен,неод=(вин,мн|им,мн),
+        taking the first of ambiguous analyses
+        """
+        tags = re.sub(r'\(([^|)]*)[^)]*\)', r'\1', tags)
+        grammemes = re.split(r'[,=]', tags)
+        # names of categories are not prefixes of each other, so features sort by category
+        features = sorted({self._features[grammeme] for grammeme in grammemes[1:]
+                           if grammeme in self._features})
+        return self._tag_mapping[self.pos].get(grammemes[0], 'X'), '|'.join(features)
+
     def convert_morphological_tags(self, tags: str) -> str:  # type: ignore
         """
         Converts the Mystem tags into the UD format
         """
+        return self._convert_memoized(tags, tags, self._convert)[1]
 
     def convert_pos(self, tags: str) -> str:  # type: ignore
         """
         Extracts and converts the POS from the Mystem tags into the UD format
         """
+        return self._convert_memoized(tags, tags, self._convert)[0]
 
 
 class OpenCorporaTagConverter(TagConverter):
@@ -181,15 +636,307 @@ class OpenCorporaTagConverter(TagConverter):
     OpenCorpora Tag Converter
     """
 
+    def __init__(self, tag_mapping_path: Path, compiled: bool = True):
+        """
+        Initializes OpenCorporaTagConverter, precomputing UD features of every grammeme
+        """
+        super().__init__(tag_mapping_path, compiled)
+        # attributes of OpenCorpora tags in the canonical order of UD categories
+        self._features = [(category.lower(), {grammeme: f'{category}={value}'
+                                              for grammeme, value
+                                              in self._tag_mapping[category].items()})
+                          for category in sorted((self.animacy, self.case, self.gender,
+                                                  self.number, self.tense))]
+
+    def _convert(self, tags: OpencorporaTagProtocol) -> tuple[str, str]:
+        """
+        Converts POS and features of OpenCorpora tags
+        """
+        features = [category_features[value] for attribute, category_features in self._features
+                    if (value := getattr(tags, attribute)) in category_features]
+        return self._tag_mapping[self.pos].get(tags.POS, 'X'), '|'.join(features)
+
     def convert_pos(self, tags: OpencorporaTagProtocol) -> str:  # type: ignore
         """
         Extracts and converts POS from the OpenCorpora tags into the UD format
         """
+        return self._convert_memoized(str(tags), tags, self._convert)[0]
 
     def convert_morphological_tags(self, tags: OpencorporaTagProtocol) -> str:  # type: ignore
         """
         Converts the OpenCorpora tags into the UD format
         """
+        return self._convert_memoized(str(tags), tags, self._convert)[1]
+
+
+class TokenAnalysisCache:
+    """
+    Morphological parameters of token forms shared across articles,
+    the least recently used ones are evicted first
+    """
+
+    def __init__(self, max_size: int = ANALYSIS_CACHE_SIZE, path: Optional[Path] = None) -> None:
+        """
+        Initializes TokenAnalysisCache, loading entries saved to the path by a previous run
+        """
+        self._max_size = max_size
+        self._path = path
+        self._entries: OrderedDict[tuple[str, str], MorphologicalTokenDTO] = OrderedDict()
+        self._changed = False
+        self._added: Optional[list[tuple[str, str, MorphologicalTokenDTO]]] = None
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, path: Path) -> None:
+        """
+        Loads saved entries, an absent or corrupted file means an empty cache
+        """
+        try:
+            with path.open(encoding='utf-8') as cache_file:
+                entries = json.load(cache_file)
+            for form, context, lemma, pos, tags in entries:
+                self.put(form, MorphologicalTokenDTO(lemma, pos, tags), context)
+        except (OSError, ValueError, TypeError):
+            self._entries.clear()
+        self._changed = False
+
+    def get(self, form: str, context: str = '') -> Optional[MorphologicalTokenDTO]:
+        """
+        Returns parameters of the form analyzed in the context, if they are cached
+        """
+        parameters = self._entries.get((form, context))
+        if parameters is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end((form, context))
+        return parameters
+
+    def put(self, form: str, parameters: MorphologicalTokenDTO, context: str = '') -> None:
+        """
+        Stores parameters of the form, evicting the least recently used entry when full
+        """
+        self._entries[(form, context)] = parameters
+        self._entries.move_to_end((form, context))
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        self._changed = True
+
+    def get_or_analyze(self,
+                       form: str,
+                       analyze: Callable[[], MorphologicalTokenDTO],
+                       context: str = '') -> MorphologicalTokenDTO:
+        """
+        Returns cached parameters of the form, calling the analyzer only on a miss;
+        tokens share the returned instance, so it must not be changed
+        """
+        parameters = self.get(form, context)
+        if parameters is None:
+            parameters = analyze()
+            self.put(form, parameters, context)
+            if self._added is not None:
+                self._added.append((form, context, parameters))
+        return parameters
+
+    def record_added(self) -> None:
+        """
+        Starts remembering analyzed entries, so that a copy of the cache
+        in a worker process can send them back to the main process
+        """
+        self._added = []
+
+    def pop_added(self) -> list[tuple[str, str, MorphologicalTokenDTO]]:
+        """
+        Returns entries analyzed since the previous call, if they are remembered
+        """
+        added = self._added or []
+        if self._added is not None:
+            self._added = []
+        return added
+
+    def update(self, entries: list[tuple[str, str, MorphologicalTokenDTO]]) -> None:
+        """
+        Stores entries analyzed by another copy of the cache
+        """
+        for form, context, parameters in entries:
+            self.put(form, parameters, context)
+
+    def save(self) -> None:
+        """
+        Saves entries from the least to the most recently used, if there is a path and news
+        """
+        if self._path is None or not self._changed:
+            return
+        entries = [[form, context, parameters.lemma, parameters.pos, parameters.tags]
+                   for (form, context), parameters in self._entries.items()]
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix('.tmp')
+        with tmp_path.open('w', encoding='utf-8') as cache_file:
+            json.dump(entries, cache_file, ensure_ascii=False)
+        tmp_path.replace(self._path)
+        self._changed = False
+
+
+class MystemProtocol(Protocol):
+    """
+    Abstraction definition for pymystem3.Mystem
+    """
+
+    def analyze(self, text: str) -> list[dict]:
+        """
+        pymystem3 method: analyze
+        """
+
+
+# latin letters only, so that Mystem keeps the separator as a single word
+BATCH_SEPARATOR = 'zzbatchseparatorzz'
+
+
+class MystemBatchAnalyzer:
+    """
+    Analyzes sentences of several articles with a single call of Mystem,
+    sentences are joined with a separator word none of them contains
+    """
+
+    def __init__(self, mystem: MystemProtocol, tag_converter: TagConverter) -> None:
+        """
+        Initializes MystemBatchAnalyzer
+        """
+        self._mystem = mystem
+        self._tag_converter = tag_converter
+
+    def analyze(self, texts: list[str]) -> list[list[dict]]:
+        """
+        Analyzes texts with one call, returning the analysis of every text;
+        texts are analyzed one by one if the separator cannot be trusted
+        """
+        if not texts:
+            return []
+        if any(BATCH_SEPARATOR in text for text in texts):
+            return [self._mystem.analyze(text) for text in texts]
+        results: list[list[dict]] = [[]]
+        for item in self._mystem.analyze(f' {BATCH_SEPARATOR} '.join(texts)):
+            if item['text'] == BATCH_SEPARATOR:
+                results.append([])
+            else:
+                results[-1].append(item)
+        if len(results) != len(texts):
+            return [self._mystem.analyze(text) for text in texts]
+        return results
+
+    def process(self, texts: list[str]) -> list[List[ConlluSentence]]:
+        """
+        Splits texts of articles by sentences, analyzes all of them with one call
+        and returns sentences of every article
+        """
+        sentences = [split_by_sentence(text) for text in texts]
+        analyses = iter(self.analyze([sentence for article in sentences for sentence in article]))
+        processed = []
+        for article_sentences in sentences:
+            table = StringTable()
+            processed.append([ConlluSentence.from_columns(position, sentence,
+                                                          self._get_columns(next(analyses), table))
+                              for position, sentence in enumerate(article_sentences)])
+        return processed
+
+    def _convert(self, analysis: dict) -> MorphologicalTokenDTO:
+        """
+        Converts the analysis of a word chosen by Mystem
+        """
+        return MorphologicalTokenDTO(analysis['lex'],
+                                     self._tag_converter.convert_pos(analysis['gr']),
+                                     self._tag_converter.convert_morphological_tags(analysis['gr']))
+
+    def _get_columns(self, analysis: list[dict], table: StringTable) -> TokenColumns:
+        """
+        Stores tokens of words and numbers of a sentence in columns,
+        the only punctuation kept is the dot at its end
+        """
+        columns = TokenColumns(table)
+        for item in analysis:
+            text = item['text'].strip()
+            if item.get('analysis'):
+                parameters = self._convert(item['analysis'][0])
+            elif 'analysis' in item:
+                parameters = MorphologicalTokenDTO(text.lower(), 'X')
+            elif text.isdigit():
+                parameters = MorphologicalTokenDTO(text, 'NUM')
+            else:
+                continue
+            columns.append(text, parameters)
+        last_item = next((item['text'].strip() for item in reversed(analysis)
+                          if item['text'].strip()), '')
+        if last_item.endswith('.'):
+            columns.append('.', MorphologicalTokenDTO('.', 'PUNCT'))
+        return columns
+
+
+class ProcessingState:
+    """
+    Hashes of raw texts whose outputs a pipeline of the given version
+    and with the given settings has saved
+    """
+
+    def __init__(self, path_to_dataset: Path, pipeline_name: str, version: int,
+                 settings: str = '') -> None:
+        """
+        Initializes ProcessingState, forgetting articles processed by another version
+        or with other settings, which are given by their hash
+        """
+        self._path = path_to_dataset / PIPELINE_STATE_FILE_NAME
+        self._pipeline_name = pipeline_name
+        self._version = version
+        self._settings = settings
+        self._states = self._load()
+        state = self._states.get(pipeline_name, {})
+        self._hashes: dict[str, str] = state.get('articles', {}) \
+            if state.get('version') == version and state.get('settings', '') == settings else {}
+        self._changed = False
+
+    def _load(self) -> dict:
+        """
+        Loads states of all pipelines, an absent or corrupted file means nothing is processed
+        """
+        try:
+            with self._path.open(encoding='utf-8') as state_file:
+                states = json.load(state_file)
+        except (OSError, ValueError):
+            return {}
+        return states if isinstance(states, dict) else {}
+
+    def is_processed(self, article_id: int, raw_hash: Optional[str]) -> bool:
+        """
+        Checks whether outputs were saved for exactly this raw text
+        """
+        return raw_hash is not None and self._hashes.get(str(article_id)) == raw_hash
+
+    def add(self, article_id: int, raw_hash: Optional[str]) -> None:
+        """
+        Registers saved outputs of the article
+        """
+        if raw_hash is not None:
+            self._hashes[str(article_id)] = raw_hash
+            self._changed = True
+
+    def save(self) -> None:
+        """
+        Saves the state if any article was processed
+        """
+        if not self._changed:
+            return
+        self._states[self._pipeline_name] = {'version': self._version,
+                                             'settings': self._settings,
+                                             'articles': self._hashes}
+        tmp_path = self._path.with_suffix('.tmp')
+        with tmp_path.open('w', encoding='utf-8') as state_file:
+            json.dump(self._states, state_file, indent=4)
+        tmp_path.replace(self._path)
+        self._changed = False
 
 
 class MorphologicalAnalysisPipeline:
@@ -197,53 +944,272 @@ class MorphologicalAnalysisPipeline:
     Preprocesses and morphologically annotates sentences into the CONLL-U format
     """
 
-    def __init__(self, corpus_manager: CorpusManager):
+    # increase whenever processing changes so that outputs of previous runs are rebuilt
+    VERSION = 1
+    # number of articles given to _process_batch() at once
+    BATCH_SIZE = 16
+    # names of analyzers of the pool the pipeline uses, started before processing
+    ANALYZERS: tuple[str, ...] = ()
+    # names of files of tag mappings in TAGS_MAPPINGS_PATH the outputs depend on
+    TAG_MAPPINGS: tuple[str, ...] = ()
+
+    def __init__(self,
+                 corpus_manager: CorpusManager,
+                 incremental: bool = False,
+                 workers: int = 1,
+                 cache: Optional[TokenAnalysisCache] = None):
         """
-        Initializes MorphologicalAnalysisPipeline
+        Initializes MorphologicalAnalysisPipeline,
+        an incremental one skips articles whose outputs are up to date,
+        more than one worker processes articles in a pool of processes
         """
         self._corpus = corpus_manager
+        self._incremental = incremental
+        self._workers = workers
+        self._cache = cache if cache is not None else TokenAnalysisCache()
+        self._analyzers = ANALYZER_POOL
+
+    def __getstate__(self) -> dict:
+        """
+        Leaves out the corpus, so that the pipeline
+        can be sent to workers in other processes
+        """
+        state = self.__dict__.copy()
+        state.pop('_corpus', None)
+        return state
+
+    def _get_output_kinds(self) -> tuple[str, ...]:
+        """
+        Returns kinds of artifacts saved for every article
+        """
+        return (ArtifactType.CLEANED.value,)
+
+    def _get_conllu_options(self) -> dict[str, bool]:
+        """
+        Returns options of the CONLL-U artifact given to to_conllu()
+        """
+        return {}
+
+    def _save_outputs(self, article: Article) -> None:
+        """
+        Saves artifacts of the processed article
+        """
+        to_cleaned(article)
+
+    def _get_settings_hash(self) -> str:
+        """
+        Returns the hash of tag mappings and options of outputs, so that editing them
+        rebuilds the outputs just as a new VERSION does
+        """
+        settings = {
+            'outputs': list(self._get_output_kinds()),
+            'conllu_options': self._get_conllu_options(),
+            'tag_mappings': {name: _hash_file(TAGS_MAPPINGS_PATH / name)
+                             for name in self.TAG_MAPPINGS}
+        }
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _get_raw_hash(self, article_id: int) -> Optional[str]:
+        """
+        Returns the hash of the raw text of the article, None if the text has changed
+        since the dataset was scanned and the hash can no longer be trusted
+        """
+        file = self._corpus.get_manifest()[article_id].files[RAW]
+        return file.content_hash if is_file_unchanged(file) else None
+
+    def _is_up_to_date(self, article_id: int, state: ProcessingState) -> bool:
+        """
+        Checks whether all outputs of the article exist and were made from the same
+        raw text by the same version of the pipeline with the same settings
+        """
+        if not self._incremental \
+                or not state.is_processed(article_id, self._get_raw_hash(article_id)):
+            return False
+        files = self._corpus.get_manifest()[article_id].files
+        return all(kind in files for kind in self._get_output_kinds())
+
+    def _analyze_token(self,
+                       form: str,
+                       analyze: Callable[[], MorphologicalTokenDTO],
+                       context: str = '') -> MorphologicalTokenDTO:
+        """
+        Returns parameters of the form from the cache, calling the analyzer only on a miss
+        """
+        return self._cache.get_or_analyze(form, analyze, context)
 
     def _process(self, text: str) -> List[ConlluSentence]:
         """
         Returns the text representation as the list of ConlluSentence
         """
-        sentences = split_by_sentence(text)
-        conllu_sentences = []
-        for idx, sent in enumerate(sentences, 1):
-            word_list = sent.split()
-            conllu_wordlist = [ConlluToken(txt) for txt in word_list]
-            conllu_sentences.append(ConlluSentence(idx, sent, conllu_wordlist))
-        return conllu_sentences
+        text, sentences = tokenize(text)
+        return [ConlluSentence.from_spans(idx, text[start:end], text, token_spans)
+                for idx, (start, end, token_spans) in enumerate(sentences, 1)]
+
+    def _process_batch(self, texts: list[str]) -> list[List[ConlluSentence]]:
+        """
+        Returns sentences of several texts, a pipeline calling an analyzer
+        can process them together, for example with MystemBatchAnalyzer
+        """
+        return [self._process(text) for text in texts]
+
+    def _process_articles(self, articles: list[Article]) -> Iterator[List[ConlluSentence]]:
+        """
+        Processes texts of the articles in their order by batches, in a pool of processes
+        if asked; workers read raw texts themselves and send back only sentences
+        """
+        batches = [articles[start:start + self.BATCH_SIZE]
+                   for start in range(0, len(articles), self.BATCH_SIZE)]
+        if batches:
+            self._analyzers.warm_up(self.ANALYZERS)
+        if self._workers <= 1:
+            for batch in batches:
+                yield from self._process_batch([article.text for article in batch])
+            return
+        manifest = self._corpus.get_manifest()
+        paths = [[manifest[article.article_id].files[RAW].path for article in batch]
+                 for batch in batches]
+        with ProcessPoolExecutor(max_workers=self._workers,
+                                 initializer=_init_worker, initargs=(self,)) as executor:
+            for sentences, added in executor.map(_process_in_worker, paths):
+                self._cache.update(added)
+                yield from sentences
 
     def run(self) -> None:
         """
         Performs basic preprocessing and writes processed text to files
         """
-        for article in self._corpus.get_articles().values():
-            sentences = self._process(article.text)
+        state = ProcessingState(self._corpus.path_to_raw_txt_data, type(self).__name__,
+                                self.VERSION, self._get_settings_hash())
+        articles = [article for article in self._corpus.get_articles().values()
+                    if not self._is_up_to_date(article.article_id, state)]
+        for article, sentences in zip(articles, self._process_articles(articles)):
             article.set_conllu_sentences(sentences)
-            to_cleaned(article)
+            self._save_outputs(article)
+            state.add(article.article_id, self._get_raw_hash(article.article_id))
+            self._corpus.release_article(article.article_id)
+        state.save()
+        self._cache.save()
+
+
+# the pipeline of a worker process, set by _init_worker
+_WORKER_PIPELINE: MorphologicalAnalysisPipeline
+
+
+def _init_worker(pipeline: MorphologicalAnalysisPipeline) -> None:
+    """
+    Keeps the pipeline, together with its analyzer, for the whole life of a worker process
+    """
+    global _WORKER_PIPELINE  # pylint: disable=global-statement
+    _WORKER_PIPELINE = pipeline
+    pipeline._cache.record_added()  # pylint: disable=protected-access
+
+
+def _process_in_worker(paths: list[Path]) -> tuple[list[List[ConlluSentence]],
+                                                    list[tuple[str, str, MorphologicalTokenDTO]]]:
+    """
+    Processes a batch of raw texts in a worker process, returning sentences
+    together with entries the worker has added to its copy of the cache
+    """
+    texts = [read_text(path) for path in paths]
+    sentences = _WORKER_PIPELINE._process_batch(texts)  # pylint: disable=protected-access
+    return sentences, _WORKER_PIPELINE._cache.pop_added()  # pylint: disable=protected-access
 
 
 class AdvancedMorphologicalAnalysisPipeline(MorphologicalAnalysisPipeline):
     """
-    Preprocesses and morphologically annotates sentences into the CONLL-U format
+    Preprocesses and morphologically annotates sentences into the CONLL-U format:
+    Mystem analyzes words in their context and pymorphy2 gives tags of nouns,
+    both are taken from the pool of long-lived analyzers
     """
 
-    def __init__(self, corpus_manager: CorpusManager):
+    ANALYZERS = ('mystem', 'pymorphy2')
+    TAG_MAPPINGS = ('mystem_tags_mapping.json', 'opencorpora_tags_mapping.json')
+
+    def __init__(self,
+                 corpus_manager: CorpusManager,
+                 incremental: bool = False,
+                 workers: int = 1,
+                 cache: Optional[TokenAnalysisCache] = None):
         """
-        Initializes MorphologicalAnalysisPipeline
+        Initializes AdvancedMorphologicalAnalysisPipeline
         """
+        super().__init__(corpus_manager, incremental, workers, cache)
+        mystem_mapping, opencorpora_mapping = self.TAG_MAPPINGS
+        self._mystem_converter = MystemTagConverter(TAGS_MAPPINGS_PATH / mystem_mapping)
+        self._opencorpora_converter = OpenCorporaTagConverter(TAGS_MAPPINGS_PATH
+                                                              / opencorpora_mapping)
 
-    def _process(self, text: str) -> List[ConlluSentence]:
+    def _get_output_kinds(self) -> tuple[str, ...]:
         """
-        Returns the text representation as the list of ConlluSentence
+        Returns kinds of artifacts saved for every article
         """
+        return ArtifactType.CLEANED.value, ArtifactType.FULL_CONLLU.value
 
-    def run(self) -> None:
+    def _get_conllu_options(self) -> dict[str, bool]:
         """
-        Performs basic preprocessing and writes processed text to files
+        Returns options of the CONLL-U artifact with morphological tags and tags of nouns
         """
+        return {'include_morphological_tags': True, 'include_pymorphy_tags': True}
+
+    def _save_outputs(self, article: Article) -> None:
+        """
+        Saves cleaned text and sentences with tags of nouns given by pymorphy2
+        """
+        to_cleaned(article)
+        to_conllu(article, **self._get_conllu_options())
+
+    def _analyze_with_mystem(self,
+                             texts: list[str],
+                             mystem: MystemProtocol) -> list[List[ConlluSentence]]:
+        """
+        Analyzes sentences of the texts with a single call of Mystem
+        """
+        return MystemBatchAnalyzer(mystem, self._mystem_converter).process(texts)
+
+    def _analyze_with_pymorphy(self, form: str, morph: Any) -> MorphologicalTokenDTO:
+        """
+        Takes the most probable analysis of the form given by pymorphy2
+        """
+        parse = morph.parse(form)[0]
+        return MorphologicalTokenDTO(parse.normal_form,
+                                     self._opencorpora_converter.convert_pos(parse.tag),
+                                     self._opencorpora_converter.convert_morphological_tags(
+                                         parse.tag))
+
+    def _add_pymorphy_tags(self, sentence: ConlluSentence) -> None:
+        """
+        Replaces tags of nouns of the sentence with those given by pymorphy2,
+        which depend on the form only, so every form is parsed once per cache
+        """
+        columns = sentence.get_columns()
+        if columns is None:
+            return
+        for idx, (form, _, pos, _) in enumerate(columns):
+            if pos == 'NOUN':
+                form = form.lower()
+                parameters = self._analyze_token(
+                    form,
+                    partial(self._analyzers.run, 'pymorphy2',
+                            partial(self._analyze_with_pymorphy, form)),
+                    'pymorphy2')
+                columns.set_tags(idx, parameters.tags)
+
+    def _process_batch(self, texts: list[str]) -> list[List[ConlluSentence]]:
+        """
+        Returns sentences of several texts analyzed with one call of Mystem
+        """
+        articles: list[List[ConlluSentence]] = self._analyzers.run(
+            'mystem', partial(self._analyze_with_mystem, texts))
+        for sentences in articles:
+            for sentence in sentences:
+                self._add_pymorphy_tags(sentence)
+        return articles
+
+    def _process(self, text: str) -> List[ConlluSentence]:
+        """
+        Returns the text representation as the list of ConlluSentence
+        """
+        return self._process_batch([text])[0]
 
 
 def main() -> None:
@@ -254,6 +1220,10 @@ def main() -> None:
     pipeline = MorphologicalAnalysisPipeline(corpus_manager)
     pipeline.run()
 
+    advanced_pipeline = AdvancedMorphologicalAnalysisPipeline(
+        corpus_manager, cache=TokenAnalysisCache(path=ANALYSIS_CACHE_PATH))
+    advanced_pipeline.run()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,82 @@
+"""
+Tests for running MorphologicalAnalysisPipeline in a pool of processes
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.constants import ASSETS_PATH
+from lab_6_pipeline.pipeline import (CorpusManager,
+                                     MorphologicalAnalysisPipeline)
+from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+
+
+class ParallelPipelineTest(unittest.TestCase):
+    """
+    Tests for equal outputs of sequential and parallel runs
+    """
+
+    def setUp(self) -> None:
+        pipeline_test_files_setup(meta=False)
+        raw_text = (TEST_PATH / '1_raw.txt').read_text(encoding='utf-8')
+        paragraphs = raw_text.split('\n')
+        for idx in range(2, 9):
+            text = '\n'.join(paragraphs[idx % len(paragraphs):] + paragraphs[:idx])
+            (TEST_PATH / f'{idx}_raw.txt').write_text(text, encoding='utf-8')
+        article.ASSETS_PATH = TEST_PATH
+
+    def _run(self, **params) -> dict[str, bytes]:
+        corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH, **params.pop('corpus', {}))
+        MorphologicalAnalysisPipeline(corpus_manager, **params).run()
+        outputs = {path.name: path.read_bytes() for path in TEST_PATH.glob('*_cleaned.txt')}
+        for path in TEST_PATH.glob('*_cleaned.txt'):
+            path.unlink()
+        return outputs
+
+    @pytest.mark.stage_3_10_parallel_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_parallel_outputs_are_identical(self):
+        """
+        Ensure a pool of processes writes the same bytes as a single process
+        """
+        expected = self._run()
+        self.assertEqual(len(expected), 8)
+        self.assertEqual(self._run(workers=3), expected)
+
+    @pytest.mark.stage_3_10_parallel_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_parallel_lazy_outputs_are_identical(self):
+        """
+        Ensure lazy articles are processed in a pool of processes as well
+        """
+        expected = self._run()
+        self.assertEqual(self._run(workers=2, corpus={'lazy': True, 'use_mmap': True}),
+                         expected)
+
+    @pytest.mark.stage_3_10_parallel_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_parallel_run_is_incremental(self):
+        """
+        Ensure a parallel run processes only articles with outdated outputs
+        """
+        corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH)
+        MorphologicalAnalysisPipeline(corpus_manager, incremental=True, workers=2).run()
+        written = {path.name: path.stat().st_mtime_ns for path in TEST_PATH.glob('*_cleaned.txt')}
+        stale = TEST_PATH / '3_raw.tmp'
+        stale.write_text('Первое новое предложение. Второе новое предложение.',
+                         encoding='utf-8')
+        stale.replace(TEST_PATH / '3_raw.txt')
+        corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH)
+        MorphologicalAnalysisPipeline(corpus_manager, incremental=True, workers=2).run()
+        rewritten = [path.name for path in TEST_PATH.glob('*_cleaned.txt')
+                     if path.stat().st_mtime_ns != written[path.name]]
+        self.assertEqual(rewritten, ['3_cleaned.txt'])
+        self.assertEqual((TEST_PATH / '3_cleaned.txt').read_text(encoding='utf-8'),
+                         'первое новое предложение второе новое предложение')
+
+    def tearDown(self) -> None:
+        article.ASSETS_PATH = ASSETS_PATH
+        shutil.rmtree(TEST_PATH)
@@ -0,0 +1,120 @@
+"""
+Tests for analyzing several articles with a single call of Mystem
+"""
+import json
+import re
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article.ud import TagConverter
+from lab_6_pipeline.pipeline import BATCH_SEPARATOR, MystemBatchAnalyzer
+
+
+class FakeMystem:  # pylint: disable=too-few-public-methods
+    """
+    Splits texts into words and other chunks the way Mystem does, counting calls
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def analyze(self, text: str) -> list[dict]:
+        """
+        Analyzes cyrillic words, leaves other words without analysis
+        """
+        self.calls.append(text)
+        result: list[dict] = []
+        for chunk in re.findall(r'[А-Яа-яЁё]+|[A-Za-z]+|[^A-Za-zА-Яа-яЁё]+', text + '\n'):
+            if re.fullmatch(r'[А-Яа-яЁё]+', chunk):
+                result.append({'analysis': [{'lex': chunk.lower(), 'gr': 'S,жен,неод=им,ед'}],
+                               'text': chunk})
+            elif chunk.isalpha():
+                result.append({'analysis': [], 'text': chunk})
+            else:
+                result.append({'text': chunk})
+        return result
+
+
+class FakeTagConverter(TagConverter):
+    """
+    Takes POS from the mapping and keeps no other tags
+    """
+
+    def convert_pos(self, tags: str) -> str:  # type: ignore
+        return self._tag_mapping[self.pos][tags.split(',')[0]]
+
+    def convert_morphological_tags(self, tags: str) -> str:  # type: ignore
+        return ''
+
+
+class MystemBatchAnalyzerTest(unittest.TestCase):
+    """
+    Tests for joining and splitting texts analyzed together
+    """
+
+    def setUp(self) -> None:
+        TEST_PATH.mkdir(exist_ok=True)
+        mapping_path = TEST_PATH / 'mystem_tags_mapping.json'
+        with mapping_path.open('w', encoding='utf-8') as file:
+            json.dump({'POS': {'S': 'NOUN'}}, file)
+        self.mystem = FakeMystem()
+        self.analyzer = MystemBatchAnalyzer(self.mystem, FakeTagConverter(mapping_path))
+        self.texts = ['Первая статья про город. Вторая фраза статьи про 10 дом.',
+                      'Вторая статья, в ней test слово.',
+                      'Третья статья из одного предложения!']
+
+    @pytest.mark.stage_3_11_mystem_batch_checks
+    @pytest.mark.lab_6_pipeline
+    def test_texts_are_analyzed_with_one_call(self):
+        """
+        Ensure a batch is analyzed once and split back as if every text was analyzed alone
+        """
+        analyses = self.analyzer.analyze(self.texts)
+        self.assertEqual(len(self.mystem.calls), 1)
+        self.assertEqual(len(analyses), 3)
+        for text, analysis in zip(self.texts, analyses):
+            words = [item['text'] for item in analysis if 'analysis' in item]
+            expected = [item['text'] for item in FakeMystem().analyze(text) if 'analysis' in item]
+            self.assertEqual(words, expected)
+
+    @pytest.mark.stage_3_11_mystem_batch_checks
+    @pytest.mark.lab_6_pipeline
+    def test_sentences_of_articles_are_split_back(self):
+        """
+        Ensure every article gets its own sentences with tokens and parameters
+        """
+        articles = self.analyzer.process(self.texts)
+        self.assertEqual(len(self.mystem.calls), 1)
+        self.assertEqual([len(sentences) for sentences in articles], [2, 1, 1])
+
+        second_sentence = articles[0][1]
+        self.assertEqual(second_sentence.get_cleaned_sentence(),
+                         'вторая фраза статьи про 10 дом')
+        parameters = [token.get_morphological_parameters()
+                      for token in second_sentence.get_tokens()]
+        self.assertEqual([(item.lemma, item.pos) for item in parameters],
+                         [('вторая', 'NOUN'), ('фраза', 'NOUN'), ('статьи', 'NOUN'),
+                          ('про', 'NOUN'), ('10', 'NUM'), ('дом', 'NOUN'), ('.', 'PUNCT')])
+
+        tokens = articles[1][0].get_tokens()
+        self.assertEqual([token.get_morphological_parameters().pos for token in tokens][-3:],
+                         ['X', 'NOUN', 'PUNCT'])
+        self.assertNotEqual(articles[2][0].get_tokens()[-1].get_morphological_parameters().pos,
+                            'PUNCT')
+
+    @pytest.mark.stage_3_11_mystem_batch_checks
+    @pytest.mark.lab_6_pipeline
+    def test_text_with_separator_is_analyzed_alone(self):
+        """
+        Ensure texts are not joined when the separator cannot be trusted
+        """
+        texts = self.texts + [f'Статья со словом {BATCH_SEPARATOR} внутри.']
+        analyses = self.analyzer.analyze(texts)
+        self.assertEqual(self.mystem.calls, texts)
+        self.assertIn(BATCH_SEPARATOR, [item['text'] for item in analyses[-1]])
+
+    def tearDown(self) -> None:
+        shutil.rmtree(TEST_PATH)
@@ -0,0 +1,144 @@
+# pylint: disable=protected-access
+"""
+Tests for the cache of token analyses shared across articles
+"""
+import json
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.constants import ASSETS_PATH
+from lab_6_pipeline.pipeline import (AdvancedMorphologicalAnalysisPipeline,
+                                     CorpusManager, MorphologicalTokenDTO,
+                                     TokenAnalysisCache)
+from lab_6_pipeline.tests.s3_13_analyzer_pool_test import \
+    create_morphological_pool
+from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+
+
+class TokenAnalysisCacheTest(unittest.TestCase):
+    """
+    Tests for eviction, counters and persistence of the cache
+    """
+
+    def setUp(self) -> None:
+        TEST_PATH.mkdir(exist_ok=True)
+        self.cache_path = TEST_PATH / 'analysis_cache.json'
+
+    @pytest.mark.stage_3_12_analysis_cache_checks
+    @pytest.mark.lab_6_pipeline
+    def test_least_recently_used_form_is_evicted(self):
+        """
+        Ensure the cache keeps at most max_size entries, evicting the least recently used
+        """
+        cache = TokenAnalysisCache(max_size=2)
+        cache.put('мама', MorphologicalTokenDTO('мама', 'NOUN'))
+        cache.put('мыла', MorphologicalTokenDTO('мыть', 'VERB'))
+        self.assertEqual(cache.get('мама').lemma, 'мама')
+        cache.put('раму', MorphologicalTokenDTO('рама', 'NOUN'))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('мыла'))
+        self.assertEqual(cache.get('раму').pos, 'NOUN')
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    @pytest.mark.stage_3_12_analysis_cache_checks
+    @pytest.mark.lab_6_pipeline
+    def test_form_is_analyzed_once_per_context(self):
+        """
+        Ensure the analyzer is called only on misses and contexts are told apart
+        """
+        cache = TokenAnalysisCache()
+        analyze = mock.Mock(return_value=MorphologicalTokenDTO('стекло', 'NOUN'))
+        for _ in range(3):
+            cache.get_or_analyze('стекло', analyze, 'S')
+        cache.get_or_analyze('стекло', analyze, 'V')
+        self.assertEqual(analyze.call_count, 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    @pytest.mark.stage_3_12_analysis_cache_checks
+    @pytest.mark.lab_6_pipeline
+    def test_cache_is_saved_between_runs(self):
+        """
+        Ensure saved entries are loaded in the order of their use
+        """
+        cache = TokenAnalysisCache(max_size=2, path=self.cache_path)
+        cache.put('мама', MorphologicalTokenDTO('мама', 'NOUN', 'Case=Nom'))
+        cache.put('мыла', MorphologicalTokenDTO('мыть', 'VERB'), 'V')
+        cache.get('мама')
+        cache.save()
+
+        loaded = TokenAnalysisCache(max_size=2, path=self.cache_path)
+        self.assertEqual(loaded.get('мыла', 'V').lemma, 'мыть')
+        self.assertEqual(loaded.get('мама').tags, 'Case=Nom')
+        loaded.put('раму', MorphologicalTokenDTO('рама', 'NOUN'))
+        self.assertIsNone(loaded.get('мыла', 'V'))
+
+    @pytest.mark.stage_3_12_analysis_cache_checks
+    @pytest.mark.lab_6_pipeline
+    def test_corrupted_cache_is_ignored(self):
+        """
+        Ensure a broken cache file leaves the cache empty
+        """
+        self.cache_path.write_text('[["мама", "", "мама"', encoding='utf-8')
+        self.assertEqual(len(TokenAnalysisCache(path=self.cache_path)), 0)
+        with self.cache_path.open('w', encoding='utf-8') as file:
+            json.dump([['мама', '', 'мама', 'NOUN']], file)
+        self.assertEqual(len(TokenAnalysisCache(path=self.cache_path)), 0)
+
+    @pytest.mark.stage_3_12_analysis_cache_checks
+    @pytest.mark.lab_6_pipeline
+    def test_pipeline_saves_cache(self):
+        """
+        Ensure the advanced pipeline parses every noun form with pymorphy2 once,
+        saves the parsed forms and reuses them in the next run
+        """
+        pipeline_test_files_setup(meta=True)
+        article.ASSETS_PATH = TEST_PATH
+        pool = create_morphological_pool()
+        pipe = AdvancedMorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH),
+                                                     cache=TokenAnalysisCache(path=self.cache_path))
+        pipe._analyzers = pool
+        pipe.run()
+
+        # the first call checks pymorphy2 when the pool is warmed up
+        calls = pool.get('pymorphy2').calls[1:]
+        self.assertTrue(calls)
+        self.assertEqual(len(calls), len(set(calls)))
+        saved = TokenAnalysisCache(path=self.cache_path)
+        self.assertEqual(len(saved), len(calls))
+        self.assertEqual(saved.get(calls[0], 'pymorphy2').lemma, calls[0])
+
+        pool = create_morphological_pool()
+        pipe = AdvancedMorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH),
+                                                     cache=TokenAnalysisCache(path=self.cache_path))
+        pipe._analyzers = pool
+        pipe.run()
+        self.assertEqual(pool.get('pymorphy2').calls, ['проверка'])
+
+    @pytest.mark.stage_3_12_analysis_cache_checks
+    @pytest.mark.lab_6_pipeline
+    def test_workers_fill_cache_of_pipeline(self):
+        """
+        Ensure forms parsed in worker processes are added to the cache the pipeline saves
+        """
+        pipeline_test_files_setup(meta=True)
+        article.ASSETS_PATH = TEST_PATH
+        pool = create_morphological_pool()
+        pipe = AdvancedMorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH),
+                                                     workers=2,
+                                                     cache=TokenAnalysisCache(path=self.cache_path))
+        pipe._analyzers = pool
+        pipe.run()
+
+        self.assertEqual(pool.get('pymorphy2').calls, ['проверка'])
+        saved = TokenAnalysisCache(path=self.cache_path)
+        self.assertTrue(len(saved))
+        self.assertEqual(saved.get('мама', 'pymorphy2').pos, 'NOUN')
+
+    def tearDown(self) -> None:
+        article.ASSETS_PATH = ASSETS_PATH
+        shutil.rmtree(TEST_PATH)
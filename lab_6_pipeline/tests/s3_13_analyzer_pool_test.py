@@ -0,0 +1,249 @@
+# pylint: disable=protected-access
+"""
+Tests for the pool of long-lived analyzers
+"""
+import multiprocessing
+import os
+import pickle
+import shutil
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.constants import ASSETS_PATH
+from lab_6_pipeline.analyzers import ANALYZER_POOL, AnalyzerPool, AnalyzerSpec
+from lab_6_pipeline.pipeline import (AdvancedMorphologicalAnalysisPipeline,
+                                     CorpusManager,
+                                     MorphologicalAnalysisPipeline)
+from lab_6_pipeline.tests.s3_11_mystem_batch_test import FakeMystem
+from lab_6_pipeline.tests.s3_14_tag_converters_test import FakeOpencorporaTag
+from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+
+
+class FakeAnalyzer:  # pylint: disable=too-few-public-methods
+    """
+    Remembers the process that started it and can be broken
+    """
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.broken = False
+
+    def analyze(self, text: str) -> list[dict]:
+        """
+        Fails once broken
+        """
+        if self.broken:
+            raise BrokenPipeError
+        return [{'text': text}]
+
+
+def check_fake(analyzer: FakeAnalyzer) -> object:
+    """
+    Analyzes a word
+    """
+    return analyzer.analyze('проверка')
+
+
+def create_pool() -> AnalyzerPool:
+    """
+    Creates a pool of a fork safe and a process bound analyzer
+    """
+    return AnalyzerPool({'process': AnalyzerSpec(FakeAnalyzer, check_fake, fork_safe=False),
+                         'dictionary': AnalyzerSpec(FakeAnalyzer, check_fake, fork_safe=True)})
+
+
+FORKED_POOL = create_pool()
+
+
+class FakeParse:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in for pymorphy2.analyzer.Parse
+    """
+
+    def __init__(self, normal_form: str, tag: FakeOpencorporaTag) -> None:
+        self.normal_form = normal_form
+        self.tag = tag
+
+
+class FakeMorphAnalyzer:  # pylint: disable=too-few-public-methods
+    """
+    Analyzes every word as an inanimate singular noun, counting calls
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def parse(self, word: str) -> list[FakeParse]:
+        """
+        Returns the only analysis of the word
+        """
+        self.calls.append(word)
+        return [FakeParse(word.lower(), FakeOpencorporaTag('NOUN', 'inan', 'femn', 'sing', 'accs'))]
+
+
+def check_mystem(mystem: FakeMystem) -> object:
+    """
+    Analyzes a word with Mystem
+    """
+    return mystem.analyze('проверка')
+
+
+def check_morph(morph: FakeMorphAnalyzer) -> object:
+    """
+    Parses a word with pymorphy2
+    """
+    return morph.parse('проверка')
+
+
+def create_morphological_pool() -> AnalyzerPool:
+    """
+    Creates a pool of fake Mystem and pymorphy2
+    """
+    return AnalyzerPool({
+        'mystem': AnalyzerSpec(FakeMystem, check_mystem, fork_safe=False),
+        'pymorphy2': AnalyzerSpec(FakeMorphAnalyzer, check_morph, fork_safe=True)
+    })
+
+
+def get_start_pids() -> tuple[int, int, int]:
+    """
+    Returns the worker pid and pids of processes that started analyzers of the worker
+    """
+    return (os.getpid(), FORKED_POOL.get('process').pid, FORKED_POOL.get('dictionary').pid)
+
+
+class AnalyzerPoolTest(unittest.TestCase):
+    """
+    Tests for starting, checking and sharing analyzers
+    """
+
+    def setUp(self) -> None:
+        self.pool = create_pool()
+
+    @pytest.mark.stage_3_13_analyzer_pool_checks
+    @pytest.mark.lab_6_pipeline
+    def test_analyzer_is_started_lazily_once(self):
+        """
+        Ensure an analyzer is started on its first use and reused afterwards
+        """
+        self.assertEqual(self.pool.starts, 0)
+        first = self.pool.get('process')
+        self.assertIs(self.pool.get('process'), first)
+        self.assertIs(self.pool.check('process'), first)
+        self.assertEqual(self.pool.starts, 1)
+
+    @pytest.mark.stage_3_13_analyzer_pool_checks
+    @pytest.mark.lab_6_pipeline
+    def test_broken_analyzer_is_restarted(self):
+        """
+        Ensure an analyzer failing its check or a task is replaced
+        """
+        broken = self.pool.get('process')
+        broken.broken = True
+        restarted = self.pool.check('process')
+        self.assertIsNot(restarted, broken)
+
+        restarted.broken = True
+        result = self.pool.run('process', lambda analyzer: analyzer.analyze('мама'))
+        self.assertEqual(result, [{'text': 'мама'}])
+        self.assertEqual(self.pool.starts, 3)
+
+    @pytest.mark.stage_3_13_analyzer_pool_checks
+    @pytest.mark.lab_6_pipeline
+    def test_forked_process_restarts_process_bound_analyzers(self):
+        """
+        Ensure a forked worker keeps fork safe analyzers and starts the others again
+        """
+        FORKED_POOL.warm_up(('process', 'dictionary'))
+        context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            worker_pid, process_pid, dictionary_pid = executor.submit(get_start_pids).result()
+        self.assertNotEqual(worker_pid, os.getpid())
+        self.assertEqual(process_pid, worker_pid)
+        self.assertEqual(dictionary_pid, os.getpid())
+        self.assertEqual(FORKED_POOL.get('process').pid, os.getpid())
+
+    @pytest.mark.stage_3_13_analyzer_pool_checks
+    @pytest.mark.lab_6_pipeline
+    def test_pid_change_drops_process_bound_analyzers(self):
+        """
+        Ensure a change of the process is noticed without forking
+        """
+        process = self.pool.get('process')
+        dictionary = self.pool.get('dictionary')
+        with mock.patch.object(os, 'getpid', return_value=os.getpid() + 1):
+            self.assertIsNot(self.pool.get('process'), process)
+            self.assertIs(self.pool.get('dictionary'), dictionary)
+        self.assertIn(process, self.pool._inherited)
+
+    @pytest.mark.stage_3_13_analyzer_pool_checks
+    @pytest.mark.lab_6_pipeline
+    def test_pickled_pool_starts_own_analyzers(self):
+        """
+        Ensure a pool sent to another process does not carry analyzers
+        """
+        self.pool.get('dictionary')
+        restored = pickle.loads(pickle.dumps(self.pool))
+        self.assertEqual(restored.starts, 0)
+        self.assertIsInstance(restored.get('dictionary'), FakeAnalyzer)
+
+
+class PipelineAnalyzersTest(unittest.TestCase):
+    """
+    Tests for analyzers used by pipelines
+    """
+
+    def setUp(self) -> None:
+        pipeline_test_files_setup(meta=True)
+        article.ASSETS_PATH = TEST_PATH
+
+    @pytest.mark.stage_3_13_analyzer_pool_checks
+    @pytest.mark.lab_6_pipeline
+    def test_pipelines_share_pool_and_warm_it_up(self):
+        """
+        Ensure pipelines share the pool and start their analyzers before processing
+        """
+        first = MorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH))
+        second = MorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH))
+        self.assertIs(first._analyzers, ANALYZER_POOL)
+        self.assertIs(second._analyzers, first._analyzers)
+
+        pool = create_pool()
+        first._analyzers = pool
+        with mock.patch.object(MorphologicalAnalysisPipeline, 'ANALYZERS', ('dictionary',)):
+            first.run()
+            first.run()
+        self.assertEqual(pool.starts, 1)
+        self.assertNotIn('process', pool._analyzers)
+
+    @pytest.mark.stage_3_13_analyzer_pool_checks
+    @pytest.mark.lab_6_pipeline
+    def test_advanced_pipeline_takes_analyzers_from_pool(self):
+        """
+        Ensure the advanced pipeline starts Mystem and pymorphy2 once,
+        analyzes a batch of articles with one call of Mystem and tags nouns with pymorphy2
+        """
+        shutil.copyfile(TEST_PATH / '1_raw.txt', TEST_PATH / '2_raw.txt')
+        pipe = AdvancedMorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH))
+        pool = create_morphological_pool()
+        pipe._analyzers = pool
+        pipe.run()
+
+        self.assertEqual(pool.starts, 2)
+        # one call checks Mystem when the pool is warmed up, the other analyzes both articles
+        self.assertEqual(len(pool.get('mystem').calls), 2)
+        self.assertTrue(pool.get('pymorphy2').calls)
+        conllu = (TEST_PATH / '1_full_conllu.conllu').read_text(encoding='utf-8')
+        self.assertEqual(conllu, (TEST_PATH / '2_full_conllu.conllu').read_text(encoding='utf-8'))
+        noun_line = next(line for line in conllu.splitlines() if '\tNOUN\t' in line)
+        self.assertTrue(noun_line.endswith('\tAnimacy=Inan|Case=Acc|Gender=Fem|Number=Sing'
+                                           '\t0\troot\t_\t_'))
+
+    def tearDown(self) -> None:
+        article.ASSETS_PATH = ASSETS_PATH
+        shutil.rmtree(TEST_PATH)
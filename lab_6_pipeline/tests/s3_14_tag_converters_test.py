@@ -0,0 +1,124 @@
+# pylint: disable=protected-access
+"""
+Tests for compiled conversion of Mystem and OpenCorpora tags
+"""
+import json
+import unittest
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+import pytest
+
+from lab_6_pipeline.pipeline import MystemTagConverter, OpenCorporaTagConverter
+
+MAPPING_PATH = Path(__file__).parent.parent / 'data'
+
+
+class FakeOpencorporaTag:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in for pymorphy2.tagset.OpencorporaTag
+    """
+
+    # pylint: disable=too-many-arguments, invalid-name
+    def __init__(self, POS: Optional[str], animacy: Optional[str] = None,
+                 gender: Optional[str] = None, number: Optional[str] = None,
+                 case: Optional[str] = None, tense: Optional[str] = None) -> None:
+        self.POS = POS
+        self.animacy = animacy
+        self.gender = gender
+        self.number = number
+        self.case = case
+        self.tense = tense
+
+    def __str__(self) -> str:
+        return ','.join(str(value) for value in self.__dict__.values())
+
+
+class MystemTagConverterTest(unittest.TestCase):
+    """
+    Tests for conversion of Mystem tags
+    """
+
+    def setUp(self) -> None:
+        self.converter = MystemTagConverter(MAPPING_PATH / 'mystem_tags_mapping.json')
+
+    @pytest.mark.stage_3_14_tag_converters_checks
+    @pytest.mark.lab_6_pipeline
+    def test_tags_are_converted(self):
+        """
+        Ensure POS and features are converted, features in the order of categories
+        """
+        cases = [('A=им,ед,полн,жен', 'ADJ', 'Case=Nom|Gender=Fem|Number=Sing'),
+                 ('S,жен,од=им,ед', 'NOUN', 'Animacy=Anim|Case=Nom|Gender=Fem|Number=Sing'),
+                 ('V,несов,нп=прош,ед,изъяв,жен', 'VERB', 'Gender=Fem|Number=Sing|Tense=Past'),
+                 ('S,жен,неод=(вин,мн|им,мн)', 'NOUN',
+                  'Animacy=Inan|Case=Acc|Gender=Fem|Number=Plur'),
+                 ('ADV=', 'ADV', ''),
+                 ('PR=', 'ADP', '')]
+        for tags, pos, features in cases:
+            self.assertEqual(self.converter.convert_pos(tags), pos)
+            self.assertEqual(self.converter.convert_morphological_tags(tags), features)
+
+    @pytest.mark.stage_3_14_tag_converters_checks
+    @pytest.mark.lab_6_pipeline
+    def test_distinct_tags_are_converted_once(self):
+        """
+        Ensure a compiled converter converts each distinct tags once,
+        while a plain one gives the same results converting every time
+        """
+        tags = ['A=им,ед,полн,жен', 'S,жен,од=им,ед', 'A=им,ед,полн,жен'] * 100
+        plain = MystemTagConverter(MAPPING_PATH / 'mystem_tags_mapping.json', compiled=False)
+        converter = self.converter
+        with mock.patch.object(converter, '_convert', wraps=converter._convert) as convert:
+            compiled_results = [(self.converter.convert_pos(item),
+                                 self.converter.convert_morphological_tags(item)) for item in tags]
+        self.assertEqual(convert.call_count, 2)
+        self.assertEqual(compiled_results, [(plain.convert_pos(item),
+                                             plain.convert_morphological_tags(item))
+                                            for item in tags])
+        self.assertEqual(plain.get_memo_table(), {})
+
+    @pytest.mark.stage_3_14_tag_converters_checks
+    @pytest.mark.lab_6_pipeline
+    def test_memo_table_is_reused(self):
+        """
+        Ensure conversions of a previous run, saved as JSON, need no conversion
+        """
+        self.converter.convert_pos('A=им,ед,полн,жен')
+        saved = json.loads(json.dumps(self.converter.get_memo_table()))
+        converter = MystemTagConverter(MAPPING_PATH / 'mystem_tags_mapping.json')
+        converter.update_memo_table(saved)
+        with mock.patch.object(converter, '_convert') as convert:
+            self.assertEqual(converter.convert_morphological_tags('A=им,ед,полн,жен'),
+                             'Case=Nom|Gender=Fem|Number=Sing')
+        convert.assert_not_called()
+
+
+class OpenCorporaTagConverterTest(unittest.TestCase):
+    """
+    Tests for conversion of OpenCorpora tags
+    """
+
+    def setUp(self) -> None:
+        self.converter = OpenCorporaTagConverter(MAPPING_PATH / 'opencorpora_tags_mapping.json')
+
+    @pytest.mark.stage_3_14_tag_converters_checks
+    @pytest.mark.lab_6_pipeline
+    def test_tags_are_converted_once(self):
+        """
+        Ensure tags are converted in the order of categories, each distinct tags once
+        """
+        tags = [FakeOpencorporaTag('NOUN', 'inan', 'masc', 'sing', 'accs'),
+                FakeOpencorporaTag('VERB', gender='femn', number='sing', tense='past'),
+                FakeOpencorporaTag(None)]
+        converter = self.converter
+        with mock.patch.object(converter, '_convert', wraps=converter._convert) as convert:
+            for _ in range(3):
+                converted = [(self.converter.convert_pos(item),
+                              self.converter.convert_morphological_tags(item)) for item in tags]
+        self.assertEqual(converted, [('NOUN', 'Animacy=Inan|Case=Acc|Gender=Masc|Number=Sing'),
+                                     ('VERB', 'Gender=Fem|Number=Sing|Tense=Past'),
+                                     ('X', '')])
+        self.assertEqual(convert.call_count, 3)
+        self.assertEqual(len(self.converter.get_memo_table()), 3)
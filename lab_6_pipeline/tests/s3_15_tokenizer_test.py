@@ -0,0 +1,86 @@
+# pylint: disable=protected-access
+"""
+Tests for finding sentences and tokens in a single pass
+"""
+import random
+import unittest
+
+import pytest
+
+from config.test_params import PIPE_TEST_FILES_FOLDER
+from core_utils.article.article import split_by_sentence
+from lab_6_pipeline.benchmark import process_by_sentence
+from lab_6_pipeline.pipeline import MorphologicalAnalysisPipeline, tokenize
+
+
+class TokenizerTest(unittest.TestCase):
+    """
+    Tests for equality of the single pass with splitting sentences and tokens separately
+    """
+
+    def setUp(self) -> None:
+        self.pipeline = MorphologicalAnalysisPipeline.__new__(MorphologicalAnalysisPipeline)
+
+    def assert_same_sentences(self, text: str) -> None:
+        """
+        Compares texts, tokens and cleaned forms of sentences found both ways
+        """
+        expected = process_by_sentence(text)
+        actual = self.pipeline._process(text)
+        self.assertEqual([sentence._text for sentence in actual],
+                         [sentence._text for sentence in expected], repr(text))
+        self.assertEqual([sentence.get_cleaned_sentence() for sentence in actual],
+                         [sentence.get_cleaned_sentence() for sentence in expected], repr(text))
+        self.assertEqual([[token._text for token in sentence.get_tokens()] for sentence in actual],
+                         [[token._text for token in sentence.get_tokens()]
+                          for sentence in expected], repr(text))
+
+    @pytest.mark.stage_3_15_tokenizer_checks
+    @pytest.mark.lab_6_pipeline
+    def test_test_file_is_split_the_same_way(self):
+        """
+        Ensure sentences and tokens of the raw test file are the same
+        """
+        text = (PIPE_TEST_FILES_FOLDER / '1_raw.txt').read_text(encoding='utf-8')
+        self.assert_same_sentences(text)
+        self.assert_same_sentences('\n'.join([text] * 5))
+
+    @pytest.mark.stage_3_15_tokenizer_checks
+    @pytest.mark.lab_6_pipeline
+    def test_random_texts_are_split_the_same_way(self):
+        """
+        Ensure random texts made of separators, quotes and capital letters are split the same way
+        """
+        alphabet = ['А', 'Я', 'а', 'б', 'Ё', 'x', '1', '.', '!', '?', '"', ',', '-', '|',
+                    ' ', ' ', '\n', '\t', '\xa0']
+        generator = random.Random(23)
+        for _ in range(2000):
+            self.assert_same_sentences(''.join(generator.choice(alphabet)
+                                               for _ in range(generator.randint(0, 80))))
+
+    @pytest.mark.stage_3_15_tokenizer_checks
+    @pytest.mark.lab_6_pipeline
+    def test_spans_point_into_normalized_text(self):
+        """
+        Ensure spans are offsets into the text with line breaks replaced
+        """
+        text, sentences = tokenize('Первое предложение.\nВторое предложение! Третье, короткое.')
+        self.assertEqual(text, 'Первое предложение.. Второе предложение! Третье, короткое.')
+        self.assertEqual([text[start:end] for start, end, _ in sentences],
+                         split_by_sentence('Первое предложение.\nВторое предложение! '
+                                           'Третье, короткое.'))
+        self.assertEqual([text[start:end] for start, end in sentences[2][2]],
+                         ['Третье,', 'короткое.'])
+
+    @pytest.mark.stage_3_15_tokenizer_checks
+    @pytest.mark.lab_6_pipeline
+    def test_tokens_are_created_on_demand(self):
+        """
+        Ensure tokens are not created until they are asked for
+        """
+        sentence = self.pipeline._process('Мама мыла раму, а папа читал.')[0]
+        self.assertEqual(sentence.get_cleaned_sentence(), 'мама мыла раму а папа читал')
+        self.assertEqual(sentence._tokens, [])
+        tokens = sentence.get_tokens()
+        self.assertEqual(len(tokens), 6)
+        self.assertIs(sentence.get_tokens(), tokens)
@@ -0,0 +1,109 @@
+# pylint: disable=protected-access
+"""
+Tests for sentences storing their tokens in columns
+"""
+import pickle
+import unittest
+
+import pytest
+
+from lab_6_pipeline.pipeline import (ConlluSentence, ConlluToken,
+                                     MorphologicalTokenDTO, StringTable,
+                                     TokenColumns)
+
+TOKENS = (
+    ('Мама', MorphologicalTokenDTO('мама', 'NOUN', 'Case=Nom|Number=Sing')),
+    ('мыла', MorphologicalTokenDTO('мыть', 'VERB', 'Number=Sing|Tense=Past')),
+    ('маму', MorphologicalTokenDTO('мама', 'NOUN', 'Case=Acc|Number=Sing')),
+    ('.', MorphologicalTokenDTO('.', 'PUNCT'))
+)
+
+
+class ColumnarSentenceTest(unittest.TestCase):
+    """
+    Tests for sentences whose tokens are ids of interned strings
+    """
+
+    def setUp(self) -> None:
+        self.table = StringTable()
+        columns = TokenColumns(self.table)
+        for form, parameters in TOKENS:
+            columns.append(form, parameters)
+        self.sentence = ConlluSentence.from_columns(0, 'Мама мыла маму.', columns)
+
+        tokens = []
+        for form, parameters in TOKENS:
+            tokens.append(ConlluToken(form))
+            tokens[-1].set_morphological_parameters(parameters)
+        self.object_sentence = ConlluSentence(0, 'Мама мыла маму.', tokens)
+
+    @pytest.mark.stage_3_16_columnar_sentence_checks
+    @pytest.mark.lab_6_pipeline
+    def test_strings_are_interned(self):
+        """
+        Ensure every distinct string is stored once
+        """
+        self.assertEqual(len(self.table), 13)
+        self.assertEqual(self.table.intern('мама'), self.table.intern('мама'))
+        self.assertEqual(list(self.sentence._columns.lemmas)[0],
+                         list(self.sentence._columns.lemmas)[2])
+
+    @pytest.mark.stage_3_16_columnar_sentence_checks
+    @pytest.mark.lab_6_pipeline
+    def test_sentence_is_read_without_tokens(self):
+        """
+        Ensure text, CONLL-U text and POS are the same as of a sentence of tokens
+        and no ConlluToken is created for them
+        """
+        for include_morphological_tags in (False, True):
+            self.assertEqual(self.sentence.get_conllu_text(include_morphological_tags),
+                             self.object_sentence.get_conllu_text(include_morphological_tags))
+        self.assertEqual(self.sentence.get_cleaned_sentence(),
+                         self.object_sentence.get_cleaned_sentence())
+        self.assertEqual(self.sentence.get_pos_frequencies(), {'NOUN': 2, 'VERB': 1, 'PUNCT': 1})
+        self.assertEqual(self.object_sentence.get_pos_frequencies(),
+                         self.sentence.get_pos_frequencies())
+        self.assertEqual(self.sentence._tokens, [])
+
+        self.assertEqual(self.sentence.get_conllu_text(True).splitlines()[:3], [
+            '# sent_id = 0',
+            '# text = Мама мыла маму.',
+            '1\tМама\tмама\tNOUN\t_\tCase=Nom|Number=Sing\t0\troot\t_\t_'
+        ])
+        self.assertTrue(self.sentence.get_conllu_text(False).endswith(
+            '4\t.\t.\tPUNCT\t_\t_\t0\troot\t_\t_\n'))
+
+    @pytest.mark.stage_3_16_columnar_sentence_checks
+    @pytest.mark.lab_6_pipeline
+    def test_tokens_are_views_of_columns(self):
+        """
+        Ensure tokens are created on demand without replacing the columns,
+        and their parameters are written back to the columns
+        """
+        tokens = self.sentence.get_tokens()
+        self.assertEqual([token._text for token in tokens], ['Мама', 'мыла', 'маму', '.'])
+        self.assertEqual(tokens[1].get_morphological_parameters().lemma, 'мыть')
+        self.assertIsNotNone(self.sentence._columns)
+        self.assertEqual(self.sentence._tokens, [])
+
+        tokens[2].set_morphological_parameters(MorphologicalTokenDTO('мама', 'NOUN', 'Case=Acc'))
+        self.assertEqual(list(self.sentence._columns)[2], ('маму', 'мама', 'NOUN', 'Case=Acc'))
+        self.assertEqual(self.sentence.get_tokens()[2].get_morphological_parameters().tags,
+                         'Case=Acc')
+
+    @pytest.mark.stage_3_16_columnar_sentence_checks
+    @pytest.mark.lab_6_pipeline
+    def test_sentences_are_pickled_with_their_table(self):
+        """
+        Ensure sentences sent to another process keep sharing their string table
+        """
+        second = ConlluSentence.from_columns(1, 'Мама.', TokenColumns(self.table))
+        second._columns.append('Мама', TOKENS[0][1])
+        first, second = pickle.loads(pickle.dumps([self.sentence, second]))
+        self.assertIs(first._columns.table, second._columns.table)
+        self.assertEqual(first._columns.table.intern('мыла'), self.table.intern('мыла'))
+        self.assertEqual(second.get_conllu_text(True), '\n'.join([
+            '# sent_id = 1',
+            '# text = Мама.',
+            '1\tМама\tмама\tNOUN\t_\tCase=Nom|Number=Sing\t0\troot\t_\t_'
+        ]) + '\n')
@@ -0,0 +1,60 @@
+# pylint: disable=protected-access
+"""
+Tests for CorpusManager reading texts of articles on demand
+"""
+import shutil
+import unittest
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.constants import ASSETS_PATH
+from lab_6_pipeline.pipeline import (CorpusManager,
+                                     MorphologicalAnalysisPipeline)
+from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+
+
+class LazyCorpusManagerTest(unittest.TestCase):
+    """
+    Tests for the lazy mode of CorpusManager
+    """
+
+    def setUp(self) -> None:
+        pipeline_test_files_setup(meta=True)
+        shutil.copyfile(TEST_PATH / '1_raw.txt', TEST_PATH / '2_raw.txt')
+        article.ASSETS_PATH = TEST_PATH
+
+    @pytest.mark.stage_3_7_lazy_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_texts_are_read_on_access(self):
+        """
+        Ensure a lazy CorpusManager reads no text until it is accessed
+        """
+        eager = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_articles()
+        lazy = CorpusManager(path_to_raw_txt_data=TEST_PATH, lazy=True,
+                             use_mmap=True).get_articles()
+        self.assertEqual(sorted(lazy), sorted(eager))
+        self.assertTrue(all(item._text is None for item in lazy.values()))
+        for article_id, item in lazy.items():
+            self.assertEqual(item.text, eager[article_id].text)
+
+    @pytest.mark.stage_3_7_lazy_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_pipeline_releases_processed_articles(self):
+        """
+        Ensure the pipeline frees lazy articles and writes the same outputs
+        """
+        MorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH)).run()
+        expected = (TEST_PATH / '1_cleaned.txt').read_text(encoding='utf-8')
+
+        corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH, lazy=True)
+        MorphologicalAnalysisPipeline(corpus_manager).run()
+        for item in corpus_manager.get_articles().values():
+            self.assertIsNone(item._text)
+            self.assertFalse(item.get_conllu_sentences())
+        self.assertEqual((TEST_PATH / '1_cleaned.txt').read_text(encoding='utf-8'), expected)
+
+    def tearDown(self) -> None:
+        article.ASSETS_PATH = ASSETS_PATH
+        shutil.rmtree(TEST_PATH)
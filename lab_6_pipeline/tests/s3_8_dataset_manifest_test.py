@@ -0,0 +1,136 @@
+# pylint: disable=protected-access
+"""
+Tests for the manifest of dataset files built by CorpusManager
+"""
+import os
+import shutil
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from lab_6_pipeline import pipeline
+from lab_6_pipeline.pipeline import (CorpusManager, EmptyDirectoryError,
+                                     InconsistentDatasetError)
+from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+
+
+class DatasetManifestTest(unittest.TestCase):
+    """
+    Tests for a single listing of the dataset
+    """
+
+    def setUp(self) -> None:
+        pipeline_test_files_setup(meta=True)
+        shutil.copyfile(TEST_PATH / '1_raw.txt', TEST_PATH / '2_raw.txt')
+        (TEST_PATH / '1_cleaned.txt').write_text('текст', encoding='utf-8')
+        (TEST_PATH / '1_pos_conllu.conllu').write_text('', encoding='utf-8')
+        for name in ('.3_raw.txt.tmp', '3_raw.json', 'notes.txt'):
+            (TEST_PATH / name).write_text('другое', encoding='utf-8')
+        (TEST_PATH / '4_raw.txt').mkdir()
+
+    @pytest.mark.stage_3_8_dataset_manifest_checks
+    @pytest.mark.lab_6_pipeline
+    def test_manifest_describes_artifacts(self):
+        """
+        Ensure the manifest keeps kinds, paths, sizes and modification times of artifacts
+        """
+        manifest = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_manifest()
+        self.assertEqual(sorted(manifest), [1, 2])
+        self.assertEqual(sorted(manifest[1].files),
+                         ['cleaned', 'meta', 'pos_conllu', 'raw'])
+        self.assertEqual(list(manifest[2].files), ['raw'])
+        raw = manifest[1].files['raw']
+        self.assertEqual(raw.path, TEST_PATH / '1_raw.txt')
+        self.assertEqual(raw.size, (TEST_PATH / '1_raw.txt').stat().st_size)
+        self.assertEqual(raw.mtime, (TEST_PATH / '1_raw.txt').stat().st_mtime)
+
+    @pytest.mark.stage_3_8_dataset_manifest_checks
+    @pytest.mark.lab_6_pipeline
+    def test_dataset_is_listed_once(self):
+        """
+        Ensure validation and scanning share a single listing of the directory
+        """
+        with mock.patch.object(os, 'scandir', wraps=os.scandir) as scandir, \
+                mock.patch.object(Path, 'iterdir') as iterdir, \
+                mock.patch.object(Path, 'glob') as glob:
+            articles = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_articles()
+        self.assertEqual(scandir.call_count, 1)
+        iterdir.assert_not_called()
+        glob.assert_not_called()
+        self.assertEqual(sorted(articles), [1, 2])
+        self.assertEqual(articles[1].text, articles[2].text)
+
+    @pytest.mark.stage_3_8_dataset_manifest_checks
+    @pytest.mark.lab_6_pipeline
+    def test_unchanged_dataset_is_not_listed(self):
+        """
+        Ensure the saved manifest is trusted while the directory is unchanged
+        """
+        expected = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_manifest()
+        self.assertTrue((TEST_PATH / '.manifest.json').is_file())
+        with mock.patch.object(os, 'scandir', wraps=os.scandir) as scandir:
+            manifest = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_manifest()
+        scandir.assert_not_called()
+        self.assertEqual(sorted(manifest), sorted(expected))
+        for article_id, files in manifest.items():
+            for kind, file in files.files.items():
+                expected_file = expected[article_id].files[kind]
+                self.assertEqual((file.path, file.size, file.mtime, file.content_hash),
+                                 (expected_file.path, expected_file.size,
+                                  expected_file.mtime, expected_file.content_hash))
+
+    @pytest.mark.stage_3_8_dataset_manifest_checks
+    @pytest.mark.lab_6_pipeline
+    def test_only_changed_files_are_hashed(self):
+        """
+        Ensure a changed directory is listed again, hashing only new raw texts
+        """
+        first = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_manifest()
+        self.assertEqual(first[1].files['raw'].content_hash, first[2].files['raw'].content_hash)
+        self.assertIsNone(first[1].files['meta'].content_hash)
+
+        (TEST_PATH / '3_raw.txt').write_text('Новая статья.', encoding='utf-8')
+        with mock.patch.object(pipeline, '_hash_file', wraps=pipeline._hash_file) as hash_file:
+            manifest = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_manifest()
+        hash_file.assert_called_once_with(TEST_PATH / '3_raw.txt')
+        self.assertEqual(sorted(manifest), [1, 2, 3])
+
+    @pytest.mark.stage_3_8_dataset_manifest_checks
+    @pytest.mark.lab_6_pipeline
+    def test_raw_text_changed_in_place_is_noticed(self):
+        """
+        Ensure a raw text rewritten in place is checked and hashed again
+        """
+        first = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_manifest()
+        directory_stat = os.stat(TEST_PATH)
+        with (TEST_PATH / '2_raw.txt').open('w', encoding='utf-8') as raw_file:
+            raw_file.write('Другой текст статьи.')
+        os.utime(TEST_PATH, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns))
+        manifest = CorpusManager(path_to_raw_txt_data=TEST_PATH).get_manifest()
+        self.assertNotEqual(manifest[2].files['raw'].content_hash,
+                            first[2].files['raw'].content_hash)
+
+        (TEST_PATH / '2_raw.txt').open('w', encoding='utf-8').close()
+        os.utime(TEST_PATH, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns))
+        with self.assertRaises(InconsistentDatasetError):
+            CorpusManager(path_to_raw_txt_data=TEST_PATH)
+
+    @pytest.mark.stage_3_8_dataset_manifest_checks
+    @pytest.mark.lab_6_pipeline
+    def test_manifest_alone_is_empty_dataset(self):
+        """
+        Ensure the manifest does not make an emptied directory look like a dataset
+        """
+        CorpusManager(path_to_raw_txt_data=TEST_PATH)
+        (TEST_PATH / '4_raw.txt').rmdir()
+        for path in TEST_PATH.iterdir():
+            if path.name != '.manifest.json':
+                path.unlink()
+        with self.assertRaises(EmptyDirectoryError):
+            CorpusManager(path_to_raw_txt_data=TEST_PATH)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(TEST_PATH)
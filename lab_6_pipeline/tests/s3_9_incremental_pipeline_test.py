@@ -0,0 +1,158 @@
+# pylint: disable=protected-access
+"""
+Tests for incremental runs of MorphologicalAnalysisPipeline
+"""
+import json
+import os
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.constants import ASSETS_PATH
+from lab_6_pipeline.pipeline import (CorpusManager,
+                                     MorphologicalAnalysisPipeline)
+from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+
+
+class IncrementalPipelineTest(unittest.TestCase):
+    """
+    Tests for skipping articles whose outputs are up to date
+    """
+
+    def setUp(self) -> None:
+        pipeline_test_files_setup(meta=True)
+        shutil.copyfile(TEST_PATH / '1_raw.txt', TEST_PATH / '2_raw.txt')
+        shutil.copyfile(TEST_PATH / '1_meta.json', TEST_PATH / '2_meta.json')
+        article.ASSETS_PATH = TEST_PATH
+
+    def _run(self) -> list[str]:
+        pipe = MorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH),
+                                             incremental=True)
+        with mock.patch.object(pipe, '_process', wraps=pipe._process) as process:
+            pipe.run()
+        return [call.args[0] for call in process.call_args_list]
+
+    @pytest.mark.stage_3_9_incremental_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_unchanged_articles_are_skipped(self):
+        """
+        Ensure a second run processes nothing and keeps the outputs
+        """
+        self.assertEqual(len(self._run()), 2)
+        cleaned = (TEST_PATH / '1_cleaned.txt').read_text(encoding='utf-8')
+        with (TEST_PATH / '.pipeline_state.json').open(encoding='utf-8') as file:
+            state = json.load(file)['MorphologicalAnalysisPipeline']
+        self.assertEqual(state['version'], MorphologicalAnalysisPipeline.VERSION)
+        self.assertEqual(sorted(state['articles']), ['1', '2'])
+
+        self.assertEqual(self._run(), [])
+        self.assertEqual((TEST_PATH / '1_cleaned.txt').read_text(encoding='utf-8'), cleaned)
+
+    @pytest.mark.stage_3_9_incremental_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_changed_raw_text_is_processed(self):
+        """
+        Ensure only the article whose raw text changed is processed again
+        """
+        self._run()
+        tmp_path = TEST_PATH / '2_raw.tmp'
+        tmp_path.write_text('Новый текст статьи.', encoding='utf-8')
+        os.replace(tmp_path, TEST_PATH / '2_raw.txt')
+        self.assertEqual(self._run(), ['Новый текст статьи.'])
+        self.assertEqual((TEST_PATH / '2_cleaned.txt').read_text(encoding='utf-8'),
+                         'новый текст статьи')
+
+    @pytest.mark.stage_3_9_incremental_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_raw_text_changed_after_scan_is_processed(self):
+        """
+        Ensure a raw text rewritten in place after the dataset was scanned
+        is not skipped by the hash recorded for it
+        """
+        self._run()
+        pipe = MorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH,
+                                                           lazy=True),
+                                             incremental=True)
+        with (TEST_PATH / '1_raw.txt').open('w', encoding='utf-8') as raw_file:
+            raw_file.write('Изменённый текст статьи.')
+        with mock.patch.object(pipe, '_process', wraps=pipe._process) as process:
+            pipe.run()
+        self.assertEqual([call.args[0] for call in process.call_args_list],
+                         ['Изменённый текст статьи.'])
+        self.assertEqual((TEST_PATH / '1_cleaned.txt').read_text(encoding='utf-8'),
+                         'изменённый текст статьи')
+        # the hash of the new text is recorded by a run that scans the dataset again
+        self._run()
+        self.assertEqual(self._run(), [])
+
+    @pytest.mark.stage_3_9_incremental_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_new_version_rebuilds_everything(self):
+        """
+        Ensure outputs of another version of the pipeline are rebuilt
+        """
+        self._run()
+        with mock.patch.object(MorphologicalAnalysisPipeline, 'VERSION',
+                               MorphologicalAnalysisPipeline.VERSION + 1):
+            self.assertEqual(len(self._run()), 2)
+            self.assertEqual(self._run(), [])
+
+    @pytest.mark.stage_3_9_incremental_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_edited_tag_mapping_rebuilds_everything(self):
+        """
+        Ensure outputs are rebuilt when a tag mapping the pipeline uses is edited
+        """
+        mapping_path = TEST_PATH / 'tags_mapping.json'
+        mapping_path.write_text('{"NOUN": "NOUN"}', encoding='utf-8')
+        with mock.patch('lab_6_pipeline.pipeline.TAGS_MAPPINGS_PATH', TEST_PATH), \
+                mock.patch.object(MorphologicalAnalysisPipeline, 'TAG_MAPPINGS',
+                                  (mapping_path.name,)):
+            self.assertEqual(len(self._run()), 2)
+            self.assertEqual(self._run(), [])
+            mapping_path.write_text('{"NOUN": "S"}', encoding='utf-8')
+            self.assertEqual(len(self._run()), 2)
+            self.assertEqual(self._run(), [])
+
+    @pytest.mark.stage_3_9_incremental_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_changed_conllu_options_rebuild_everything(self):
+        """
+        Ensure outputs are rebuilt when options of the saved artifacts change
+        """
+        self._run()
+        with mock.patch.object(MorphologicalAnalysisPipeline, '_get_conllu_options',
+                               return_value={'include_morphological_tags': True}):
+            self.assertEqual(len(self._run()), 2)
+            self.assertEqual(self._run(), [])
+
+    @pytest.mark.stage_3_9_incremental_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_missing_output_is_rebuilt(self):
+        """
+        Ensure an article is processed again when its output is removed
+        """
+        self._run()
+        (TEST_PATH / '1_cleaned.txt').unlink()
+        self.assertEqual(len(self._run()), 1)
+        self.assertTrue((TEST_PATH / '1_cleaned.txt').is_file())
+
+    @pytest.mark.stage_3_9_incremental_pipeline_checks
+    @pytest.mark.lab_6_pipeline
+    def test_full_run_processes_everything(self):
+        """
+        Ensure a pipeline that is not incremental processes every article
+        """
+        self._run()
+        pipe = MorphologicalAnalysisPipeline(CorpusManager(path_to_raw_txt_data=TEST_PATH))
+        with mock.patch.object(pipe, '_process', wraps=pipe._process) as process:
+            pipe.run()
+        self.assertEqual(process.call_count, 2)
+
+    def tearDown(self) -> None:
+        article.ASSETS_PATH = ASSETS_PATH
+        shutil.rmtree(TEST_PATH)